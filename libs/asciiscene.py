@@ -0,0 +1,455 @@
+import os
+import re
+import stat
+import uuid
+
+from . import sceneheader
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+ENCODING = 'utf-8'
+ERRORS = 'surrogateescape'
+STRING_PATTERN = r'"((?:[^"\\]|\\.)*)"'
+FILE_INFO_PATTERN = re.compile(rf'^\s*fileInfo\s+{STRING_PATTERN}\s+{STRING_PATTERN}\s*;', re.DOTALL)
+LAST_STRING_PATTERN = re.compile(rf'{STRING_PATTERN}(\s*;\s*)$', re.DOTALL)
+
+
+def isInsideString(line, insideString=False):
+    """
+    Evaluates if the end of the supplied line is still inside a MEL string.
+    Escaped quotes are ignored.
+
+    :type line: str
+    :type insideString: bool
+    :rtype: bool
+    """
+
+    start = line.find('"')
+
+    while start != -1:
+
+        # Count preceding backslashes
+        #
+        backslashes = 0
+
+        while (start - backslashes) > 0 and line[start - backslashes - 1] == '\\':
+
+            backslashes += 1
+
+        if (backslashes % 2) == 0:
+
+            insideString = not insideString
+
+        start = line.find('"', start + 1)
+
+    return insideString
+
+
+def iterStatements(file):
+    """
+    Returns a generator that yields every statement from the supplied Maya ASCII file object.
+    Statements are yielded verbatim, including any line breaks, so they can be written back out unchanged.
+    Comment lines are yielded as their own statements.
+
+    :type file: TextIO
+    :rtype: Iterator[str]
+    """
+
+    lines = []
+    insideString = False
+
+    for line in file:
+
+        # Check if this is a comment
+        #
+        if len(lines) == 0 and line.lstrip().startswith('//'):
+
+            yield line
+            continue
+
+        # Check if statement is complete
+        #
+        lines.append(line)
+
+        if '"' in line:
+
+            insideString = isInsideString(line, insideString=insideString)
+
+        if not insideString and line.rstrip().endswith(';'):
+
+            yield ''.join(lines)
+            lines.clear()
+
+    if len(lines) > 0:
+
+        yield ''.join(lines)
+
+
+def getCommand(statement):
+    """
+    Returns the MEL command from the supplied statement.
+
+    :type statement: str
+    :rtype: str
+    """
+
+    stripped = statement.lstrip()
+
+    if stripped.startswith('//'):
+
+        return ''
+
+    end = 0
+
+    while end < len(stripped) and not stripped[end].isspace() and stripped[end] != ';':
+
+        end += 1
+
+    return stripped[:end]
+
+
+def quote(string):
+    """
+    Returns the supplied string as a quoted MEL string.
+
+    :type string: str
+    :rtype: str
+    """
+
+    escaped = string.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\t', '\\t')
+    return f'"{escaped}"'
+
+
+def unquote(string):
+    """
+    Returns the value of the supplied quoted MEL string.
+
+    :type string: str
+    :rtype: str
+    """
+
+    string = string.strip()
+
+    if len(string) >= 2 and string[0] == '"' and string[-1] == '"':
+
+        string = string[1:-1]
+
+    characters = []
+    escaped = False
+
+    for character in string:
+
+        if escaped:
+
+            characters.append({'n': '\n', 't': '\t'}.get(character, character))
+            escaped = False
+
+        elif character == '\\':
+
+            escaped = True
+
+        else:
+
+            characters.append(character)
+
+    return ''.join(characters)
+
+
+class AsciiScene(object):
+    """
+    Class used to edit Maya ASCII files without opening them inside Maya.
+    The header, everything before the first `createNode` statement, is loaded into memory so it can be queried and edited.
+    Any body edits are registered as statement transforms that are applied while the file is streamed back out on save.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_filePath', '_header', '_headerCount', '_transforms')
+
+    def __init__(self, filePath):
+        """
+        Private method called after a new instance is created.
+
+        :type filePath: str
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(AsciiScene, self).__init__()
+
+        # Declare private variables
+        #
+        self._filePath = os.path.abspath(filePath)
+        self._header = []
+        self._headerCount = 0
+        self._transforms = []
+
+        # Load header statements
+        #
+        self.load()
+    # endregion
+
+    # region Properties
+    @property
+    def filePath(self):
+        """
+        Getter method that returns the source file path.
+
+        :rtype: str
+        """
+
+        return self._filePath
+
+    @property
+    def header(self):
+        """
+        Getter method that returns the header statements.
+
+        :rtype: List[str]
+        """
+
+        return self._header
+    # endregion
+
+    # region Methods
+    def open(self):
+        """
+        Returns a file object for the source file.
+
+        :rtype: TextIO
+        """
+
+        return open(self.filePath, 'r', encoding=ENCODING, errors=ERRORS, newline='')
+
+    def load(self):
+        """
+        Loads the header statements from the source file.
+
+        :rtype: None
+        """
+
+        self._header.clear()
+
+        with self.open() as file:
+
+            for statement in iterStatements(file):
+
+                if getCommand(statement) == 'createNode':
+
+                    break
+
+                self._header.append(statement)
+
+        self._headerCount = len(self._header)
+
+    def iterHeader(self, *commands):
+        """
+        Returns a generator that yields the index and arguments of any header statements that use the supplied commands.
+
+        :type commands: Union[str, List[str]]
+        :rtype: Iterator[Tuple[int, List[str]]]
+        """
+
+        for (i, statement) in enumerate(self._header):
+
+            if getCommand(statement) in commands:
+
+                yield i, sceneheader.splitStatement(' '.join(line.strip() for line in statement.splitlines()).rstrip(';'))
+
+    def iterReferences(self):
+        """
+        Returns a generator that yields the top-level references from the header.
+        Each reference is represented by a dictionary containing its statement index, path, namespace, reference node and deferred state.
+
+        :rtype: Iterator[dict]
+        """
+
+        for (i, args) in self.iterHeader('file'):
+
+            if '-r' not in args:
+
+                continue
+
+            yield {
+                'index': i,
+                'path': args[-1],
+                'namespace': sceneheader.getFlag(args, '-ns', ''),
+                'referenceNode': sceneheader.getFlag(args, '-rfn', ''),
+                'deferred': sceneheader.getFlag(args, '-dr', '0') == '1'
+            }
+
+    def iterReferenceStatements(self):
+        """
+        Returns a generator that yields the index and arguments of every `file` statement that describes a reference.
+        This includes both the `-rdi` statements used to restore nested references and the top-level `-r` statements.
+
+        :rtype: Iterator[Tuple[int, List[str]]]
+        """
+
+        for (i, args) in self.iterHeader('file'):
+
+            if '-r' in args or '-rdi' in args:
+
+                yield i, args
+
+    def namespaces(self):
+        """
+        Returns the namespaces used by the top-level references.
+
+        :rtype: List[str]
+        """
+
+        return [reference['namespace'] for reference in self.iterReferences()]
+
+    def setReferencePath(self, index, path):
+        """
+        Updates the path of the reference statement at the supplied index.
+
+        :type index: int
+        :type path: str
+        :rtype: None
+        """
+
+        statement = self._header[index]
+        match = LAST_STRING_PATTERN.search(statement)
+
+        if match is None:
+
+            raise ValueError(f'setReferencePath() unable to locate path in statement: {statement}')
+
+        self._header[index] = f'{statement[:match.start()]}{quote(path)}{match.group(2)}'
+
+    def getFileInfo(self, key, default=None):
+        """
+        Returns the value of the supplied fileInfo key.
+
+        :type key: str
+        :type default: Any
+        :rtype: Union[str, Any]
+        """
+
+        for statement in self._header:
+
+            match = FILE_INFO_PATTERN.match(statement)
+
+            if match is not None and unquote(match.group(1)) == key:
+
+                return unquote(match.group(2))
+
+        return default
+
+    def setFileInfo(self, key, value):
+        """
+        Updates the value of the supplied fileInfo key.
+        If the key does not exist then it is inserted after the last fileInfo statement.
+
+        :type key: str
+        :type value: str
+        :rtype: None
+        """
+
+        statement = f'fileInfo {quote(key)} {quote(value)};\n'
+        lastIndex = None
+
+        for (i, existing) in enumerate(self._header):
+
+            match = FILE_INFO_PATTERN.match(existing)
+
+            if match is None:
+
+                continue
+
+            lastIndex = i
+
+            if unquote(match.group(1)) == key:
+
+                self._header[i] = statement
+                return
+
+        index = (lastIndex + 1) if lastIndex is not None else len(self._header)
+        self._header.insert(index, statement)
+
+    def addTransform(self, transform):
+        """
+        Registers a transform that is applied to every body statement on save.
+        Each transform receives a statement and returns the statement to write in its place.
+
+        :type transform: Callable[[str], str]
+        :rtype: None
+        """
+
+        self._transforms.append(transform)
+
+    def addSubstitution(self, pattern, replacement, hint=None):
+        """
+        Registers a regular expression substitution that is applied to every statement on save.
+        The substitution is applied to the header immediately.
+        If a hint is supplied then statements that do not contain it are skipped without evaluating the expression.
+
+        :type pattern: Union[str, re.Pattern]
+        :type replacement: Union[str, Callable]
+        :type hint: Union[str, None]
+        :rtype: None
+        """
+
+        expression = re.compile(pattern)
+
+        def transform(statement):
+
+            if hint is not None and hint not in statement:
+
+                return statement
+
+            return expression.sub(replacement, statement)
+
+        self._header = [transform(statement) for statement in self._header]
+        self.addTransform(transform)
+
+    def save(self, filePath=None):
+        """
+        Streams the edited scene to the supplied path.
+        If no path is supplied then the source file is overwritten.
+
+        :type filePath: Union[str, None]
+        :rtype: None
+        """
+
+        # Write to temporary path before moving into place
+        #
+        filePath = os.path.abspath(filePath) if filePath else self.filePath
+        temporaryPath = f'{filePath}.{uuid.uuid4().hex}'
+
+        os.makedirs(os.path.dirname(filePath), exist_ok=True)
+
+        with self.open() as inputFile, open(temporaryPath, 'w', encoding=ENCODING, errors=ERRORS, newline='') as outputFile:
+
+            # Write header
+            #
+            outputFile.writelines(self._header)
+
+            # Stream body through transforms
+            #
+            for (i, statement) in enumerate(iterStatements(inputFile)):
+
+                if i < self._headerCount:
+
+                    continue
+
+                for transform in self._transforms:
+
+                    statement = transform(statement)
+
+                outputFile.write(statement)
+
+        # Check if destination is read-only
+        #
+        if os.path.exists(filePath) and not os.access(filePath, os.W_OK):
+
+            os.chmod(filePath, stat.S_IWRITE)
+
+        os.replace(temporaryPath, filePath)
+    # endregion
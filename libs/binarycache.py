@@ -0,0 +1,253 @@
+import os
+import json
+import uuid
+import threading
+
+from dcc import __application__, DCC
+from . import sceneutils, uploadqueue
+
+if __application__ == DCC.MAYA:
+
+    from maya import cmds as mc
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+CHECKSUMS_FILENAME = 'checksums.json'
+
+
+class BinaryCache(object):
+    """
+    Class used to store binary conversions of Maya ASCII scene files.
+    Each conversion is keyed by the checksum of its source so edited sources are never opened from a stale shadow.
+    Checksums are memoized by size and modification time to avoid re-reading unchanged sources.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_directory', '_checksums', '_lock')
+
+    def __init__(self, directory):
+        """
+        Private method called after a new instance is created.
+
+        :type directory: str
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(BinaryCache, self).__init__()
+
+        # Declare private variables
+        #
+        self._directory = os.path.abspath(os.path.expandvars(directory))
+        self._checksums = {}
+        self._lock = threading.Lock()
+
+        # Load memoized checksums
+        #
+        self.load()
+    # endregion
+
+    # region Properties
+    @property
+    def directory(self):
+        """
+        Getter method that returns the cache directory.
+
+        :rtype: str
+        """
+
+        return self._directory
+
+    @property
+    def checksumsPath(self):
+        """
+        Getter method that returns the path of the memoized checksums.
+
+        :rtype: str
+        """
+
+        return os.path.join(self.directory, CHECKSUMS_FILENAME)
+    # endregion
+
+    # region Methods
+    @staticmethod
+    def isTranscodable(filePath):
+        """
+        Evaluates if the supplied file can be stored as a binary conversion.
+
+        :type filePath: str
+        :rtype: bool
+        """
+
+        return __application__ == DCC.MAYA and os.path.splitext(filePath)[-1].lower() == '.ma'
+
+    def load(self):
+        """
+        Loads the memoized checksums from the cache directory.
+
+        :rtype: None
+        """
+
+        if not os.path.isfile(self.checksumsPath):
+
+            return
+
+        try:
+
+            with open(self.checksumsPath, 'r') as file:
+
+                self._checksums = json.load(file)
+
+        except (OSError, ValueError) as exception:
+
+            log.warning(f'Unable to load binary cache checksums: {self.checksumsPath} ({exception})')
+
+    def save(self):
+        """
+        Persists the memoized checksums to the cache directory.
+
+        :rtype: None
+        """
+
+        with self._lock:
+
+            checksums = dict(self._checksums)
+
+        os.makedirs(self.directory, exist_ok=True)
+        temporaryPath = f'{self.checksumsPath}.{uuid.uuid4().hex}'
+
+        try:
+
+            with open(temporaryPath, 'w') as file:
+
+                json.dump(checksums, file, indent=4)
+
+            os.replace(temporaryPath, self.checksumsPath)
+
+        except OSError as exception:
+
+            log.warning(f'Unable to save binary cache checksums: {self.checksumsPath} ({exception})')
+
+    def getChecksum(self, filePath):
+        """
+        Returns the checksum for the supplied source file.
+        The source is only read if its size or modification time have changed since it was last hashed.
+
+        :type filePath: str
+        :rtype: str
+        """
+
+        key = os.path.normcase(os.path.abspath(filePath))
+        stat = os.stat(filePath)
+
+        with self._lock:
+
+            entry = self._checksums.get(key, None)
+
+        if entry is not None and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+
+            return entry['checksum']
+
+        checksum = uploadqueue.getChecksum(filePath)
+
+        with self._lock:
+
+            self._checksums[key] = {'size': stat.st_size, 'mtime': stat.st_mtime, 'checksum': checksum}
+
+        return checksum
+
+    def getShadowPath(self, filePath):
+        """
+        Returns the binary conversion path for the supplied source file.
+
+        :type filePath: str
+        :rtype: str
+        """
+
+        checksum = self.getChecksum(filePath)
+        return os.path.join(self.directory, checksum[:2], f'{checksum}.mb')
+
+    def lookup(self, filePath):
+        """
+        Returns the binary conversion of the supplied source file.
+        If no conversion exists then none is returned!
+
+        :type filePath: str
+        :rtype: Union[str, None]
+        """
+
+        if not self.isTranscodable(filePath):
+
+            return None
+
+        try:
+
+            shadowPath = self.getShadowPath(filePath)
+
+        except OSError as exception:
+
+            log.warning(f'Unable to hash source file: {filePath} ({exception})')
+            return None
+
+        if os.path.isfile(shadowPath):
+
+            return shadowPath
+
+        else:
+
+            return None
+
+    def store(self, filePath):
+        """
+        Stores a binary conversion of the open scene for the supplied source file.
+        This should only be called right after the source was opened, with all of its references, and before any edits!
+        The open scene is renamed back to its source path afterwards.
+
+        :type filePath: str
+        :rtype: bool
+        """
+
+        # Check if source can be converted
+        #
+        if not self.isTranscodable(filePath):
+
+            return False
+
+        try:
+
+            shadowPath = self.getShadowPath(filePath)
+
+        except OSError as exception:
+
+            log.warning(f'Unable to hash source file: {filePath} ({exception})')
+            return False
+
+        # Save conversion to temporary path before moving into place
+        #
+        log.info(f'Storing binary conversion: {filePath} > {shadowPath}')
+
+        temporaryPath = os.path.join(os.path.dirname(shadowPath), f'{uuid.uuid4().hex}.mb')
+        os.makedirs(os.path.dirname(shadowPath), exist_ok=True)
+
+        try:
+
+            mc.file(rename=temporaryPath)
+            mc.file(save=True, type='mayaBinary', force=True)
+
+            os.replace(temporaryPath, shadowPath)
+            return True
+
+        except (RuntimeError, OSError) as exception:
+
+            log.warning(f'Unable to store binary conversion: {filePath} ({exception})')
+            return False
+
+        finally:
+
+            sceneutils.renameScene(filePath)
+    # endregion
@@ -0,0 +1,196 @@
+import os
+import json
+import time
+import uuid
+import threading
+
+from contextlib import contextmanager
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class ChromeTrace(object):
+    """
+    Class used to record spans in the Chrome trace-event format.
+    The resulting files can be loaded into any trace viewer, such as `chrome://tracing` or Perfetto.
+    Timestamps are taken from the system clock so traces recorded by separate processes line up once merged.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_pid', '_events', '_threads', '_lock')
+
+    def __init__(self, processName=None):
+        """
+        Private method called after a new instance is created.
+
+        :type processName: Union[str, None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(ChromeTrace, self).__init__()
+
+        # Declare private variables
+        #
+        self._pid = os.getpid()
+        self._events = []
+        self._threads = set()
+        self._lock = threading.Lock()
+
+        # Check if process should be named
+        #
+        if processName is not None:
+
+            self.setProcessName(processName)
+    # endregion
+
+    # region Properties
+    @property
+    def events(self):
+        """
+        Getter method that returns the recorded events.
+
+        :rtype: List[dict]
+        """
+
+        return self._events
+    # endregion
+
+    # region Methods
+    @staticmethod
+    def now():
+        """
+        Returns the current time in microseconds.
+
+        :rtype: int
+        """
+
+        return time.time_ns() // 1000
+
+    def addEvent(self, **event):
+        """
+        Records the supplied event.
+        The current process and thread are used unless the event already specifies them.
+
+        :rtype: None
+        """
+
+        event.setdefault('pid', self._pid)
+        event.setdefault('tid', threading.get_ident())
+
+        with self._lock:
+
+            # Check if thread requires naming
+            #
+            if event['pid'] == self._pid and event['tid'] not in self._threads:
+
+                self._threads.add(event['tid'])
+                self._events.append({'ph': 'M', 'name': 'thread_name', 'pid': self._pid, 'tid': event['tid'], 'args': {'name': threading.current_thread().name}})
+
+            self._events.append(event)
+
+    def setProcessName(self, name):
+        """
+        Updates the name displayed for this process's track.
+
+        :type name: str
+        :rtype: None
+        """
+
+        with self._lock:
+
+            self._events.append({'ph': 'M', 'name': 'process_name', 'pid': self._pid, 'tid': 0, 'args': {'name': name}})
+
+    @contextmanager
+    def span(self, name, category='', **kwargs):
+        """
+        Returns a context manager that records the time spent inside it as a complete event.
+        Any keyword arguments are stored as the event's arguments.
+
+        :type name: str
+        :type category: str
+        :rtype: contextmanager
+        """
+
+        startTime = self.now()
+
+        try:
+
+            yield
+
+        finally:
+
+            self.addEvent(ph='X', name=name, cat=category, ts=startTime, dur=(self.now() - startTime), args=kwargs)
+
+    def instant(self, name, category='', **kwargs):
+        """
+        Records an instant event on the current thread.
+
+        :type name: str
+        :type category: str
+        :rtype: None
+        """
+
+        self.addEvent(ph='i', s='t', name=name, cat=category, ts=self.now(), args=kwargs)
+
+    def extend(self, events):
+        """
+        Merges the supplied events, such as those recorded by another process, into this trace.
+
+        :type events: List[dict]
+        :rtype: None
+        """
+
+        with self._lock:
+
+            self._events.extend(events)
+
+    def save(self, filePath):
+        """
+        Writes the recorded events to the supplied path.
+        The file is written to a temporary path first so viewers never load a partial trace.
+
+        :type filePath: str
+        :rtype: None
+        """
+
+        filePath = os.path.abspath(filePath)
+        temporaryPath = f'{filePath}.{uuid.uuid4().hex}'
+
+        os.makedirs(os.path.dirname(filePath), exist_ok=True)
+
+        with self._lock:
+
+            events = list(self._events)
+
+        with open(temporaryPath, 'w') as file:
+
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+
+        os.replace(temporaryPath, filePath)
+
+    @staticmethod
+    def load(filePath):
+        """
+        Returns the events from the supplied trace file.
+        If the file cannot be read then an empty list is returned!
+
+        :type filePath: str
+        :rtype: List[dict]
+        """
+
+        try:
+
+            with open(filePath, 'r') as file:
+
+                return json.load(file).get('traceEvents', [])
+
+        except (OSError, ValueError) as exception:
+
+            log.warning(f'Unable to load trace: {filePath} ({exception})')
+            return []
+    # endregion
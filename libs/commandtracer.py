@@ -0,0 +1,298 @@
+import os
+import json
+import time
+import uuid
+import inspect
+import weakref
+import functools
+import importlib
+
+from collections import defaultdict
+from dcc import __application__, DCC
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+if __application__ == DCC.MAYA:
+
+    DEFAULT_MODULES = ('maya.cmds', 'dcc.maya.libs.dagutils', 'dcc.maya.libs.plugutils', 'dcc.maya.libs.animutils')
+
+else:
+
+    DEFAULT_MODULES = ()
+
+
+class CommandTracer(object):
+    """
+    Class used to record how often, and for how long, each DCC command is called by each task.
+    The functions inside the traced modules are temporarily replaced with timing wrappers for the duration of a batch.
+    Nested calls are included in their caller's time, so helper functions report their cumulative time.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_moduleNames', '_topCount', '_filePath', '_originals', '_fileStats', '_batchStats', '_taskManager')
+
+    def __init__(self, moduleNames=None, topCount=10, filePath=None):
+        """
+        Private method called after a new instance is created.
+        If no module names are supplied then the DCC's command module and common helper modules are traced.
+
+        :type moduleNames: Union[List[str], None]
+        :type topCount: int
+        :type filePath: Union[str, None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(CommandTracer, self).__init__()
+
+        # Declare private variables
+        #
+        self._moduleNames = tuple(moduleNames) if moduleNames is not None else DEFAULT_MODULES
+        self._topCount = topCount
+        self._filePath = os.path.abspath(os.path.expandvars(filePath)) if filePath else None
+        self._originals = []
+        self._fileStats = defaultdict(lambda: [0, 0.0])
+        self._batchStats = defaultdict(lambda: [0, 0.0])
+        self._taskManager = None
+    # endregion
+
+    # region Properties
+    @property
+    def moduleNames(self):
+        """
+        Getter method that returns the names of the traced modules.
+
+        :rtype: Tuple[str]
+        """
+
+        return self._moduleNames
+
+    @property
+    def batchStats(self):
+        """
+        Getter method that returns the call count and cumulative seconds for each task and command.
+
+        :rtype: Dict[Tuple[str, str], List[Union[int, float]]]
+        """
+
+        return self._batchStats
+
+    @property
+    def taskManager(self):
+        """
+        Getter method that returns the task manager calls are attributed to.
+
+        :rtype: Union[ezbatcher.libs.taskmanager.TaskManager, None]
+        """
+
+        return self._taskManager() if self._taskManager is not None else None
+    # endregion
+
+    # region Methods
+    def getTaskName(self):
+        """
+        Returns the name of the task calls are currently attributed to.
+        Calls made outside of a task, such as while opening a scene, are attributed to the task manager.
+
+        :rtype: str
+        """
+
+        taskManager = self.taskManager
+        task = taskManager.currentTask if taskManager is not None else None
+
+        return type(task).__name__ if task is not None else 'TaskManager'
+
+    def record(self, command, elapsed):
+        """
+        Records a call to the supplied command.
+
+        :type command: str
+        :type elapsed: float
+        :rtype: None
+        """
+
+        stats = self._fileStats[(self.getTaskName(), command)]
+        stats[0] += 1
+        stats[1] += elapsed
+
+    def wrap(self, command, function):
+        """
+        Returns a wrapper that records each call to the supplied function.
+
+        :type command: str
+        :type function: Callable
+        :rtype: Callable
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+
+            startTime = time.perf_counter()
+
+            try:
+
+                return function(*args, **kwargs)
+
+            finally:
+
+                self.record(command, time.perf_counter() - startTime)
+
+        return wrapper
+
+    def isTraceable(self, module, obj):
+        """
+        Evaluates if the supplied module attribute should be traced.
+        Any functions imported from other packages, such as the standard library, are ignored.
+
+        :type module: module
+        :type obj: Any
+        :rtype: bool
+        """
+
+        if not inspect.isroutine(obj):
+
+            return False
+
+        moduleName = getattr(obj, '__module__', None)
+        packageName = module.__name__.split('.')[0]
+
+        return not isinstance(moduleName, str) or moduleName.split('.')[0] == packageName
+
+    def start(self, taskManager=None):
+        """
+        Replaces the traced modules' functions with timing wrappers.
+
+        :type taskManager: Union[ezbatcher.libs.taskmanager.TaskManager, None]
+        :rtype: None
+        """
+
+        self._fileStats.clear()
+        self._batchStats.clear()
+        self._taskManager = weakref.ref(taskManager) if taskManager is not None else None
+
+        for moduleName in self.moduleNames:
+
+            # Check if module can be imported
+            #
+            try:
+
+                module = importlib.import_module(moduleName)
+
+            except ImportError as exception:
+
+                log.warning(f'Unable to trace module: {moduleName} ({exception})')
+                continue
+
+            # Wrap module functions
+            #
+            alias = moduleName.split('.')[-1]
+
+            for (name, obj) in list(vars(module).items()):
+
+                if name.startswith('_') or not self.isTraceable(module, obj):
+
+                    continue
+
+                self._originals.append((module, name, obj))
+                setattr(module, name, self.wrap(f'{alias}.{name}', obj))
+
+    def stop(self):
+        """
+        Restores the traced modules' functions and reports the most expensive commands for the batch.
+
+        :rtype: None
+        """
+
+        for (module, name, obj) in reversed(self._originals):
+
+            setattr(module, name, obj)
+
+        self._originals.clear()
+
+        self.mergeFileStats()
+        self.report('batch', self._batchStats)
+
+        if self._filePath is not None:
+
+            self.save()
+
+    def iterTopCommands(self, stats):
+        """
+        Returns a generator that yields the most expensive commands from the supplied stats.
+
+        :type stats: Dict[Tuple[str, str], List[Union[int, float]]]
+        :rtype: Iterator[Tuple[str, str, int, float]]
+        """
+
+        items = sorted(stats.items(), key=lambda item: item[1][1], reverse=True)
+
+        for ((taskName, command), (count, seconds)) in items[:self._topCount]:
+
+            yield taskName, command, count, seconds
+
+    def report(self, title, stats):
+        """
+        Logs the most expensive commands from the supplied stats.
+
+        :type title: str
+        :type stats: Dict[Tuple[str, str], List[Union[int, float]]]
+        :rtype: None
+        """
+
+        if len(stats) == 0:
+
+            return
+
+        lines = [f'{taskName}: {command} x{count} ({seconds:.3f}s)' for (taskName, command, count, seconds) in self.iterTopCommands(stats)]
+        log.info(f'Top DCC commands for {title}:\n\t' + '\n\t'.join(lines))
+
+    def mergeFileStats(self):
+        """
+        Merges the current file's stats into the batch stats.
+
+        :rtype: None
+        """
+
+        for (key, (count, seconds)) in self._fileStats.items():
+
+            batchStats = self._batchStats[key]
+            batchStats[0] += count
+            batchStats[1] += seconds
+
+        self._fileStats.clear()
+
+    def endFile(self, filePath):
+        """
+        Reports the most expensive commands for the file that just finished processing.
+
+        :type filePath: str
+        :rtype: None
+        """
+
+        self.report(os.path.basename(filePath), self._fileStats)
+        self.mergeFileStats()
+
+    def save(self):
+        """
+        Writes the batch stats to this tracer's file path as JSON.
+
+        :rtype: None
+        """
+
+        report = [{'task': taskName, 'command': command, 'count': count, 'seconds': seconds} for ((taskName, command), (count, seconds)) in self._batchStats.items()]
+        report.sort(key=lambda item: item['seconds'], reverse=True)
+
+        temporaryPath = f'{self._filePath}.{uuid.uuid4().hex}'
+        os.makedirs(os.path.dirname(self._filePath), exist_ok=True)
+
+        with open(temporaryPath, 'w') as file:
+
+            json.dump(report, file, indent=4)
+
+        os.replace(temporaryPath, self._filePath)
+    # endregion
@@ -0,0 +1,193 @@
+import os
+import sys
+import argparse
+
+from collections import deque
+from . import sceneheader, sceneindex
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class DependencyGraph(object):
+    """
+    Class used to query which scene files depend on a referenced file.
+    The graph is stored inside a scene index and can be populated by crawling headers or by recording the scenes a task manager opens.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_index',)
+
+    def __init__(self, index):
+        """
+        Private method called after a new instance is created.
+
+        :type index: sceneindex.SceneIndex
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(DependencyGraph, self).__init__()
+
+        # Declare private variables
+        #
+        self._index = index
+    # endregion
+
+    # region Properties
+    @property
+    def index(self):
+        """
+        Getter method that returns the scene index this graph is stored in.
+
+        :rtype: sceneindex.SceneIndex
+        """
+
+        return self._index
+    # endregion
+
+    # region Methods
+    def iterReferences(self, filePath):
+        """
+        Returns a generator that yields the files referenced by the supplied scene file.
+
+        :type filePath: str
+        :rtype: Iterator[str]
+        """
+
+        for row in self.index.connection.execute('SELECT DISTINCT path FROM sceneReferences WHERE scene = ?', (sceneindex.normalizePath(filePath),)):
+
+            yield row[0]
+
+    def iterReferencingScenes(self, filePath):
+        """
+        Returns a generator that yields the scene files that directly reference the supplied file.
+
+        :type filePath: str
+        :rtype: Iterator[str]
+        """
+
+        for row in self.index.connection.execute('SELECT DISTINCT scene FROM sceneReferences WHERE path = ?', (sceneindex.normalizePath(filePath),)):
+
+            yield row[0]
+
+    def recordScene(self, filePath, referencePaths=None):
+        """
+        Records the references for the supplied scene file.
+        If no references are supplied then they are read from the scene's header.
+        Scenes that are new to the index are flagged so the next crawl reads the rest of their metadata.
+
+        :type filePath: str
+        :type referencePaths: Union[List[str], None]
+        :rtype: None
+        """
+
+        # Check if references have changed
+        #
+        path = sceneindex.normalizePath(filePath)
+
+        if referencePaths is None:
+
+            referencePaths = list(sceneheader.iterReferencePaths(filePath))
+
+        directory = os.path.dirname(path)
+        referencePaths = sorted({sceneindex.normalizePath(referencePath, directory=directory) for referencePath in referencePaths})
+
+        if referencePaths == sorted(self.iterReferences(path)):
+
+            return
+
+        # Update scene references
+        #
+        connection = self.index.connection
+        connection.execute('INSERT OR IGNORE INTO scenes (path, size, mtime) VALUES (?, -1, -1)', (path,))
+        connection.execute('DELETE FROM sceneReferences WHERE scene = ?', (path,))
+        connection.executemany('INSERT INTO sceneReferences (scene, path) VALUES (?, ?)', [(path, referencePath) for referencePath in referencePaths])
+        connection.commit()
+
+    def affectedScenes(self, *filePaths):
+        """
+        Returns every scene file that directly, or indirectly through nested references, depends on the supplied files.
+
+        :type filePaths: Union[str, List[str]]
+        :rtype: Set[str]
+        """
+
+        visited = set()
+        pending = deque(map(sceneindex.normalizePath, filePaths))
+
+        while len(pending) > 0:
+
+            filePath = pending.popleft()
+
+            for scene in self.iterReferencingScenes(filePath):
+
+                if scene not in visited:
+
+                    visited.add(scene)
+                    pending.append(scene)
+
+        return visited
+
+    def minimalQueue(self, *filePaths, root=None):
+        """
+        Returns the smallest queue of existing scene files that must be re-batched after the supplied files changed.
+
+        :type filePaths: Union[str, List[str]]
+        :type root: Union[str, None]
+        :rtype: List[str]
+        """
+
+        scenes = self.affectedScenes(*filePaths)
+
+        if root is not None:
+
+            prefix = sceneindex.getRootPrefix(root)
+            scenes = [scene for scene in scenes if scene.startswith(prefix)]
+
+        return sorted(scene for scene in scenes if scene.lower().endswith(sceneheader.SCENE_EXTENSIONS) and os.path.isfile(scene))
+    # endregion
+
+
+def main(argv=None):
+    """
+    Prints the minimal queue of scene files affected by the supplied changed files.
+    Results are printed one path per line so they can be piped into a queue.
+
+    :type argv: Union[List[str], None]
+    :rtype: int
+    """
+
+    # Parse command line arguments
+    #
+    parser = argparse.ArgumentParser(description='Prints the scene files affected by changed dependencies.')
+    parser.add_argument('database', help='The SQLite index to use.')
+    parser.add_argument('filePaths', nargs='+', help='The dependency files that changed.')
+    parser.add_argument('--root', default=None, help='A directory the scene must reside under.')
+
+    args = parser.parse_args(argv)
+
+    # Compute minimal queue
+    #
+    index = sceneindex.SceneIndex(args.database)
+
+    try:
+
+        graph = DependencyGraph(index)
+        filePaths = graph.minimalQueue(*args.filePaths, root=args.root)
+
+        sys.stdout.write(''.join(f'{filePath}\n' for filePath in filePaths))
+
+    finally:
+
+        index.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
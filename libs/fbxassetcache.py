@@ -0,0 +1,235 @@
+import os
+import stat
+import json
+import shutil
+
+from dcc.json import jsonutils
+from . import fbxmanifest, sceneheader
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+LOCATION_KEYS = ('name', 'directory')
+
+
+def getExportSetSettings(exportSet):
+    """
+    Returns the export settings for the supplied export set.
+    Any keys that only describe the output location are removed so identical exports from different files share the same settings.
+
+    :type exportSet: dcc.fbx.libs.fbxexportset.FbxExportSet
+    :rtype: Any
+    """
+
+    settings = json.loads(jsonutils.dumps(exportSet))
+
+    if isinstance(settings, dict):
+
+        for key in LOCATION_KEYS:
+
+            settings.pop(key, None)
+
+    return settings
+
+
+def getReferenceRevisions(filePath):
+    """
+    Returns the revisions of every file referenced by the supplied scene file.
+
+    :type filePath: str
+    :rtype: List[List[Union[str, int, float]]]
+    """
+
+    return sorted(revision for revision in map(fbxmanifest.getFileRevision, sceneheader.iterReferencePaths(filePath)) if revision is not None)
+
+
+def replaceFile(source, destination, hardLink=False):
+    """
+    Replaces the destination file with the supplied source file.
+    If hard links are requested, but not supported, then the file is copied instead.
+
+    :type source: str
+    :type destination: str
+    :type hardLink: bool
+    :rtype: None
+    """
+
+    # Check if destination is read-only
+    #
+    if os.path.exists(destination):
+
+        if not os.access(destination, os.W_OK):
+
+            os.chmod(destination, stat.S_IWRITE)
+
+        os.remove(destination)
+
+    else:
+
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+
+    # Link or copy file into place
+    #
+    if hardLink:
+
+        try:
+
+            os.link(source, destination)
+            return
+
+        except OSError as exception:
+
+            log.debug(f'Unable to hard link file: {source} > {destination} ({exception})')
+
+    shutil.copy2(source, destination)
+
+
+def breakLink(filePath):
+    """
+    Replaces the supplied hard link with an independent copy.
+    This prevents any in-place writes from modifying the other links.
+
+    :type filePath: str
+    :rtype: None
+    """
+
+    if not os.access(filePath, os.W_OK):
+
+        os.chmod(filePath, stat.S_IWRITE)
+
+    temporaryPath = f'{filePath}.unlinking'
+
+    shutil.copy2(filePath, temporaryPath)
+    os.replace(temporaryPath, filePath)
+
+
+class FbxAssetCache(object):
+    """
+    Class used to reuse asset exports across files that reference the same assets with the same export settings.
+    Exports are tracked for the current batch and can optionally be persisted to a cache directory.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_directory', '_exports')
+
+    def __init__(self, directory=''):
+        """
+        Private method called after a new instance is created.
+
+        :type directory: str
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(FbxAssetCache, self).__init__()
+
+        # Declare private variables
+        #
+        self._directory = os.path.abspath(os.path.expandvars(directory)) if directory else ''
+        self._exports = {}
+    # endregion
+
+    # region Properties
+    @property
+    def directory(self):
+        """
+        Getter method that returns the persistent cache directory.
+        An empty string indicates exports are only reused for the current batch.
+
+        :rtype: str
+        """
+
+        return self._directory
+    # endregion
+
+    # region Methods
+    def getCachePath(self, key):
+        """
+        Returns the persistent cache path for the supplied key.
+
+        :type key: str
+        :rtype: str
+        """
+
+        return os.path.join(self.directory, key[:2], f'{key}.fbx')
+
+    def get(self, key):
+        """
+        Returns an existing export for the supplied key.
+        If no export exists then none is returned!
+
+        :type key: str
+        :rtype: Union[str, None]
+        """
+
+        # Check batch exports
+        # Exports that have since been overwritten are ignored!
+        #
+        exportPath, revision = self._exports.get(key, (None, None))
+
+        if exportPath is not None and fbxmanifest.getFileRevision(exportPath) == revision:
+
+            return exportPath
+
+        # Check persistent exports
+        #
+        if self.directory:
+
+            cachePath = self.getCachePath(key)
+
+            if os.path.isfile(cachePath):
+
+                return cachePath
+
+        return None
+
+    def put(self, key, exportPath):
+        """
+        Registers the supplied export for reuse.
+        If a cache directory exists then a copy of the export is persisted as well.
+
+        :type key: str
+        :type exportPath: str
+        :rtype: None
+        """
+
+        # Check if export exists
+        #
+        if not os.path.isfile(exportPath):
+
+            return
+
+        # Check if export should be persisted
+        #
+        if self.directory:
+
+            cachePath = self.getCachePath(key)
+            temporaryPath = f'{cachePath}.caching'
+
+            try:
+
+                os.makedirs(os.path.dirname(cachePath), exist_ok=True)
+                shutil.copy2(exportPath, temporaryPath)
+                os.replace(temporaryPath, cachePath)
+
+                exportPath = cachePath
+
+            except OSError as exception:
+
+                log.warning(f'Unable to cache asset export: {exportPath} ({exception})')
+
+        self._exports[key] = (exportPath, fbxmanifest.getFileRevision(exportPath))
+
+    def clear(self):
+        """
+        Clears the exports tracked for the current batch.
+
+        :rtype: None
+        """
+
+        self._exports.clear()
+    # endregion
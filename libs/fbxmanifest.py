@@ -0,0 +1,331 @@
+import os
+import json
+import time
+import uuid
+import hashlib
+
+from contextlib import contextmanager
+from dcc.json import jsonutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+MANIFEST_FILENAME = '.fbxmanifest.json'
+LOCK_TIMEOUT = 30.0
+LOCK_INTERVAL = 0.05
+
+
+def getManifestPath(exportPath):
+    """
+    Returns the manifest path for the supplied export path.
+    Each export directory maintains its own manifest.
+
+    :type exportPath: str
+    :rtype: str
+    """
+
+    return os.path.join(os.path.dirname(exportPath), MANIFEST_FILENAME)
+
+
+def loadManifest(manifestPath):
+    """
+    Returns the fingerprints stored inside the supplied manifest.
+    If the manifest does not exist then an empty dictionary is returned!
+
+    :type manifestPath: str
+    :rtype: Dict[str, str]
+    """
+
+    if not os.path.isfile(manifestPath):
+
+        return {}
+
+    try:
+
+        with open(manifestPath, 'r') as file:
+
+            return json.load(file)
+
+    except (OSError, ValueError) as exception:
+
+        log.warning(f'Unable to load fbx manifest: {manifestPath} ({exception})')
+        return {}
+
+
+def saveManifest(manifestPath, fingerprints):
+    """
+    Saves the supplied fingerprints to the specified manifest.
+    The manifest is written to a temporary file before being moved into place.
+
+    :type manifestPath: str
+    :type fingerprints: Dict[str, str]
+    :rtype: None
+    """
+
+    temporaryPath = f'{manifestPath}.{uuid.uuid4().hex}'
+
+    try:
+
+        os.makedirs(os.path.dirname(manifestPath), exist_ok=True)
+
+        with open(temporaryPath, 'w') as file:
+
+            json.dump(fingerprints, file, indent=4, sort_keys=True)
+
+        os.replace(temporaryPath, manifestPath)
+
+    except OSError as exception:
+
+        log.warning(f'Unable to save fbx manifest: {manifestPath} ({exception})')
+
+
+@contextmanager
+def lockManifest(manifestPath, timeout=LOCK_TIMEOUT):
+    """
+    Returns a context manager that holds an exclusive lock on the supplied manifest.
+    The lock is a file next to the manifest that is atomically created, so only one process can merge into the manifest at a time.
+    Any lock older than the timeout is assumed to be left behind by a crashed process and is broken!
+
+    :type manifestPath: str
+    :type timeout: float
+    :rtype: Iterator[None]
+    """
+
+    # Acquire lock file
+    #
+    lockPath = f'{manifestPath}.lock'
+    os.makedirs(os.path.dirname(manifestPath), exist_ok=True)
+
+    while True:
+
+        try:
+
+            handle = os.open(lockPath, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+
+        except FileExistsError:
+
+            # Check if the lock is stale
+            # If the lock was released in the meantime then try again immediately
+            #
+            try:
+
+                isStale = (time.time() - os.path.getmtime(lockPath)) > timeout
+
+            except OSError:
+
+                continue
+
+            if isStale:
+
+                log.warning(f'Breaking stale fbx manifest lock: {lockPath}')
+
+                try:
+
+                    os.remove(lockPath)
+
+                except OSError:
+
+                    pass
+
+            else:
+
+                time.sleep(LOCK_INTERVAL)
+
+    # Yield to caller and release lock
+    #
+    try:
+
+        os.write(handle, str(os.getpid()).encode('utf-8'))
+        os.close(handle)
+
+        yield
+
+    finally:
+
+        try:
+
+            os.remove(lockPath)
+
+        except OSError as exception:
+
+            log.warning(f'Unable to release fbx manifest lock: {lockPath} ({exception})')
+
+
+def getFileRevision(filePath):
+    """
+    Returns the revision of the supplied file in the form of its normalized path, size and modification time.
+    If the file does not exist then none is returned!
+
+    :type filePath: str
+    :rtype: Union[List[Union[str, int, float]], None]
+    """
+
+    try:
+
+        stat = os.stat(filePath)
+        return [os.path.normcase(os.path.abspath(filePath)), stat.st_size, stat.st_mtime]
+
+    except OSError:
+
+        return None
+
+
+def getFingerprint(**kwargs):
+    """
+    Returns a fingerprint for the supplied keyword arguments.
+    Any arguments that are not JSON serializable should be serialized beforehand.
+
+    :rtype: str
+    """
+
+    return hashlib.sha1(json.dumps(kwargs, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def getExportRangeFingerprint(sceneRevision, sequencer, exportRange, directory=''):
+    """
+    Returns a fingerprint for the supplied export range.
+    This includes the scene revision, the range's export settings and the revision of the referenced rig.
+
+    :type sceneRevision: List[Union[str, int, float]]
+    :type sequencer: dcc.fbx.libs.fbxsequencer.FbxSequencer
+    :type exportRange: dcc.fbx.libs.fbxexportrange.FbxExportRange
+    :type directory: str
+    :rtype: str
+    """
+
+    return getFingerprint(
+        scene=sceneRevision,
+        settings=jsonutils.dumps(exportRange),
+        reference=getFileRevision(sequencer.reference.filePath()),
+        directory=directory
+    )
+
+
+class FbxManifests(object):
+    """
+    Class used to read and write the fingerprints of exported files across multiple manifests.
+    Manifests are loaded on demand and any changes are merged back into the latest manifest on save.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_manifests', '_changes')
+
+    def __init__(self):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(FbxManifests, self).__init__()
+
+        # Declare private variables
+        #
+        self._manifests = {}
+        self._changes = {}
+    # endregion
+
+    # region Methods
+    def getManifest(self, exportPath):
+        """
+        Returns the fingerprints from the manifest associated with the supplied export path.
+
+        :type exportPath: str
+        :rtype: Dict[str, str]
+        """
+
+        manifestPath = getManifestPath(exportPath)
+        manifest = self._manifests.get(manifestPath, None)
+
+        if manifest is None:
+
+            manifest = loadManifest(manifestPath)
+            self._manifests[manifestPath] = manifest
+
+        return manifest
+
+    def isUpToDate(self, exportPath, fingerprint):
+        """
+        Evaluates if the supplied export path exists and was exported with the same fingerprint.
+
+        :type exportPath: str
+        :type fingerprint: str
+        :rtype: bool
+        """
+
+        if not os.path.isfile(exportPath):
+
+            return False
+
+        manifest = self.getManifest(exportPath)
+        return manifest.get(os.path.basename(exportPath), None) == fingerprint
+
+    def setFingerprint(self, exportPath, fingerprint):
+        """
+        Updates the fingerprint for the supplied export path.
+        Passing none will remove the export path from its manifest instead.
+
+        :type exportPath: str
+        :type fingerprint: Union[str, None]
+        :rtype: None
+        """
+
+        manifestPath = getManifestPath(exportPath)
+        filename = os.path.basename(exportPath)
+
+        manifest = self.getManifest(exportPath)
+        changes = self._changes.setdefault(manifestPath, {})
+
+        if fingerprint is not None:
+
+            manifest[filename] = fingerprint
+
+        else:
+
+            manifest.pop(filename, None)
+
+        changes[filename] = fingerprint
+
+    def save(self):
+        """
+        Merges any changes into their manifests on disk.
+        Each manifest is locked and reloaded beforehand so that changes made by other processes are preserved.
+
+        :rtype: None
+        """
+
+        for (manifestPath, changes) in self._changes.items():
+
+            try:
+
+                with lockManifest(manifestPath):
+
+                    manifest = loadManifest(manifestPath)
+
+                    for (filename, fingerprint) in changes.items():
+
+                        if fingerprint is not None:
+
+                            manifest[filename] = fingerprint
+
+                        else:
+
+                            manifest.pop(filename, None)
+
+                    saveManifest(manifestPath, manifest)
+
+            except OSError as exception:
+
+                log.warning(f'Unable to lock fbx manifest: {manifestPath} ({exception})')
+                continue
+
+            self._manifests[manifestPath] = manifest
+
+        self._changes.clear()
+    # endregion
@@ -0,0 +1,268 @@
+import os
+import sys
+import json
+import uuid
+import ctypes
+import tracemalloc
+
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class ProcessMemoryCounters(ctypes.Structure):
+    """
+    Overload of `Structure` that mirrors the Windows `PROCESS_MEMORY_COUNTERS` structure.
+    """
+
+    _fields_ = [
+        ('cb', ctypes.c_ulong),
+        ('PageFaultCount', ctypes.c_ulong),
+        ('PeakWorkingSetSize', ctypes.c_size_t),
+        ('WorkingSetSize', ctypes.c_size_t),
+        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+        ('PagefileUsage', ctypes.c_size_t),
+        ('PeakPagefileUsage', ctypes.c_size_t)
+    ]
+
+
+def getResidentSetSize():
+    """
+    Returns the resident set size of the current process in bytes.
+    On platforms without a way to query the current size the peak size is returned instead.
+
+    :rtype: int
+    """
+
+    # Check if this is Windows
+    #
+    if sys.platform == 'win32':
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb)
+
+        return counters.WorkingSetSize
+
+    # Check if proc filesystem is available
+    #
+    try:
+
+        with open('/proc/self/statm', 'r') as file:
+
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+    except (OSError, ValueError, IndexError):
+
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        return usage if sys.platform == 'darwin' else usage * 1024
+
+
+def formatBytes(size):
+    """
+    Returns a human readable string for the supplied number of bytes.
+
+    :type size: int
+    :rtype: str
+    """
+
+    return f'{size / 1048576.0:+.2f} MB'
+
+
+class MemoryTracker(object):
+    """
+    Class used to record how much process memory, and Python heap, each task and scene open consumes.
+    Deltas are aggregated per task class and, if snapshots are enabled, so are the allocation sites responsible for them.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_filePath', '_topCount', '_snapshots', '_frameCount', '_stats', '_sites', '_startedTracing')
+
+    def __init__(self, filePath=None, topCount=10, snapshots=True, frameCount=1):
+        """
+        Private method called after a new instance is created.
+
+        :type filePath: Union[str, None]
+        :type topCount: int
+        :type snapshots: bool
+        :type frameCount: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(MemoryTracker, self).__init__()
+
+        # Declare private variables
+        #
+        self._filePath = os.path.abspath(os.path.expandvars(filePath)) if filePath else None
+        self._topCount = topCount
+        self._snapshots = snapshots
+        self._frameCount = frameCount
+        self._stats = defaultdict(lambda: {'count': 0, 'rss': 0, 'heap': 0, 'peakRss': 0})
+        self._sites = defaultdict(Counter)
+        self._startedTracing = False
+    # endregion
+
+    # region Properties
+    @property
+    def stats(self):
+        """
+        Getter method that returns the aggregated deltas for each task class.
+
+        :rtype: Dict[str, Dict[str, int]]
+        """
+
+        return self._stats
+
+    @property
+    def sites(self):
+        """
+        Getter method that returns the aggregated allocation sites for each task class.
+
+        :rtype: Dict[str, Counter]
+        """
+
+        return self._sites
+    # endregion
+
+    # region Methods
+    def start(self):
+        """
+        Starts tracing Python allocations, unless they are already being traced.
+
+        :rtype: None
+        """
+
+        self._stats.clear()
+        self._sites.clear()
+
+        if not tracemalloc.is_tracing():
+
+            tracemalloc.start(self._frameCount)
+            self._startedTracing = True
+
+    def stop(self):
+        """
+        Stops tracing Python allocations and reports the aggregated deltas.
+
+        :rtype: None
+        """
+
+        if self._startedTracing:
+
+            tracemalloc.stop()
+            self._startedTracing = False
+
+        self.report()
+
+        if self._filePath is not None:
+
+            self.save()
+
+    @staticmethod
+    def takeSnapshot():
+        """
+        Returns a snapshot of the traced allocations.
+        Allocations made by the tracing machinery itself are excluded.
+
+        :rtype: tracemalloc.Snapshot
+        """
+
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__)
+        ])
+
+    @contextmanager
+    def measure(self, name):
+        """
+        Returns a context manager that records the memory delta of the code inside it under the supplied name.
+
+        :type name: str
+        :rtype: contextmanager
+        """
+
+        # Record starting usage
+        #
+        snapshot = self.takeSnapshot() if self._snapshots else None
+        startRss = getResidentSetSize()
+        startHeap = tracemalloc.get_traced_memory()[0]
+
+        try:
+
+            yield
+
+        finally:
+
+            # Aggregate deltas
+            #
+            rssDelta = getResidentSetSize() - startRss
+            heapDelta = tracemalloc.get_traced_memory()[0] - startHeap
+
+            stats = self._stats[name]
+            stats['count'] += 1
+            stats['rss'] += rssDelta
+            stats['heap'] += heapDelta
+            stats['peakRss'] = max(stats['peakRss'], rssDelta)
+
+            # Aggregate allocation sites
+            #
+            if snapshot is not None:
+
+                for difference in self.takeSnapshot().compare_to(snapshot, 'lineno'):
+
+                    if difference.size_diff != 0:
+
+                        frame = difference.traceback[0]
+                        self._sites[name][f'{frame.filename}:{frame.lineno}'] += difference.size_diff
+
+    def report(self):
+        """
+        Logs the aggregated deltas and top allocation sites for each task class.
+
+        :rtype: None
+        """
+
+        for (name, stats) in sorted(self._stats.items(), key=lambda item: item[1]['rss'], reverse=True):
+
+            lines = [f'{name} x{stats["count"]}: {formatBytes(stats["rss"])} RSS ({formatBytes(stats["peakRss"])} peak), {formatBytes(stats["heap"])} heap']
+
+            for (site, size) in self._sites[name].most_common(self._topCount):
+
+                lines.append(f'\t{site}: {formatBytes(size)}')
+
+            log.info('\n'.join(lines))
+
+    def save(self):
+        """
+        Writes the aggregated deltas and top allocation sites to this tracker's file path as JSON.
+
+        :rtype: None
+        """
+
+        report = {
+            name: dict(stats, sites=dict(self._sites[name].most_common(self._topCount)))
+            for (name, stats) in self._stats.items()
+        }
+
+        temporaryPath = f'{self._filePath}.{uuid.uuid4().hex}'
+        os.makedirs(os.path.dirname(self._filePath), exist_ok=True)
+
+        with open(temporaryPath, 'w') as file:
+
+            json.dump(report, file, indent=4)
+
+        os.replace(temporaryPath, self._filePath)
+    # endregion
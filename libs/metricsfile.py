@@ -0,0 +1,343 @@
+import os
+import time
+import uuid
+import threading
+
+from collections import Counter, defaultdict
+from . import memorytracker
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+DEFAULT_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+def escapeLabelValue(value):
+    """
+    Returns the supplied label value escaped for the Prometheus text format.
+
+    :type value: Any
+    :rtype: str
+    """
+
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def formatLabels(labels):
+    """
+    Returns the supplied labels formatted for the Prometheus text format.
+
+    :type labels: Dict[str, Any]
+    :rtype: str
+    """
+
+    if len(labels) == 0:
+
+        return ''
+
+    return '{' + ','.join(f'{key}="{escapeLabelValue(value)}"' for (key, value) in labels.items()) + '}'
+
+
+def formatValue(value):
+    """
+    Returns the supplied sample value formatted for the Prometheus text format.
+
+    :type value: Union[int, float]
+    :rtype: str
+    """
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsFile(object):
+    """
+    Class used to periodically write batch metrics as a Prometheus textfile.
+    The file is written atomically so collectors, such as node-exporter's textfile collector, never read it partially written.
+    """
+
+    # region Dunderscores
+    __slots__ = (
+        '_filePath',
+        '_interval',
+        '_buckets',
+        '_labels',
+        '_lock',
+        '_files',
+        '_durations',
+        '_queueDepth',
+        '_workerMemory',
+        '_startTime',
+        '_thread',
+        '_stopped'
+    )
+
+    def __init__(self, filePath, interval=15.0, buckets=DEFAULT_BUCKETS, labels=None):
+        """
+        Private method called after a new instance is created.
+
+        :type filePath: str
+        :type interval: float
+        :type buckets: Tuple[float]
+        :type labels: Union[Dict[str, str], None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(MetricsFile, self).__init__()
+
+        # Declare private variables
+        #
+        self._filePath = os.path.abspath(os.path.expandvars(filePath))
+        self._interval = interval
+        self._buckets = tuple(sorted(buckets))
+        self._labels = dict(labels) if labels else {}
+        self._lock = threading.Lock()
+        self._files = Counter()
+        self._durations = defaultdict(lambda: {'buckets': [0] * len(self._buckets), 'count': 0, 'sum': 0.0})
+        self._queueDepth = 0
+        self._workerMemory = {}
+        self._startTime = None
+        self._thread = None
+        self._stopped = threading.Event()
+    # endregion
+
+    # region Properties
+    @property
+    def filePath(self):
+        """
+        Getter method that returns the path metrics are written to.
+
+        :rtype: str
+        """
+
+        return self._filePath
+
+    @property
+    def interval(self):
+        """
+        Getter method that returns the number of seconds between writes.
+
+        :rtype: float
+        """
+
+        return self._interval
+
+    @property
+    def files(self):
+        """
+        Getter method that returns the number of files recorded for each status.
+
+        :rtype: Counter
+        """
+
+        return self._files
+    # endregion
+
+    # region Methods
+    def recordFile(self, status):
+        """
+        Records a file that finished processing with the supplied status.
+        Valid statuses are: succeeded, skipped and failed.
+
+        :type status: str
+        :rtype: None
+        """
+
+        with self._lock:
+
+            self._files[status] += 1
+
+    def observeTask(self, name, seconds):
+        """
+        Records the duration of a task's execution.
+
+        :type name: str
+        :type seconds: float
+        :rtype: None
+        """
+
+        with self._lock:
+
+            durations = self._durations[name]
+            durations['count'] += 1
+            durations['sum'] += seconds
+
+            for (index, bound) in enumerate(self._buckets):
+
+                if seconds <= bound:
+
+                    durations['buckets'][index] += 1
+
+    def setQueueDepth(self, queueDepth):
+        """
+        Updates the number of files still waiting to be processed.
+
+        :type queueDepth: int
+        :rtype: None
+        """
+
+        with self._lock:
+
+            self._queueDepth = queueDepth
+
+    def setWorkerMemory(self, worker, residentSetSize):
+        """
+        Updates the resident set size, in bytes, of the supplied worker.
+
+        :type worker: Union[int, str]
+        :type residentSetSize: Union[int, None]
+        :rtype: None
+        """
+
+        if residentSetSize is None:
+
+            return
+
+        with self._lock:
+
+            self._workerMemory[str(worker)] = residentSetSize
+
+    def iterLines(self):
+        """
+        Returns a generator that yields the lines of the textfile.
+
+        :rtype: Iterator[str]
+        """
+
+        labels = self._labels
+        elapsed = time.monotonic() - self._startTime if self._startTime is not None else 0.0
+        processed = sum(self._files.values())
+
+        yield '# HELP ezbatcher_files_total Number of files that finished processing.'
+        yield '# TYPE ezbatcher_files_total counter'
+
+        for status in ('succeeded', 'skipped', 'failed'):
+
+            yield f'ezbatcher_files_total{formatLabels(dict(labels, status=status))} {self._files[status]}'
+
+        yield '# HELP ezbatcher_failures_total Number of files that failed to process.'
+        yield '# TYPE ezbatcher_failures_total counter'
+        yield f'ezbatcher_failures_total{formatLabels(labels)} {self._files["failed"]}'
+
+        yield '# HELP ezbatcher_task_duration_seconds Time spent executing each task class.'
+        yield '# TYPE ezbatcher_task_duration_seconds histogram'
+
+        for (name, durations) in sorted(self._durations.items()):
+
+            taskLabels = dict(labels, task=name)
+
+            for (bound, count) in zip(self._buckets, durations['buckets']):
+
+                yield f'ezbatcher_task_duration_seconds_bucket{formatLabels(dict(taskLabels, le=formatValue(float(bound))))} {count}'
+
+            yield f'ezbatcher_task_duration_seconds_bucket{formatLabels(dict(taskLabels, le="+Inf"))} {durations["count"]}'
+            yield f'ezbatcher_task_duration_seconds_sum{formatLabels(taskLabels)} {formatValue(durations["sum"])}'
+            yield f'ezbatcher_task_duration_seconds_count{formatLabels(taskLabels)} {durations["count"]}'
+
+        yield '# HELP ezbatcher_queue_depth Number of files still waiting to be processed.'
+        yield '# TYPE ezbatcher_queue_depth gauge'
+        yield f'ezbatcher_queue_depth{formatLabels(labels)} {self._queueDepth}'
+
+        yield '# HELP ezbatcher_resident_memory_bytes Resident set size of each process.'
+        yield '# TYPE ezbatcher_resident_memory_bytes gauge'
+        yield f'ezbatcher_resident_memory_bytes{formatLabels(dict(labels, worker="main"))} {memorytracker.getResidentSetSize()}'
+
+        for (worker, residentSetSize) in sorted(self._workerMemory.items()):
+
+            yield f'ezbatcher_resident_memory_bytes{formatLabels(dict(labels, worker=worker))} {residentSetSize}'
+
+        yield '# HELP ezbatcher_throughput_files_per_second Number of files processed per second since the batch began.'
+        yield '# TYPE ezbatcher_throughput_files_per_second gauge'
+        yield f'ezbatcher_throughput_files_per_second{formatLabels(labels)} {formatValue(processed / elapsed if elapsed > 0.0 else 0.0)}'
+
+    def render(self):
+        """
+        Returns the metrics in the Prometheus text format.
+
+        :rtype: str
+        """
+
+        with self._lock:
+
+            return '\n'.join(self.iterLines()) + '\n'
+
+    def save(self):
+        """
+        Writes the metrics to this file's path.
+        The temporary file does not end with `.prom` so collectors ignore it until it is renamed.
+
+        :rtype: None
+        """
+
+        contents = self.render()
+
+        temporaryPath = f'{self.filePath}.{uuid.uuid4().hex}'
+        os.makedirs(os.path.dirname(self.filePath), exist_ok=True)
+
+        with open(temporaryPath, 'w', encoding='utf-8') as file:
+
+            file.write(contents)
+
+        os.replace(temporaryPath, self.filePath)
+
+    def run(self):
+        """
+        Writes the metrics at each interval until this file is stopped.
+
+        :rtype: None
+        """
+
+        while not self._stopped.wait(self.interval):
+
+            try:
+
+                self.save()
+
+            except OSError as exception:
+
+                log.warning(f'Unable to write metrics: {self.filePath} ({exception})')
+
+    def start(self, queueDepth=0):
+        """
+        Resets the metrics and starts writing them periodically.
+
+        :type queueDepth: int
+        :rtype: None
+        """
+
+        with self._lock:
+
+            self._files.clear()
+            self._durations.clear()
+            self._workerMemory.clear()
+            self._queueDepth = queueDepth
+            self._startTime = time.monotonic()
+
+        self.save()
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self.run, name='MetricsFile', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops writing metrics periodically and writes them one last time.
+
+        :rtype: None
+        """
+
+        if self._thread is None:
+
+            return
+
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+        self.save()
+        log.info(f'Metrics saved to: {self.filePath}')
+    # endregion
@@ -0,0 +1,144 @@
+from mpy import mpyscene
+from ezposer.ui import qezposer
+from . import referenceutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+__configuration__ = None
+__namespace__ = None
+__controls__ = {}
+
+
+def invalidate():
+    """
+    Forces the next activation to update the poser's configuration and namespace.
+
+    :rtype: None
+    """
+
+    global __configuration__, __namespace__
+
+    __configuration__ = None
+    __namespace__ = None
+    __controls__.clear()
+
+
+def activate(configuration, namespace):
+    """
+    Updates the poser's current configuration and namespace.
+    Since both persist for the entire session they are only updated when they change.
+
+    :type configuration: str
+    :type namespace: str
+    :rtype: None
+    """
+
+    global __configuration__, __namespace__
+
+    if configuration != __configuration__:
+
+        log.info(f'Activating "{configuration}" rig configuration.')
+        qezposer.QEzPoser.setCurrentConfiguration(configuration)
+
+        __configuration__ = configuration
+
+    if namespace != __namespace__:
+
+        qezposer.QEzPoser.setCurrentNamespace(namespace)
+        __namespace__ = namespace
+
+
+def stripNamespace(name, namespace):
+    """
+    Returns the supplied node name relative to the given rig namespace.
+    Only the rig namespace is removed so controls inside nested namespaces remain unique.
+
+    :type name: str
+    :type namespace: str
+    :rtype: str
+    """
+
+    name = name.lstrip(':')
+    prefix = f'{namespace}:' if namespace else ''
+
+    if prefix and name.startswith(prefix):
+
+        return name[len(prefix):]
+
+    else:
+
+        return name
+
+
+def resolveControls(namespace, names):
+    """
+    Returns the controls associated with the supplied names.
+    If any of the controls cannot be found then none is returned!
+
+    :type namespace: str
+    :type names: List[str]
+    :rtype: Union[List[mpynode.MPyNode], None]
+    """
+
+    scene = mpyscene.MPyScene()
+    controls = []
+
+    for name in names:
+
+        try:
+
+            control = scene.getNodeByName(f'{namespace}:{name}' if namespace else name)
+
+        except RuntimeError:
+
+            control = None
+
+        if control is None:
+
+            return None
+
+        controls.append(control)
+
+    return controls
+
+
+def getControls(configuration, namespace):
+    """
+    Returns the controls for the supplied rig configuration and namespace.
+    The resolved control names are cached so subsequent files can skip walking the scene.
+    The cache is only re-validated when the referenced rig path changes.
+
+    :type configuration: str
+    :type namespace: str
+    :rtype: List[mpynode.MPyNode]
+    """
+
+    # Check if controls have already been resolved for this rig
+    #
+    activate(configuration, namespace)
+
+    key = (configuration, namespace)
+    rigPath = referenceutils.getReferencePathFromNamespace(namespace)
+    cachedPath, names = __controls__.get(key, ('', []))
+
+    if rigPath and rigPath == cachedPath:
+
+        controls = resolveControls(namespace, names)
+
+        if controls is not None:
+
+            return controls
+
+    # Walk scene for controls
+    #
+    controls = list(qezposer.QEzPoser.iterControls(visible=False))
+
+    if rigPath:
+
+        __controls__[key] = (rigPath, [stripNamespace(control.name(), namespace) for control in controls])
+
+    return controls
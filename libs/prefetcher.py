@@ -0,0 +1,333 @@
+import os
+import shutil
+import hashlib
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from . import sceneheader, uploadqueue
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class Prefetcher(object):
+    """
+    Class used to copy upcoming files in the queue to a local scratch directory on background threads.
+    Scene files are then opened from their local copy while the current file is still processing.
+    Scene files that reference files through relative paths are left in place since their copies could not resolve them.
+    Referenced files can optionally be read ahead as well in order to warm the operating system's file cache.
+    If a scene cache is supplied then files are read through it instead and are kept between batches.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_directory', '_lookahead', '_cacheSize', '_includeReferences', '_cache', '_executor', '_futures', '_sizes', '_lock')
+
+    def __init__(self, directory, lookahead=2, cacheSize=10737418240, includeReferences=False, threadCount=2, cache=None):
+        """
+        Private method called after a new instance is created.
+
+        :type directory: str
+        :type lookahead: int
+        :type cacheSize: int
+        :type includeReferences: bool
+        :type threadCount: int
+        :type cache: Union[scenecache.SceneCache, None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(Prefetcher, self).__init__()
+
+        # Declare private variables
+        #
+        self._directory = os.path.abspath(os.path.expandvars(directory))
+        self._lookahead = lookahead
+        self._cacheSize = cacheSize
+        self._includeReferences = includeReferences
+        self._cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=threadCount)
+        self._futures = {}
+        self._sizes = {}
+        self._lock = threading.Lock()
+    # endregion
+
+    # region Properties
+    @property
+    def directory(self):
+        """
+        Getter method that returns the local scratch directory.
+
+        :rtype: str
+        """
+
+        return self._directory
+
+    @property
+    def lookahead(self):
+        """
+        Getter method that returns the number of upcoming files to prefetch.
+
+        :rtype: int
+        """
+
+        return self._lookahead
+
+    @property
+    def cacheSize(self):
+        """
+        Getter method that returns the maximum number of bytes the scratch directory can hold.
+
+        :rtype: int
+        """
+
+        return self._cacheSize
+
+    @property
+    def includeReferences(self):
+        """
+        Getter method that returns the `includeReferences` flag.
+
+        :rtype: bool
+        """
+
+        return self._includeReferences
+
+    @property
+    def cache(self):
+        """
+        Getter method that returns the scene cache files are read through.
+
+        :rtype: Union[scenecache.SceneCache, None]
+        """
+
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache):
+        """
+        Setter method that updates the scene cache files are read through.
+
+        :type cache: Union[scenecache.SceneCache, None]
+        :rtype: None
+        """
+
+        self._cache = cache
+    # endregion
+
+    # region Methods
+    def getLocalPath(self, filePath):
+        """
+        Returns the local scratch path for the supplied file.
+        Files are grouped by a hash of their directory to avoid any name collisions.
+
+        :type filePath: str
+        :rtype: str
+        """
+
+        directory = os.path.dirname(os.path.normcase(os.path.abspath(filePath)))
+        digest = hashlib.sha1(directory.encode('utf-8')).hexdigest()[:16]
+
+        return os.path.join(self.directory, digest, os.path.basename(filePath))
+
+    def usedBytes(self):
+        """
+        Returns the number of bytes currently reserved by prefetched files.
+
+        :rtype: int
+        """
+
+        return sum(self._sizes.values())
+
+    def warmReferences(self, filePath):
+        """
+        Reads the references from the supplied scene file in order to warm the file cache.
+        Referenced files are not copied since the scene will continue to reference their original paths.
+
+        :type filePath: str
+        :rtype: None
+        """
+
+        for referencePath in sceneheader.iterReferencePaths(filePath):
+
+            try:
+
+                with open(referencePath, 'rb') as file:
+
+                    while file.read(uploadqueue.CHUNK_SIZE):
+
+                        continue
+
+            except OSError as exception:
+
+                log.debug(f'Unable to read reference: {referencePath} ({exception})')
+
+    def fetch(self, filePath):
+        """
+        Copies the supplied file to the scratch directory and returns the local path.
+        If the file has relative references then it is not copied and the original path is returned!
+
+        :type filePath: str
+        :rtype: str
+        """
+
+        # Check if file can be opened from another directory
+        #
+        if sceneheader.hasRelativeReferences(filePath):
+
+            log.debug(f'Skipping prefetch since scene has relative references: {filePath}')
+            return filePath
+
+        # Check if file should be read through the scene cache
+        #
+        if self.cache is not None:
+
+            localPath = self.cache.fetch(filePath)
+
+        else:
+
+            # Copy file to temporary path before moving into place
+            #
+            localPath = self.getLocalPath(filePath)
+            temporaryPath = f'{localPath}.fetching'
+
+            os.makedirs(os.path.dirname(localPath), exist_ok=True)
+            shutil.copyfile(filePath, temporaryPath)
+            os.replace(temporaryPath, localPath)
+
+        # Check if references should be read ahead
+        #
+        if self.includeReferences:
+
+            self.warmReferences(filePath)
+
+        return localPath
+
+    def schedule(self, *filePaths):
+        """
+        Schedules the supplied files for prefetching.
+        Files are skipped if they would exceed the scratch directory's size limit.
+        Files read through the scene cache are pinned until released and are bound by the cache's budget instead.
+
+        :type filePaths: Union[str, List[str]]
+        :rtype: None
+        """
+
+        with self._lock:
+
+            for filePath in filePaths:
+
+                # Check if file has already been scheduled
+                #
+                if filePath in self._futures:
+
+                    continue
+
+                # Check if there is enough room for file
+                #
+                try:
+
+                    size = os.path.getsize(filePath)
+
+                except OSError:
+
+                    continue
+
+                if self.cache is not None:
+
+                    self.cache.pin(filePath)
+
+                elif (self.usedBytes() + size) > self.cacheSize:
+
+                    log.debug(f'Skipping prefetch since scratch directory is full: {filePath}')
+                    continue
+
+                else:
+
+                    self._sizes[filePath] = size
+
+                self._futures[filePath] = self._executor.submit(self.fetch, filePath)
+
+    def acquire(self, filePath):
+        """
+        Returns the local copy of the supplied file, waiting on it if it is still being fetched.
+        If the file was not prefetched, or the prefetch failed, then the original path is returned!
+
+        :type filePath: str
+        :rtype: str
+        """
+
+        with self._lock:
+
+            future = self._futures.get(filePath, None)
+
+        if future is None:
+
+            return filePath
+
+        try:
+
+            return future.result()
+
+        except OSError as exception:
+
+            log.warning(f'Unable to prefetch file: {filePath} ({exception})')
+            return filePath
+
+    def release(self, filePath):
+        """
+        Removes the local copy of the supplied file from the scratch directory.
+        Files read through the scene cache are unpinned and kept for later batches instead.
+
+        :type filePath: str
+        :rtype: None
+        """
+
+        with self._lock:
+
+            future = self._futures.pop(filePath, None)
+            self._sizes.pop(filePath, None)
+
+        if future is None:
+
+            return
+
+        if self.cache is not None:
+
+            self.cache.unpin(filePath)
+            return
+
+        try:
+
+            localPath = future.result()
+
+            if localPath != filePath and os.path.exists(localPath):
+
+                os.remove(localPath)
+
+        except OSError:
+
+            pass
+
+    def clear(self):
+        """
+        Waits on any outstanding prefetches and removes all local copies.
+        If files were read through the scene cache then its index is persisted instead.
+
+        :rtype: None
+        """
+
+        with self._lock:
+
+            filePaths = list(self._futures.keys())
+
+        for filePath in filePaths:
+
+            self.release(filePath)
+
+        if self.cache is not None:
+
+            self.cache.save()
+    # endregion
@@ -0,0 +1,268 @@
+from fnmatch import fnmatch
+from dcc import __application__, DCC
+
+if __application__ == DCC.MAYA:
+
+    from maya import cmds as mc
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+IGNORE_REFERENCE_NODES = ('sharedReferenceNode', '_UNKNOWN_REF_NODE_')
+
+
+def isDeferrable():
+    """
+    Evaluates if the current application supports deferred reference loading.
+
+    :rtype: bool
+    """
+
+    return __application__ == DCC.MAYA
+
+
+def openSceneWithoutReferences(filePath):
+    """
+    Opens the supplied scene file without loading any of its references.
+
+    :type filePath: str
+    :rtype: None
+    """
+
+    if not isDeferrable():
+
+        raise NotImplementedError('openSceneWithoutReferences() deferred references are not supported!')
+
+    mc.file(filePath, open=True, force=True, prompt=False, loadReferenceDepth='none')
+
+
+def getReferenceStates(filePath):
+    """
+    Returns the load state of each reference in the supplied scene file as it was saved on disk.
+    The states are read from the file's load settings so the scene does not need to be opened.
+
+    :type filePath: str
+    :rtype: Dict[str, bool]
+    """
+
+    if not isDeferrable():
+
+        return {}
+
+    mc.file(filePath, open=True, buildLoadSettings=True)
+    settingCount = mc.selLoadSettings(query=True, numSettings=True)
+
+    # Collect reference load states
+    # The first setting always represents the scene file itself!
+    #
+    states = {}
+
+    for i in range(1, settingCount):
+
+        referenceNode = mc.selLoadSettings(str(i), query=True, referenceNode=True)
+        isDeferred = mc.selLoadSettings(str(i), query=True, deferReference=True)
+
+        referenceNode = referenceNode[0] if isinstance(referenceNode, (list, tuple)) else referenceNode
+        isDeferred = isDeferred[0] if isinstance(isDeferred, (list, tuple)) else isDeferred
+
+        states[referenceNode] = not bool(isDeferred)
+
+    return states
+
+
+def iterReferenceNodes():
+    """
+    Returns a generator that yields the reference nodes from the open scene file.
+
+    :rtype: Iterator[str]
+    """
+
+    if not isDeferrable():
+
+        return
+
+    for referenceNode in mc.ls(type='reference'):
+
+        if referenceNode in IGNORE_REFERENCE_NODES:
+
+            continue
+
+        yield referenceNode
+
+
+def getReferenceNamespace(referenceNode, shortName=True):
+    """
+    Returns the namespace associated with the supplied reference node.
+    If short name is disabled then the full namespace, including any parent namespaces, is returned without its leading colon.
+
+    :type referenceNode: str
+    :type shortName: bool
+    :rtype: str
+    """
+
+    try:
+
+        return mc.referenceQuery(referenceNode, namespace=True, shortName=shortName).lstrip(':')
+
+    except RuntimeError:
+
+        return ''
+
+
+def getReferencePath(referenceNode):
+    """
+    Returns the file path associated with the supplied reference node.
+
+    :type referenceNode: str
+    :rtype: str
+    """
+
+    try:
+
+        return mc.referenceQuery(referenceNode, filename=True, withoutCopyNumber=True)
+
+    except RuntimeError:
+
+        return ''
+
+
+def getReferencePathFromNamespace(namespace):
+    """
+    Returns the file path of the reference associated with the supplied namespace.
+    Namespaces are compared in full so references inside nested namespaces can be found.
+    If no reference uses the namespace then an empty string is returned!
+
+    :type namespace: str
+    :rtype: str
+    """
+
+    namespace = namespace.lstrip(':')
+
+    for referenceNode in iterReferenceNodes():
+
+        if getReferenceNamespace(referenceNode, shortName=False) == namespace:
+
+            return getReferencePath(referenceNode)
+
+    return ''
+
+
+def isReferenceLoaded(referenceNode):
+    """
+    Evaluates if the supplied reference node is loaded.
+
+    :type referenceNode: str
+    :rtype: bool
+    """
+
+    try:
+
+        return mc.referenceQuery(referenceNode, isLoaded=True)
+
+    except RuntimeError:
+
+        return False
+
+
+def iterReferenceNodesByPattern(*patterns):
+    """
+    Returns a generator that yields reference nodes that match any of the supplied patterns.
+    Patterns are compared against both the reference node name and its namespace.
+
+    :type patterns: Union[str, List[str]]
+    :rtype: Iterator[str]
+    """
+
+    if len(patterns) == 0:
+
+        return
+
+    for referenceNode in iterReferenceNodes():
+
+        namespace = getReferenceNamespace(referenceNode)
+
+        if any(fnmatch(referenceNode, pattern) or fnmatch(namespace, pattern) for pattern in patterns):
+
+            yield referenceNode
+
+
+def loadReferences(*patterns):
+    """
+    Loads any unloaded references that match the supplied patterns.
+
+    :type patterns: Union[str, List[str]]
+    :rtype: List[str]
+    """
+
+    referenceNodes = [referenceNode for referenceNode in iterReferenceNodesByPattern(*patterns) if not isReferenceLoaded(referenceNode)]
+
+    for referenceNode in referenceNodes:
+
+        log.info(f'Loading reference: {referenceNode}')
+        mc.file(loadReference=referenceNode, loadReferenceDepth='all')
+
+    return referenceNodes
+
+
+def unloadReferences(*patterns):
+    """
+    Unloads any loaded references that match the supplied patterns.
+
+    :type patterns: Union[str, List[str]]
+    :rtype: List[str]
+    """
+
+    referenceNodes = [referenceNode for referenceNode in iterReferenceNodesByPattern(*patterns) if isReferenceLoaded(referenceNode)]
+
+    for referenceNode in referenceNodes:
+
+        log.info(f'Unloading reference: {referenceNode}')
+        mc.file(unloadReference=referenceNode)
+
+    return referenceNodes
+
+
+def restoreReferenceStates(states, exclude=None):
+    """
+    Restores the supplied reference load states.
+    Any excluded reference nodes, or nodes that no longer exist, are left as they are.
+    Parent references are listed before their children so nested states are restored after their parents are loaded.
+
+    :type states: Dict[str, bool]
+    :type exclude: Union[Set[str], None]
+    :rtype: List[str]
+    """
+
+    exclude = exclude if exclude is not None else set()
+    restored = []
+
+    for (referenceNode, isLoaded) in states.items():
+
+        # Check if reference should be restored
+        #
+        if referenceNode in exclude or not mc.objExists(referenceNode):
+
+            continue
+
+        if isReferenceLoaded(referenceNode) == isLoaded:
+
+            continue
+
+        # Restore load state
+        #
+        if isLoaded:
+
+            log.info(f'Restoring reference: {referenceNode}')
+            mc.file(loadReference=referenceNode, loadReferenceDepth='none')
+
+        else:
+
+            log.info(f'Restoring unloaded reference: {referenceNode}')
+            mc.file(unloadReference=referenceNode)
+
+        restored.append(referenceNode)
+
+    return restored
@@ -0,0 +1,255 @@
+import os
+import sys
+import time
+import uuid
+import weakref
+import threading
+
+from collections import Counter
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class SamplingProfiler(object):
+    """
+    Class used to periodically sample the executing thread's stack from a background thread.
+    Samples are attributed to the task manager's current file and task, and written as collapsed stacks for flame graph tools.
+    Unlike cProfile, the executing thread is never instrumented so the overhead stays low enough for production batches.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_filePath', '_interval', '_flushInterval', '_samples', '_taskManager', '_threadId', '_thread', '_stopped', '_overhead')
+
+    def __init__(self, filePath, interval=0.01, flushInterval=60.0):
+        """
+        Private method called after a new instance is created.
+
+        :type filePath: str
+        :type interval: float
+        :type flushInterval: float
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SamplingProfiler, self).__init__()
+
+        # Declare private variables
+        #
+        self._filePath = os.path.abspath(os.path.expandvars(filePath))
+        self._interval = interval
+        self._flushInterval = flushInterval
+        self._samples = Counter()
+        self._taskManager = None
+        self._threadId = None
+        self._thread = None
+        self._stopped = threading.Event()
+        self._overhead = 0.0
+    # endregion
+
+    # region Properties
+    @property
+    def filePath(self):
+        """
+        Getter method that returns the path collapsed stacks are written to.
+
+        :rtype: str
+        """
+
+        return self._filePath
+
+    @property
+    def interval(self):
+        """
+        Getter method that returns the number of seconds between samples.
+
+        :rtype: float
+        """
+
+        return self._interval
+
+    @property
+    def flushInterval(self):
+        """
+        Getter method that returns the number of seconds between writing the collapsed stacks.
+        This ensures long batches that crash or are killed still leave their samples behind.
+
+        :rtype: float
+        """
+
+        return self._flushInterval
+
+    @property
+    def samples(self):
+        """
+        Getter method that returns the number of samples for each collapsed stack.
+
+        :rtype: Counter
+        """
+
+        return self._samples
+
+    @property
+    def taskManager(self):
+        """
+        Getter method that returns the task manager being sampled.
+
+        :rtype: Union[ezbatcher.libs.taskmanager.TaskManager, None]
+        """
+
+        return self._taskManager() if self._taskManager is not None else None
+    # endregion
+
+    # region Methods
+    @staticmethod
+    def getFrameName(frame):
+        """
+        Returns the collapsed stack name for the supplied frame.
+
+        :type frame: types.FrameType
+        :rtype: str
+        """
+
+        code = frame.f_code
+        return f'{code.co_name} ({os.path.basename(code.co_filename)})'.replace(';', ':')
+
+    def getAttribution(self):
+        """
+        Returns the root frames used to attribute the next sample.
+
+        :rtype: List[str]
+        """
+
+        taskManager = self.taskManager
+
+        if taskManager is None:
+
+            return []
+
+        attribution = []
+        filePath, task = taskManager.currentFilePath, taskManager.currentTask
+
+        if filePath is not None:
+
+            attribution.append(f'file:{os.path.basename(filePath)}'.replace(';', ':'))
+
+        if task is not None:
+
+            attribution.append(f'task:{type(task).__name__}')
+
+        return attribution
+
+    def sample(self):
+        """
+        Records the current stack of the sampled thread.
+
+        :rtype: None
+        """
+
+        frame = sys._current_frames().get(self._threadId)
+
+        if frame is None:
+
+            return
+
+        names = []
+
+        while frame is not None:
+
+            names.append(self.getFrameName(frame))
+            frame = frame.f_back
+
+        names.reverse()
+        self._samples[';'.join(self.getAttribution() + names)] += 1
+
+    def run(self):
+        """
+        Samples the sampled thread until this profiler is stopped.
+        The collapsed stacks are also written at each flush interval.
+
+        :rtype: None
+        """
+
+        flushTime = time.monotonic() + self.flushInterval
+
+        while not self._stopped.wait(self.interval):
+
+            startTime = time.perf_counter()
+            self.sample()
+            self._overhead += time.perf_counter() - startTime
+
+            # Check if the collapsed stacks are due to be written
+            #
+            if time.monotonic() < flushTime:
+
+                continue
+
+            flushTime = time.monotonic() + self.flushInterval
+
+            try:
+
+                self.save()
+
+            except OSError as exception:
+
+                log.warning(f'Unable to write samples: {self.filePath} ({exception})')
+
+    def start(self, taskManager=None):
+        """
+        Starts sampling the calling thread.
+
+        :type taskManager: Union[ezbatcher.libs.taskmanager.TaskManager, None]
+        :rtype: None
+        """
+
+        self._samples.clear()
+        self._overhead = 0.0
+        self._taskManager = weakref.ref(taskManager) if taskManager is not None else None
+        self._threadId = threading.get_ident()
+        self._stopped.clear()
+
+        self._thread = threading.Thread(target=self.run, name='SamplingProfiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops sampling and writes the collapsed stacks.
+
+        :rtype: None
+        """
+
+        if self._thread is None:
+
+            return
+
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+        self.save()
+
+        sampleCount = sum(self._samples.values())
+        log.info(f'{sampleCount} sample(s) saved to: {self.filePath} ({self._overhead:.2f} second(s) spent sampling)')
+
+    def save(self):
+        """
+        Writes the collapsed stacks to this profiler's file path.
+        The file is written to a temporary path first so the previous output is never left partially written.
+
+        :rtype: None
+        """
+
+        temporaryPath = f'{self.filePath}.{uuid.uuid4().hex}'
+        os.makedirs(os.path.dirname(self.filePath), exist_ok=True)
+
+        with open(temporaryPath, 'w', encoding='utf-8') as file:
+
+            for (stack, count) in self._samples.most_common():
+
+                file.write(f'{stack} {count}\n')
+
+        os.replace(temporaryPath, self.filePath)
+    # endregion
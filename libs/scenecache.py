@@ -0,0 +1,365 @@
+import os
+import json
+import time
+import uuid
+import hashlib
+import threading
+
+from . import uploadqueue
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+INDEX_FILENAME = 'index.json'
+
+
+class SceneCache(object):
+    """
+    Class used to persist local copies of source files across batches.
+    Each copy is keyed by its source path and validated against the source's size and modification time.
+    Once the cache exceeds its byte budget the least recently used copies are evicted.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_directory', '_cacheSize', '_entries', '_pinned', '_lock')
+
+    def __init__(self, directory, cacheSize=53687091200):
+        """
+        Private method called after a new instance is created.
+
+        :type directory: str
+        :type cacheSize: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SceneCache, self).__init__()
+
+        # Declare private variables
+        #
+        self._directory = os.path.abspath(os.path.expandvars(directory))
+        self._cacheSize = cacheSize
+        self._entries = {}
+        self._pinned = {}
+        self._lock = threading.RLock()
+
+        # Load persisted index
+        #
+        self.load()
+    # endregion
+
+    # region Properties
+    @property
+    def directory(self):
+        """
+        Getter method that returns the cache directory.
+
+        :rtype: str
+        """
+
+        return self._directory
+
+    @property
+    def cacheSize(self):
+        """
+        Getter method that returns the maximum number of bytes the cache can hold.
+
+        :rtype: int
+        """
+
+        return self._cacheSize
+
+    @property
+    def indexPath(self):
+        """
+        Getter method that returns the path of the persisted index.
+
+        :rtype: str
+        """
+
+        return os.path.join(self.directory, INDEX_FILENAME)
+    # endregion
+
+    # region Methods
+    @staticmethod
+    def getKey(filePath):
+        """
+        Returns the cache key for the supplied file.
+
+        :type filePath: str
+        :rtype: str
+        """
+
+        return os.path.normcase(os.path.abspath(filePath))
+
+    def getLocalPath(self, filePath):
+        """
+        Returns the cached path for the supplied file.
+        Files are grouped by a hash of their directory to avoid any name collisions.
+
+        :type filePath: str
+        :rtype: str
+        """
+
+        directory = os.path.dirname(self.getKey(filePath))
+        digest = hashlib.sha1(directory.encode('utf-8')).hexdigest()[:16]
+
+        return os.path.join(self.directory, digest, os.path.basename(filePath))
+
+    def usedBytes(self):
+        """
+        Returns the number of bytes currently held by the cache.
+
+        :rtype: int
+        """
+
+        with self._lock:
+
+            return sum(entry['size'] for entry in self._entries.values())
+
+    def load(self):
+        """
+        Loads the persisted index from the cache directory.
+        Any entries whose local copy no longer exists are discarded.
+
+        :rtype: None
+        """
+
+        # Check if index exists
+        #
+        if not os.path.isfile(self.indexPath):
+
+            return
+
+        try:
+
+            with open(self.indexPath, 'r') as file:
+
+                entries = json.load(file)
+
+        except (OSError, ValueError) as exception:
+
+            log.warning(f'Unable to load scene cache index: {self.indexPath} ({exception})')
+            return
+
+        # Validate local copies
+        #
+        with self._lock:
+
+            self._entries = {key: entry for (key, entry) in entries.items() if os.path.isfile(entry['localPath'])}
+
+    def save(self):
+        """
+        Persists the index to the cache directory.
+        The index is written to a temporary file before being moved into place.
+
+        :rtype: None
+        """
+
+        with self._lock:
+
+            entries = dict(self._entries)
+
+        os.makedirs(self.directory, exist_ok=True)
+        temporaryPath = f'{self.indexPath}.{uuid.uuid4().hex}'
+
+        try:
+
+            with open(temporaryPath, 'w') as file:
+
+                json.dump(entries, file, indent=4)
+
+            os.replace(temporaryPath, self.indexPath)
+
+        except OSError as exception:
+
+            log.warning(f'Unable to save scene cache index: {self.indexPath} ({exception})')
+
+    def isValid(self, filePath):
+        """
+        Evaluates if the cached copy of the supplied file is up-to-date with its source.
+
+        :type filePath: str
+        :rtype: bool
+        """
+
+        with self._lock:
+
+            entry = self._entries.get(self.getKey(filePath), None)
+
+        if entry is None:
+
+            return False
+
+        try:
+
+            stat = os.stat(filePath)
+            localSize = os.path.getsize(entry['localPath'])
+
+        except OSError:
+
+            return False
+
+        return entry['size'] == stat.st_size == localSize and entry['mtime'] == stat.st_mtime
+
+    def pin(self, filePath):
+        """
+        Prevents the cached copy of the supplied file from being evicted.
+
+        :type filePath: str
+        :rtype: None
+        """
+
+        key = self.getKey(filePath)
+
+        with self._lock:
+
+            self._pinned[key] = self._pinned.get(key, 0) + 1
+
+    def unpin(self, filePath):
+        """
+        Allows the cached copy of the supplied file to be evicted again.
+
+        :type filePath: str
+        :rtype: None
+        """
+
+        key = self.getKey(filePath)
+
+        with self._lock:
+
+            count = self._pinned.get(key, 0) - 1
+
+            if count > 0:
+
+                self._pinned[key] = count
+
+            else:
+
+                self._pinned.pop(key, None)
+
+    def evict(self, reserve=0):
+        """
+        Evicts the least recently used copies until the supplied number of bytes can be reserved.
+        Pinned copies are never evicted.
+
+        :type reserve: int
+        :rtype: None
+        """
+
+        with self._lock:
+
+            usedBytes = self.usedBytes()
+            entries = sorted(self._entries.items(), key=lambda item: item[1]['accessed'])
+
+            for (key, entry) in entries:
+
+                # Check if cache is within budget
+                #
+                if (usedBytes + reserve) <= self.cacheSize:
+
+                    break
+
+                # Check if entry is in use
+                #
+                if key in self._pinned:
+
+                    continue
+
+                log.debug(f'Evicting cached file: {entry["localPath"]}')
+
+                try:
+
+                    os.remove(entry['localPath'])
+
+                except OSError:
+
+                    pass
+
+                del self._entries[key]
+                usedBytes -= entry['size']
+
+    def copy(self, filePath):
+        """
+        Copies the supplied file into the cache and returns the local path.
+        If the file does not fit inside the cache's budget then the original path is returned!
+
+        :type filePath: str
+        :rtype: str
+        """
+
+        # Make room for file
+        #
+        key = self.getKey(filePath)
+        stat = os.stat(filePath)
+
+        if stat.st_size > self.cacheSize:
+
+            return filePath
+
+        self.evict(reserve=stat.st_size)
+
+        # Copy file to temporary path before moving into place
+        #
+        localPath = self.getLocalPath(filePath)
+        temporaryPath = f'{localPath}.{uuid.uuid4().hex}'
+
+        os.makedirs(os.path.dirname(localPath), exist_ok=True)
+        checksum = uploadqueue.copyWithChecksum(filePath, temporaryPath)
+        os.replace(temporaryPath, localPath)
+
+        with self._lock:
+
+            self._entries[key] = {
+                'filePath': filePath,
+                'localPath': localPath,
+                'size': stat.st_size,
+                'mtime': stat.st_mtime,
+                'checksum': checksum,
+                'accessed': time.time()
+            }
+
+        return localPath
+
+    def fetch(self, filePath):
+        """
+        Returns the local copy of the supplied file, copying it into the cache if it is missing or out-of-date.
+
+        :type filePath: str
+        :rtype: str
+        """
+
+        # Check if cached copy is still valid
+        #
+        key = self.getKey(filePath)
+
+        if self.isValid(filePath):
+
+            with self._lock:
+
+                entry = self._entries[key]
+                entry['accessed'] = time.time()
+
+            localPath = entry['localPath']
+
+        else:
+
+            log.info(f'Caching file: {filePath}')
+            localPath = self.copy(filePath)
+
+        return localPath
+
+    def clear(self):
+        """
+        Removes every unpinned copy from the cache.
+
+        :rtype: None
+        """
+
+        self.evict(reserve=self.cacheSize + 1)
+        self.save()
+    # endregion
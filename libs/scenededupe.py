@@ -0,0 +1,94 @@
+import os
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from . import uploadqueue
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def getFileSize(filePath):
+    """
+    Returns the size of the supplied file.
+    If the file cannot be accessed then none is returned!
+
+    :type filePath: str
+    :rtype: Union[int, None]
+    """
+
+    try:
+
+        return os.path.getsize(filePath)
+
+    except OSError:
+
+        return None
+
+
+def getContentHash(filePath):
+    """
+    Returns the content hash for the supplied file.
+    If the file cannot be read then none is returned!
+
+    :type filePath: str
+    :rtype: Union[str, None]
+    """
+
+    try:
+
+        return uploadqueue.getChecksum(filePath)
+
+    except OSError as exception:
+
+        log.warning(f'Unable to hash file: {filePath} ({exception})')
+        return None
+
+
+def findDuplicates(*filePaths, threadCount=8):
+    """
+    Returns the duplicate files from the supplied queue.
+    The keys are the indices of the first file with any given content, and the values are the indices of every later file with identical content.
+    Only files that share their size with another file are hashed.
+
+    :type filePaths: Union[str, List[str]]
+    :type threadCount: int
+    :rtype: Dict[int, List[int]]
+    """
+
+    # Group files by size
+    # Files with a unique size cannot have any duplicates!
+    #
+    with ThreadPoolExecutor(max_workers=threadCount) as executor:
+
+        sizes = list(executor.map(getFileSize, filePaths))
+
+    groups = defaultdict(list)
+
+    for (i, size) in enumerate(sizes):
+
+        if size is not None:
+
+            groups[size].append(i)
+
+    candidates = [i for indices in groups.values() if len(indices) > 1 for i in indices]
+
+    # Group candidates by content
+    #
+    with ThreadPoolExecutor(max_workers=threadCount) as executor:
+
+        hashes = dict(zip(candidates, executor.map(getContentHash, [filePaths[i] for i in candidates])))
+
+    groups = defaultdict(list)
+
+    for i in sorted(candidates):
+
+        contentHash = hashes[i]
+
+        if contentHash is not None:
+
+            groups[(sizes[i], contentHash)].append(i)
+
+    return {indices[0]: indices[1:] for indices in groups.values() if len(indices) > 1}
@@ -0,0 +1,216 @@
+import os
+import shlex
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+BINARY_HEADER_SIZE = 1048576
+BINARY_REFERENCE_TAG = b'FREF'
+SCENE_EXTENSIONS = ('.ma', '.mb')
+
+
+def iterAsciiStatements(filePath):
+    """
+    Returns a generator that yields the header statements from the supplied Maya ASCII file.
+    Statements that span multiple lines are joined together and the generator stops at the first `createNode` statement.
+
+    :type filePath: str
+    :rtype: Iterator[str]
+    """
+
+    with open(filePath, 'r', encoding='utf-8', errors='replace') as file:
+
+        statement = ''
+
+        for line in file:
+
+            # Check if this is a comment
+            #
+            stripped = line.strip()
+
+            if stripped.startswith('//') or len(stripped) == 0:
+
+                continue
+
+            # Check if we've reached the end of the header
+            #
+            if len(statement) == 0 and stripped.startswith('createNode'):
+
+                break
+
+            # Check if statement is complete
+            #
+            statement = f'{statement} {stripped}' if len(statement) > 0 else stripped
+
+            if statement.endswith(';'):
+
+                yield statement[:-1]
+                statement = ''
+
+
+def splitStatement(statement):
+    """
+    Splits the supplied MEL statement into its arguments.
+
+    :type statement: str
+    :rtype: List[str]
+    """
+
+    try:
+
+        return shlex.split(statement, posix=True)
+
+    except ValueError:
+
+        return statement.split(' ')
+
+
+def getFlag(args, flag, default=None):
+    """
+    Returns the value of the supplied flag from the statement arguments.
+
+    :type args: List[str]
+    :type flag: str
+    :type default: Any
+    :rtype: Union[str, Any]
+    """
+
+    try:
+
+        index = args.index(flag)
+        return args[index + 1] if (index + 1) < (len(args) - 1) else default
+
+    except ValueError:
+
+        return default
+
+
+def iterAsciiReferences(filePath, nested=False):
+    """
+    Returns a generator that yields the top-level references from the supplied Maya ASCII file.
+    Each reference is represented by a dictionary containing its path, namespace, reference node and deferred state.
+    If nested is enabled then the `-rdi` statements used to restore nested references are yielded as well.
+
+    :type filePath: str
+    :type nested: bool
+    :rtype: Iterator[dict]
+    """
+
+    for statement in iterAsciiStatements(filePath):
+
+        args = splitStatement(statement)
+
+        if len(args) >= 2 and args[0] == 'file' and ('-r' in args or (nested and '-rdi' in args)):
+
+            yield {
+                'path': args[-1],
+                'namespace': getFlag(args, '-ns', ''),
+                'referenceNode': getFlag(args, '-rfn', ''),
+                'deferred': getFlag(args, '-dr', '0') == '1'
+            }
+
+
+def iterAsciiReferencePaths(filePath, nested=False):
+    """
+    Returns a generator that yields the top-level reference paths from the supplied Maya ASCII file.
+    If nested is enabled then the paths of any nested references are yielded as well.
+
+    :type filePath: str
+    :type nested: bool
+    :rtype: Iterator[str]
+    """
+
+    for reference in iterAsciiReferences(filePath, nested=nested):
+
+        yield reference['path']
+
+
+def iterBinaryReferencePaths(filePath):
+    """
+    Returns a generator that yields the reference paths from the supplied Maya binary file.
+    Rather than walking the IFF structure this scans the file header for reference chunks.
+
+    :type filePath: str
+    :rtype: Iterator[str]
+    """
+
+    with open(filePath, 'rb') as file:
+
+        data = file.read(BINARY_HEADER_SIZE)
+
+    start = data.find(BINARY_REFERENCE_TAG)
+
+    while start != -1:
+
+        chunk = data[start + len(BINARY_REFERENCE_TAG):start + 4096]
+
+        for string in chunk.split(b'\x00'):
+
+            path = string.decode('utf-8', errors='ignore').strip()
+
+            if path.lower().endswith(SCENE_EXTENSIONS):
+
+                yield path
+                break
+
+        start = data.find(BINARY_REFERENCE_TAG, start + 1)
+
+
+def iterReferencePaths(filePath):
+    """
+    Returns a generator that yields the reference paths from the supplied scene file without opening it.
+    Any environment variables are expanded and duplicate paths are omitted.
+
+    :type filePath: str
+    :rtype: Iterator[str]
+    """
+
+    # Evaluate file extension
+    #
+    extension = os.path.splitext(filePath)[-1].lower()
+
+    if extension == '.ma':
+
+        iterator = iterAsciiReferencePaths(filePath)
+
+    elif extension == '.mb':
+
+        iterator = iterBinaryReferencePaths(filePath)
+
+    else:
+
+        return
+
+    # Yield unique paths
+    #
+    visited = set()
+
+    try:
+
+        for path in iterator:
+
+            path = os.path.normpath(os.path.expandvars(path))
+
+            if path not in visited:
+
+                visited.add(path)
+                yield path
+
+    except OSError as exception:
+
+        log.warning(f'Unable to read scene header: {filePath} ({exception})')
+
+
+def hasRelativeReferences(filePath):
+    """
+    Evaluates if the supplied scene file references any files through relative paths.
+    Copies of these scene files cannot be opened from another directory since their references would no longer resolve!
+
+    :type filePath: str
+    :rtype: bool
+    """
+
+    return any(not os.path.isabs(path) for path in iterReferencePaths(filePath))
@@ -0,0 +1,537 @@
+import os
+import re
+import sys
+import json
+import sqlite3
+import argparse
+
+from fnmatch import fnmatch
+from concurrent.futures import ThreadPoolExecutor
+from . import asciiscene, sceneheader
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    startTime REAL,
+    endTime REAL,
+    exportRangeCount INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS sceneReferences (
+    scene TEXT NOT NULL REFERENCES scenes(path) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    namespace TEXT NOT NULL DEFAULT '',
+    referenceNode TEXT NOT NULL DEFAULT '',
+    deferred INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS fileInfo (
+    scene TEXT NOT NULL REFERENCES scenes(path) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS sceneReferencesByPath ON sceneReferences(path);
+CREATE INDEX IF NOT EXISTS sceneReferencesByScene ON sceneReferences(scene);
+CREATE INDEX IF NOT EXISTS fileInfoByScene ON fileInfo(scene);
+CREATE INDEX IF NOT EXISTS fileInfoByKey ON fileInfo(key);
+"""
+
+FRAME_RANGE_SCAN_SIZE = 1048576
+PLAYBACK_PATTERN = re.compile(rb'playbackOptions\s+(.*?)"\s*;', re.DOTALL)
+PLAYBACK_FLAG_PATTERN = re.compile(rb'-(min|max|ast|aet)\s+(-?[\d.]+)')
+
+
+def normalizePath(path, directory=None):
+    """
+    Returns the normalized form of the supplied path for storage and comparison.
+    If a directory is supplied then relative paths are resolved against it rather than the working directory.
+
+    :type path: str
+    :type directory: Union[str, None]
+    :rtype: str
+    """
+
+    path = os.path.expandvars(path)
+
+    if directory is not None and not os.path.isabs(path):
+
+        path = os.path.join(directory, path)
+
+    return os.path.normcase(os.path.normpath(os.path.abspath(path)))
+
+
+def getRootPrefix(root):
+    """
+    Returns the normalized prefix shared by every path under the supplied root.
+
+    :type root: str
+    :rtype: str
+    """
+
+    return normalizePath(root).rstrip(os.sep) + os.sep
+
+
+def countExportRanges(value):
+    """
+    Returns the number of export ranges from the supplied `fbxSequencers` fileInfo value.
+
+    :type value: str
+    :rtype: int
+    """
+
+    try:
+
+        data = json.loads(value)
+
+    except ValueError:
+
+        return 0
+
+    def count(obj):
+
+        if isinstance(obj, dict):
+
+            return sum((len(item) if (key == 'exportRanges' and isinstance(item, list)) else count(item)) for (key, item) in obj.items())
+
+        elif isinstance(obj, list):
+
+            return sum(count(item) for item in obj)
+
+        else:
+
+            return 0
+
+    return count(data)
+
+
+def readFrameRange(filePath, scanSize=FRAME_RANGE_SCAN_SIZE):
+    """
+    Returns the animation range from the supplied Maya ASCII file's scene configuration.
+    Only the first and last bytes of the file, up to the scan size, are searched so large scenes are never read in full.
+    If no range is found then none is returned for both values!
+
+    :type filePath: str
+    :type scanSize: int
+    :rtype: Tuple[Union[float, None], Union[float, None]]
+    """
+
+    with open(filePath, 'rb') as file:
+
+        # Collect the head and tail of the file
+        # The scene configuration is usually written towards the end of the file!
+        #
+        chunks = [file.read(scanSize)]
+        fileSize = os.fstat(file.fileno()).st_size
+
+        if fileSize > scanSize:
+
+            file.seek(max(scanSize, fileSize - scanSize))
+            chunks.append(file.read(scanSize))
+
+    for chunk in reversed(chunks):
+
+        match = PLAYBACK_PATTERN.search(chunk)
+
+        if match is None:
+
+            continue
+
+        flags = {key: float(value) for (key, value) in PLAYBACK_FLAG_PATTERN.findall(match.group(1))}
+        return flags.get(b'ast', flags.get(b'min', None)), flags.get(b'aet', flags.get(b'max', None))
+
+    return None, None
+
+
+def readScene(filePath, includeFrameRange=True):
+    """
+    Returns the metadata for the supplied scene file without opening it.
+
+    :type filePath: str
+    :type includeFrameRange: bool
+    :rtype: dict
+    """
+
+    stat = os.stat(filePath)
+    extension = os.path.splitext(filePath)[-1].lower()
+    directory = os.path.dirname(os.path.abspath(filePath))
+
+    record = {
+        'path': normalizePath(filePath),
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'startTime': None,
+        'endTime': None,
+        'exportRangeCount': 0,
+        'references': [],
+        'fileInfo': {}
+    }
+
+    if extension == '.ma':
+
+        # Read header statements
+        #
+        scene = asciiscene.AsciiScene(filePath)
+
+        for reference in scene.iterReferences():
+
+            record['references'].append({
+                'path': normalizePath(reference['path'], directory=directory),
+                'namespace': reference['namespace'],
+                'referenceNode': reference['referenceNode'],
+                'deferred': reference['deferred']
+            })
+
+        for statement in scene.header:
+
+            match = asciiscene.FILE_INFO_PATTERN.match(statement)
+
+            if match is not None:
+
+                record['fileInfo'][asciiscene.unquote(match.group(1))] = asciiscene.unquote(match.group(2))
+
+        record['exportRangeCount'] = countExportRanges(record['fileInfo'].get('fbxSequencers', '[]'))
+
+        # Check if frame range should be read
+        #
+        if includeFrameRange:
+
+            record['startTime'], record['endTime'] = readFrameRange(filePath)
+
+    elif extension == '.mb':
+
+        for path in sceneheader.iterBinaryReferencePaths(filePath):
+
+            record['references'].append({'path': normalizePath(path, directory=directory), 'namespace': '', 'referenceNode': '', 'deferred': False})
+
+    return record
+
+
+class SceneIndex(object):
+    """
+    Class used to maintain an SQLite index of scene file metadata.
+    Scenes are read without opening the DCC and only scenes that changed since the last crawl are re-read.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_databasePath', '_connection')
+
+    def __init__(self, databasePath):
+        """
+        Private method called after a new instance is created.
+
+        :type databasePath: str
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SceneIndex, self).__init__()
+
+        # Declare private variables
+        #
+        self._databasePath = os.path.abspath(os.path.expandvars(databasePath))
+        self._connection = sqlite3.connect(self._databasePath)
+
+        # Initialize schema
+        #
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        self._connection.executescript(SCHEMA)
+        self._connection.create_function('FNMATCH', 2, lambda string, pattern: int(fnmatch(string or '', pattern)))
+    # endregion
+
+    # region Properties
+    @property
+    def databasePath(self):
+        """
+        Getter method that returns the database path.
+
+        :rtype: str
+        """
+
+        return self._databasePath
+
+    @property
+    def connection(self):
+        """
+        Getter method that returns the database connection.
+
+        :rtype: sqlite3.Connection
+        """
+
+        return self._connection
+    # endregion
+
+    # region Methods
+    def close(self):
+        """
+        Closes the database connection.
+
+        :rtype: None
+        """
+
+        self._connection.close()
+
+    def iterSceneFiles(self, root, failures=None):
+        """
+        Returns a generator that yields every scene file under the supplied root.
+        If a list of failures is supplied then any directories that could not be scanned are appended to it.
+
+        :type root: str
+        :type failures: Union[List[str], None]
+        :rtype: Iterator[str]
+        """
+
+        directories = [root]
+
+        while len(directories) > 0:
+
+            directory = directories.pop()
+
+            try:
+
+                with os.scandir(directory) as entries:
+
+                    for entry in entries:
+
+                        if entry.is_dir(follow_symlinks=False):
+
+                            directories.append(entry.path)
+
+                        elif entry.name.lower().endswith(sceneheader.SCENE_EXTENSIONS):
+
+                            yield entry.path
+
+            except OSError as exception:
+
+                log.warning(f'Unable to scan directory: {directory} ({exception})')
+
+                if failures is not None:
+
+                    failures.append(directory)
+
+    def isIndexed(self, filePath):
+        """
+        Evaluates if the supplied scene file is indexed and up-to-date.
+
+        :type filePath: str
+        :rtype: bool
+        """
+
+        row = self._connection.execute('SELECT size, mtime FROM scenes WHERE path = ?', (normalizePath(filePath),)).fetchone()
+
+        if row is None:
+
+            return False
+
+        try:
+
+            stat = os.stat(filePath)
+            return row[0] == stat.st_size and row[1] == stat.st_mtime
+
+        except OSError:
+
+            return False
+
+    def update(self, record):
+        """
+        Inserts or replaces the supplied scene record.
+
+        :type record: dict
+        :rtype: None
+        """
+
+        path = record['path']
+
+        self._connection.execute('DELETE FROM scenes WHERE path = ?', (path,))
+        self._connection.execute(
+            'INSERT INTO scenes (path, size, mtime, startTime, endTime, exportRangeCount) VALUES (?, ?, ?, ?, ?, ?)',
+            (path, record['size'], record['mtime'], record['startTime'], record['endTime'], record['exportRangeCount'])
+        )
+
+        self._connection.executemany(
+            'INSERT INTO sceneReferences (scene, path, namespace, referenceNode, deferred) VALUES (?, ?, ?, ?, ?)',
+            [(path, reference['path'], reference['namespace'], reference['referenceNode'], int(reference['deferred'])) for reference in record['references']]
+        )
+
+        self._connection.executemany(
+            'INSERT INTO fileInfo (scene, key, value) VALUES (?, ?, ?)',
+            [(path, key, value) for (key, value) in record['fileInfo'].items()]
+        )
+
+    def remove(self, *filePaths):
+        """
+        Removes the supplied scene files from the index.
+
+        :type filePaths: Union[str, List[str]]
+        :rtype: None
+        """
+
+        self._connection.executemany('DELETE FROM scenes WHERE path = ?', [(normalizePath(filePath),) for filePath in filePaths])
+        self._connection.commit()
+
+    def crawl(self, root, threadCount=8, includeFrameRange=True):
+        """
+        Indexes every scene file under the supplied root.
+        Unchanged scenes are skipped and any scenes that no longer exist are removed.
+        Scenes under directories that could not be scanned are kept since their absence proves nothing.
+
+        :type root: str
+        :type threadCount: int
+        :type includeFrameRange: bool
+        :rtype: int
+        """
+
+        # Collect changed scene files
+        #
+        root = os.path.abspath(os.path.expandvars(root))
+        failures = []
+        filePaths = list(self.iterSceneFiles(root, failures=failures))
+
+        existing = set(map(normalizePath, filePaths))
+        pending = [filePath for filePath in filePaths if not self.isIndexed(filePath)]
+
+        log.info(f'Indexing {len(pending)} of {len(filePaths)} scene file(s) under: {root}')
+
+        # Read scene files in parallel and write from this thread
+        #
+        def read(filePath):
+
+            try:
+
+                return readScene(filePath, includeFrameRange=includeFrameRange)
+
+            except OSError as exception:
+
+                log.warning(f'Unable to index scene file: {filePath} ({exception})')
+                return None
+
+        with ThreadPoolExecutor(max_workers=threadCount) as executor:
+
+            for record in executor.map(read, pending):
+
+                if record is not None:
+
+                    self.update(record)
+
+        # Remove deleted scene files
+        # Paths are compared by prefix since LIKE treats underscores as wildcards and ignores case!
+        #
+        prefix = getRootPrefix(root)
+        indexed = [row[0] for row in self._connection.execute('SELECT path FROM scenes WHERE substr(path, 1, length(?)) = ?', (prefix, prefix))]
+
+        skipped = tuple(getRootPrefix(directory) for directory in failures)
+        deleted = [path for path in indexed if path not in existing and not path.startswith(skipped)]
+
+        self._connection.executemany('DELETE FROM scenes WHERE path = ?', [(path,) for path in deleted])
+        self._connection.commit()
+
+        return len(pending)
+
+    def query(self, reference=None, namespace=None, fileInfoKey=None, minExportRanges=None, root=None):
+        """
+        Returns the indexed scene files that match the supplied criteria.
+        References and namespaces support wildcard patterns.
+
+        :type reference: Union[str, None]
+        :type namespace: Union[str, None]
+        :type fileInfoKey: Union[str, None]
+        :type minExportRanges: Union[int, None]
+        :type root: Union[str, None]
+        :rtype: List[str]
+        """
+
+        clauses, parameters = [], []
+
+        if reference is not None:
+
+            clauses.append('path IN (SELECT scene FROM sceneReferences WHERE FNMATCH(path, ?))')
+            parameters.append(os.path.normcase(reference))
+
+        if namespace is not None:
+
+            clauses.append('path IN (SELECT scene FROM sceneReferences WHERE FNMATCH(namespace, ?))')
+            parameters.append(namespace)
+
+        if fileInfoKey is not None:
+
+            clauses.append('path IN (SELECT scene FROM fileInfo WHERE key = ?)')
+            parameters.append(fileInfoKey)
+
+        if minExportRanges is not None:
+
+            clauses.append('exportRangeCount >= ?')
+            parameters.append(minExportRanges)
+
+        if root is not None:
+
+            prefix = getRootPrefix(root)
+
+            clauses.append('substr(path, 1, length(?)) = ?')
+            parameters.extend([prefix, prefix])
+
+        where = f' WHERE {" AND ".join(clauses)}' if len(clauses) > 0 else ''
+        return [row[0] for row in self._connection.execute(f'SELECT path FROM scenes{where} ORDER BY path', parameters)]
+    # endregion
+
+
+def main(argv=None):
+    """
+    Crawls or queries a scene index from the command line.
+    Query results are printed one path per line so they can be piped into a queue.
+
+    :type argv: Union[List[str], None]
+    :rtype: int
+    """
+
+    # Parse command line arguments
+    #
+    parser = argparse.ArgumentParser(description='Maintains an index of scene file metadata.')
+    parser.add_argument('database', help='The SQLite index to use.')
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    crawlParser = subparsers.add_parser('crawl', help='Indexes every scene file under a root directory.')
+    crawlParser.add_argument('root', help='The root directory to crawl.')
+    crawlParser.add_argument('--threads', type=int, default=8, help='The number of files to read in parallel.')
+    crawlParser.add_argument('--skipFrameRange', action='store_true', help='Skips scanning each file for its frame range.')
+
+    queryParser = subparsers.add_parser('query', help='Prints the indexed scene files that match the supplied criteria.')
+    queryParser.add_argument('--reference', default=None, help='A wildcard pattern for referenced file paths.')
+    queryParser.add_argument('--namespace', default=None, help='A wildcard pattern for reference namespaces.')
+    queryParser.add_argument('--fileInfo', default=None, help='A fileInfo key the scene must define.')
+    queryParser.add_argument('--minExportRanges', type=int, default=None, help='The minimum number of export ranges.')
+    queryParser.add_argument('--root', default=None, help='A directory the scene must reside under.')
+
+    args = parser.parse_args(argv)
+
+    # Execute command
+    #
+    index = SceneIndex(args.database)
+
+    try:
+
+        if args.command == 'crawl':
+
+            index.crawl(args.root, threadCount=args.threads, includeFrameRange=not args.skipFrameRange)
+
+        else:
+
+            filePaths = index.query(reference=args.reference, namespace=args.namespace, fileInfoKey=args.fileInfo, minExportRanges=args.minExportRanges, root=args.root)
+            sys.stdout.write(''.join(f'{filePath}\n' for filePath in filePaths))
+
+    finally:
+
+        index.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
@@ -0,0 +1,51 @@
+import os
+
+from dcc import __application__, DCC
+
+if __application__ == DCC.MAYA:
+
+    from maya import cmds as mc
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+FILE_TYPES = {'.ma': 'mayaAscii', '.mb': 'mayaBinary'}
+
+
+def isRenamable():
+    """
+    Evaluates if the current application supports renaming the open scene file without saving it.
+
+    :rtype: bool
+    """
+
+    return __application__ == DCC.MAYA
+
+
+def renameScene(filePath):
+    """
+    Renames the open scene file without saving it.
+    This is used to restore the real location of scene files that were opened or saved from a local copy.
+    The scene's file type is also updated to match the new extension.
+
+    :type filePath: str
+    :rtype: bool
+    """
+
+    if not isRenamable():
+
+        return False
+
+    mc.file(rename=filePath)
+
+    extension = os.path.splitext(filePath)[-1].lower()
+    fileType = FILE_TYPES.get(extension, None)
+
+    if fileType is not None:
+
+        mc.file(type=fileType)
+
+    return True
@@ -0,0 +1,201 @@
+import os
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class SidecarResolver(object):
+    """
+    Class used to locate sidecar files, such as animation files, that share a scene file's name.
+    Each directory is indexed once with a single `scandir` call and any further queries are answered from memory.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_directories',)
+
+    def __init__(self):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SidecarResolver, self).__init__()
+
+        # Declare private variables
+        #
+        self._directories = {}
+    # endregion
+
+    # region Methods
+    @staticmethod
+    def normalizeDirectory(directory):
+        """
+        Returns the normalized form of the supplied directory.
+
+        :type directory: str
+        :rtype: str
+        """
+
+        return os.path.normcase(os.path.abspath(os.path.expandvars(directory)))
+
+    @staticmethod
+    def getSidecarName(filePath, extension):
+        """
+        Returns the sidecar filename for the supplied scene file.
+
+        :type filePath: str
+        :type extension: str
+        :rtype: str
+        """
+
+        name = os.path.splitext(os.path.basename(filePath))[0]
+        return f'{name}{extension}'
+
+    def scanDirectory(self, directory):
+        """
+        Returns the indexed entries for the supplied directory.
+        The directory is only scanned the first time it is requested.
+
+        :type directory: str
+        :rtype: Dict[str, os.DirEntry]
+        """
+
+        key = self.normalizeDirectory(directory)
+        entries = self._directories.get(key)
+
+        if entries is not None:
+
+            return entries
+
+        entries = {}
+
+        try:
+
+            with os.scandir(key) as iterator:
+
+                for entry in iterator:
+
+                    entries[os.path.normcase(entry.name)] = entry
+
+        except OSError as exception:
+
+            log.debug(f'Unable to scan directory: {directory} ({exception})')
+
+        self._directories[key] = entries
+        return entries
+
+    def iterSearchDirectories(self, filePath, roots=()):
+        """
+        Returns a generator that yields the directories to search for the supplied scene file's sidecars.
+        Any sidecar roots are searched before the scene file's own directory.
+
+        :type filePath: str
+        :type roots: Sequence[str]
+        :rtype: Iterator[str]
+        """
+
+        for root in roots:
+
+            if root:
+
+                yield root
+
+        yield os.path.dirname(os.path.abspath(filePath))
+
+    def find(self, filePath, extension, roots=()):
+        """
+        Returns the path to the sidecar file for the supplied scene file.
+        If no sidecar exists then none is returned!
+
+        :type filePath: str
+        :type extension: str
+        :type roots: Sequence[str]
+        :rtype: Union[str, None]
+        """
+
+        key = os.path.normcase(self.getSidecarName(filePath, extension))
+
+        for directory in self.iterSearchDirectories(filePath, roots=roots):
+
+            entry = self.scanDirectory(directory).get(key)
+
+            if entry is not None and entry.is_file():
+
+                return entry.path
+
+        return None
+
+    def exists(self, filePath, extension, roots=()):
+        """
+        Evaluates if a sidecar file exists for the supplied scene file.
+
+        :type filePath: str
+        :type extension: str
+        :type roots: Sequence[str]
+        :rtype: bool
+        """
+
+        return self.find(filePath, extension, roots=roots) is not None
+
+    def getModifiedTime(self, filePath, extension, roots=()):
+        """
+        Returns the modification time of the sidecar file for the supplied scene file.
+        If no sidecar exists then none is returned!
+
+        :type filePath: str
+        :type extension: str
+        :type roots: Sequence[str]
+        :rtype: Union[float, None]
+        """
+
+        key = os.path.normcase(self.getSidecarName(filePath, extension))
+
+        for directory in self.iterSearchDirectories(filePath, roots=roots):
+
+            entry = self.scanDirectory(directory).get(key)
+
+            if entry is not None and entry.is_file():
+
+                return entry.stat().st_mtime
+
+        return None
+
+    def getOutputPath(self, filePath, extension, roots=()):
+        """
+        Returns the path a new sidecar file should be written to for the supplied scene file.
+        Sidecars are written to the first sidecar root, or next to the scene file if there are none.
+
+        :type filePath: str
+        :type extension: str
+        :type roots: Sequence[str]
+        :rtype: str
+        """
+
+        directory = next(self.iterSearchDirectories(filePath, roots=roots))
+        return os.path.join(os.path.abspath(os.path.expandvars(directory)), self.getSidecarName(filePath, extension))
+
+    def invalidate(self, filePath):
+        """
+        Removes the index for the directory that contains the supplied file.
+        This should be called after writing a sidecar so the next query rescans its directory.
+
+        :type filePath: str
+        :rtype: None
+        """
+
+        self._directories.pop(self.normalizeDirectory(os.path.dirname(os.path.abspath(filePath))), None)
+
+    def clear(self):
+        """
+        Removes every directory index.
+
+        :rtype: None
+        """
+
+        self._directories.clear()
+    # endregion
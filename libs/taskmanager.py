@@ -1,12 +1,15 @@
 import os
 import time
+import sqlite3
 import weakref
 
+from contextlib import contextmanager, nullcontext
 from dcc import fnscene
 from dcc.collections import notifylist
 from dcc.json import psonobject
 from dcc.perforce import p4utils
-from . import taskfactory
+from dcc.python import stringutils
+from . import taskfactory, asciiscene, chrometrace, fbxassetcache, fbxmanifest, referenceutils, sceneheader, scenededupe, sceneutils, sidecarresolver, uploadqueue, workerpool
 from ..tasks.abstract import abstracttask
 
 import logging
@@ -41,13 +44,28 @@ class TaskManager(psonobject.PSONObject):
         '_scene',
         '_tasks',
         '_factory',
+        '_uploads',
+        '_sidecars',
+        '_aliases',
         '_currentTask',
         '_currentFilePath',
         '_currentDirectory',
         '_currentFilename',
         '_currentName',
         '_currentExtension',
-        '_currentIndex'
+        '_currentIndex',
+        '_referenceStates',
+        '_touchedReferences',
+        '_currentDirty',
+        '_currentOptions',
+        '_currentResults',
+        '_currentTimings',
+        '_referencesDeferred',
+        '_executedTasks',
+        '_sessionTasks',
+        '_trace',
+        '_profiler',
+        '_memoryTracker'
     )
 
     def __init__(self, *args, **kwargs):
@@ -62,6 +80,9 @@ class TaskManager(psonobject.PSONObject):
         self._scene = fnscene.FnScene()
         self._tasks = notifylist.NotifyList()
         self._factory = taskfactory.TaskFactory.getInstance(asWeakReference=True)
+        self._uploads = uploadqueue.UploadQueue()
+        self._sidecars = sidecarresolver.SidecarResolver()
+        self._aliases = {}
 
         self._currentTask = None
         self._currentFilePath = None
@@ -70,6 +91,18 @@ class TaskManager(psonobject.PSONObject):
         self._currentName = None
         self._currentExtension = None
         self._currentIndex = None
+        self._referenceStates = {}
+        self._touchedReferences = set()
+        self._currentOptions = {}
+        self._currentResults = {}
+        self._currentTimings = {}
+        self._currentDirty = False
+        self._referencesDeferred = False
+        self._executedTasks = set()
+        self._sessionTasks = set()
+        self._trace = None
+        self._profiler = None
+        self._memoryTracker = None
 
         # Setup notifies
         #
@@ -102,6 +135,48 @@ class TaskManager(psonobject.PSONObject):
 
         return self._factory()
 
+    @property
+    def uploads(self):
+        """
+        Getter method that returns the background upload queue.
+
+        :rtype: uploadqueue.UploadQueue
+        """
+
+        return self._uploads
+
+    @property
+    def sidecars(self):
+        """
+        Getter method that returns the sidecar resolver for the current batch.
+
+        :rtype: sidecarresolver.SidecarResolver
+        """
+
+        return self._sidecars
+
+    @property
+    def trace(self):
+        """
+        Getter method that returns the trace spans are recorded to.
+        If no trace is being recorded then none is returned!
+
+        :rtype: Union[chrometrace.ChromeTrace, None]
+        """
+
+        return self._trace
+
+    @trace.setter
+    def trace(self, trace):
+        """
+        Setter method that updates the trace spans are recorded to.
+
+        :type trace: Union[chrometrace.ChromeTrace, None]
+        :rtype: None
+        """
+
+        self._trace = trace
+
     @property
     def tasks(self):
         """
@@ -193,17 +268,715 @@ class TaskManager(psonobject.PSONObject):
         """
 
         return self._currentIndex
+
+    @property
+    def currentOptions(self):
+        """
+        Getter method that returns the options supplied with the current file's request.
+        These are never serialized with the tasks and are only used internally, such as by fan-out workers.
+
+        :rtype: Dict[str, Any]
+        """
+
+        return self._currentOptions
+
+    @property
+    def currentResults(self):
+        """
+        Getter method that returns the results reported by tasks for the current file.
+        These results are included in the file's record when executed by a worker.
+
+        :rtype: Dict[str, Any]
+        """
+
+        return self._currentResults
+
+    @property
+    def currentTimings(self):
+        """
+        Getter method that returns the seconds spent in each task class for the current file.
+
+        :rtype: Dict[str, float]
+        """
+
+        return self._currentTimings
     # endregion
 
     # region Methods
-    def execute(self, *filePaths, checkout=False, preCallback=nullCallback, postCallback=nullCallback):
+    def span(self, name, category='', **kwargs):
+        """
+        Returns a context manager that records the time spent inside it to the current trace.
+        If no trace is being recorded then this does nothing.
+
+        :type name: str
+        :type category: str
+        :rtype: contextmanager
+        """
+
+        if self._trace is not None:
+
+            return self._trace.span(name, category, **kwargs)
+
+        else:
+
+            return nullcontext()
+
+    def profile(self, task):
+        """
+        Returns a context manager that profiles the supplied task's execution.
+        If no profiler is active then this does nothing.
+
+        :type task: abstracttask.AbstractTask
+        :rtype: contextmanager
+        """
+
+        if self._profiler is not None:
+
+            return self._profiler.profile(task)
+
+        else:
+
+            return nullcontext()
+
+    def measure(self, name):
+        """
+        Returns a context manager that records the memory delta of the code inside it under the supplied name.
+        If no memory tracker is active then this does nothing.
+
+        :type name: str
+        :rtype: contextmanager
+        """
+
+        if self._memoryTracker is not None:
+
+            return self._memoryTracker.measure(name)
+
+        else:
+
+            return nullcontext()
+
+    @contextmanager
+    def instrument(self, task, **kwargs):
+        """
+        Returns a context manager that times the supplied task's execution along with any active tracing, profiling or memory tracking.
+        Any keyword arguments are recorded with the task's trace span.
+
+        :type task: abstracttask.AbstractTask
+        :rtype: contextmanager
+        """
+
+        name = type(task).__name__
+
+        with self.measure(name), self.span(task.title, 'task', **kwargs), self.profile(task):
+
+            startTime = time.perf_counter()
+
+            try:
+
+                yield
+
+            finally:
+
+                self._currentTimings[name] = self._currentTimings.get(name, 0.0) + (time.perf_counter() - startTime)
+
+    def beginBatch(self):
+        """
+        Notifies the internal tasks that a new batch is about to begin.
+        Any sidecar directories indexed by a previous batch are discarded.
+
+        :rtype: None
+        """
+
+        self._executedTasks.clear()
+        self._sidecars.clear()
+
+        for task in self.tasks:
+
+            task.beginBatch()
+
+    def endBatch(self):
+        """
+        Notifies the internal tasks that the current batch has ended.
+        Any pending uploads are waited on before the batch is considered complete.
+        If any uploads failed then an error listing their destinations is raised once the tasks have been notified.
+
+        :rtype: None
+        """
+
+        with self.span('uploads', 'io'):
+
+            failures = self.uploads.join()
+
+        for task in self.tasks:
+
+            task.endBatch()
+
+        self._aliases.clear()
+        self._currentTask = None
+
+        # Check if any uploads failed
+        # Their files were already reported as processed so the batch must fail instead!
+        #
+        if len(failures) == 0:
+
+            return
+
+        for (source, destination) in failures:
+
+            log.error(f'Failed to upload: {destination} (staged copy retained at: {source})')
+
+        raise RuntimeError(f'endBatch() {len(failures)} upload(s) failed: {", ".join(destination for (source, destination) in failures)}')
+
+    def isTaskPending(self, task):
+        """
+        Evaluates if the supplied task should be executed on the current file.
+        Tasks that are scoped per batch or per session are only executed once.
+        Sessions last as long as this task manager, and each task instance is tracked separately so differently configured tasks still run.
+
+        :type task: abstracttask.AbstractTask
+        :rtype: bool
+        """
+
+        if task.scope == abstracttask.Scope.PerBatch:
+
+            return id(task) not in self._executedTasks
+
+        elif task.scope == abstracttask.Scope.PerSession:
+
+            return id(task) not in self._sessionTasks
+
+        else:
+
+            return True
+
+    def markTaskExecuted(self, task):
+        """
+        Marks the supplied task as executed for the current batch and session.
+
+        :type task: abstracttask.AbstractTask
+        :rtype: None
+        """
+
+        self._executedTasks.add(id(task))
+
+        if task.scope == abstracttask.Scope.PerSession:
+
+            self._sessionTasks.add(id(task))
+
+    def addAlias(self, localPath, filePath):
+        """
+        Registers the supplied local path as a stand-in for the real file path.
+        This allows tasks to resolve the real location of scene files that were opened or saved locally.
+
+        :type localPath: str
+        :type filePath: str
+        :rtype: None
+        """
+
+        self._aliases[os.path.normcase(os.path.abspath(localPath))] = filePath
+
+    def resolveAlias(self, path):
+        """
+        Returns the real file path for the supplied path.
+        If the path is not a registered stand-in then it is returned unchanged.
+
+        :type path: str
+        :rtype: str
+        """
+
+        return self._aliases.get(os.path.normcase(os.path.abspath(path)), path)
+
+    def isDirty(self):
+        """
+        Evaluates if any of the executed tasks have modified the current file.
+
+        :rtype: bool
+        """
+
+        return self._currentDirty
+
+    def markDirty(self):
+        """
+        Marks the current file as modified.
+
+        :rtype: None
+        """
+
+        self._currentDirty = True
+
+    def markReferencesTouched(self, *referenceNodes):
+        """
+        Marks the supplied reference nodes as explicitly loaded or unloaded by a task.
+        Touched references keep their current load state when the scene is saved.
+
+        :type referenceNodes: Union[str, List[str]]
+        :rtype: None
+        """
+
+        self._touchedReferences.update(referenceNodes)
+
+    def restoreReferences(self):
+        """
+        Restores the on-disk load state of any deferred references that no task explicitly touched.
+        This should be called before saving so the original reference load states are preserved.
+
+        :rtype: List[str]
+        """
+
+        return referenceutils.restoreReferenceStates(self._referenceStates, exclude=self._touchedReferences)
+
+    def openScene(self, filePath, deferReferences=False):
+        """
+        Opens the supplied scene file.
+        If references are deferred then they will remain unloaded until a task requires them.
+        The on-disk load states are recorded so they can be restored before saving.
+
+        :type filePath: str
+        :type deferReferences: bool
+        :rtype: None
+        """
+
+        self._referenceStates = {}
+        self._touchedReferences = set()
+
+        if deferReferences and referenceutils.isDeferrable():
+
+            log.info(f'Opening scene file with deferred references: {filePath}')
+            self._referenceStates = referenceutils.getReferenceStates(filePath)
+            referenceutils.openSceneWithoutReferences(filePath)
+
+        else:
+
+            log.info(f'Opening scene file: {filePath}')
+            self.scene.open(filePath)
+
+    def openLocalScene(self, filePath, localPath=None, deferReferences=False):
+        """
+        Opens the supplied scene file from its local copy, if one exists.
+        The open scene is then renamed back to its real path so any outputs are written to the correct location.
+        Scene files with relative references are always opened from their real path since the copy's references would not resolve.
+
+        :type filePath: str
+        :type localPath: Union[str, None]
+        :type deferReferences: bool
+        :rtype: None
+        """
+
+        # Check if a local copy was supplied
+        #
+        if stringutils.isNullOrEmpty(localPath) or localPath == filePath or sceneheader.hasRelativeReferences(filePath):
+
+            self.openScene(filePath, deferReferences=deferReferences)
+            return
+
+        # Open local copy and restore real path
+        #
+        self.openScene(localPath, deferReferences=deferReferences)
+        self.addAlias(localPath, filePath)
+
+        sceneutils.renameScene(filePath)
+
+    def setCurrentFile(self, filePath, index, options=None):
+        """
+        Updates the current file being processed.
+
+        :type filePath: str
+        :type index: int
+        :type options: Union[Dict[str, Any], None]
+        :rtype: None
+        """
+
+        self._currentFilePath = os.path.abspath(filePath)
+        self._currentDirectory = os.path.dirname(self._currentFilePath)
+        self._currentFilename = os.path.basename(self._currentFilePath)
+        self._currentName, self._currentExtension = os.path.splitext(self._currentFilename)
+        self._currentIndex = index
+        self._currentTask = None
+        self._currentOptions = dict(options) if options else {}
+        self._currentResults = {}
+        self._currentTimings = {}
+        self._currentDirty = False
+        self._referencesDeferred = False
+        self._referenceStates = {}
+        self._touchedReferences = set()
+
+    def loadAsciiScene(self, filePath):
+        """
+        Returns an editable ASCII scene for the supplied file.
+        If the file is not a Maya ASCII file, or cannot be read, then none is returned!
+
+        :type filePath: str
+        :rtype: Union[asciiscene.AsciiScene, None]
+        """
+
+        if os.path.splitext(filePath)[-1].lower() != '.ma':
+
+            return None
+
+        try:
+
+            return asciiscene.AsciiScene(filePath)
+
+        except OSError as exception:
+
+            log.warning(f'Unable to read scene file: {filePath} ({exception})')
+            return None
+
+    def isApplicable(self, filePath):
+        """
+        Evaluates if any pending task would do anything to the supplied file before it is opened.
+        Files are only rejected when at least one task declines them and no other task accepts them.
+
+        :type filePath: str
+        :rtype: bool
+        """
+
+        results = [task.isApplicable(filePath) for task in self.tasks if self.isTaskPending(task)]
+        return any(result is True for result in results) or not any(result is False for result in results)
+
+    def isContentOnly(self):
+        """
+        Evaluates if every task's results only depend on the scene's contents and output paths.
+
+        :rtype: bool
+        """
+
+        return len(self.tasks) > 0 and all(task.contentOnly for task in self.tasks)
+
+    def getOutputPaths(self, filePath, index):
+        """
+        Returns the paths the internal tasks write to when executed on the supplied file.
+
+        :type filePath: str
+        :type index: int
+        :rtype: List[str]
+        """
+
+        self.setCurrentFile(filePath, index)
+        return [outputPath for task in self.tasks for outputPath in task.outputPaths(filePath)]
+
+    def deriveDuplicates(self, filePaths, index, duplicates, revisions, checkout=False):
+        """
+        Derives the outputs of the supplied duplicate files from their processed representative.
+        Only outputs written while the representative was processed are copied.
+
+        :type filePaths: List[str]
+        :type index: int
+        :type duplicates: List[int]
+        :type revisions: List[Union[List[Union[str, int, float]], None]]
+        :type checkout: bool
+        :rtype: None
+        """
+
+        sources = self.getOutputPaths(filePaths[index], index)
+
+        for duplicate in duplicates:
+
+            destinations = self.getOutputPaths(filePaths[duplicate], duplicate)
+
+            for (source, destination, revision) in zip(sources, destinations, revisions):
+
+                # Check if source was written
+                #
+                currentRevision = fbxmanifest.getFileRevision(source)
+
+                if currentRevision is None or currentRevision == revision:
+
+                    continue
+
+                # Check if destination is the source
+                #
+                if os.path.normcase(os.path.abspath(source)) == os.path.normcase(os.path.abspath(destination)):
+
+                    continue
+
+                # Copy output into place
+                #
+                if checkout:
+
+                    p4utils.tryCheckout(destination)
+
+                log.info(f'Copying duplicate output: "{source}" > "{destination}"')
+                fbxassetcache.replaceFile(source, destination)
+
+    def isTextEligible(self, scene):
+        """
+        Evaluates if every pending task can be executed on the supplied ASCII scene without opening it.
+
+        :type scene: asciiscene.AsciiScene
+        :rtype: bool
+        """
+
+        tasks = [task for task in self.tasks if self.isTaskPending(task)]
+        return len(tasks) > 0 and all(task.canDoItAsText(scene) for task in tasks)
+
+    def canProcessAsText(self, filePath, index):
+        """
+        Evaluates if the supplied file can be processed without opening it.
+
+        :type filePath: str
+        :type index: int
+        :rtype: bool
+        """
+
+        self.setCurrentFile(filePath, index)
+        scene = self.loadAsciiScene(filePath)
+
+        return scene is not None and self.isTextEligible(scene)
+
+    def processAsciiScene(self, scene):
+        """
+        Executes the internal tasks on the supplied ASCII scene without opening it.
+
+        :type scene: asciiscene.AsciiScene
+        :rtype: bool
+        """
+
+        log.info(f'Processing scene file as text: {scene.filePath}')
+        results = scene.filePath
+
+        for task in self.tasks:
+
+            # Check if task has already been executed
+            #
+            if not self.isTaskPending(task):
+
+                log.debug(f'Skipping {task.title} task since it has already been executed.')
+                continue
+
+            # Execute task
+            #
+            self._currentTask = task
+
+            with self.instrument(task, textMode=True):
+
+                results = task.doItAsText(scene, results, taskManager=self)
+
+            self.markTaskExecuted(task)
+
+            if not task.tracksChanges:
+
+                self.markDirty()
+
+        return True
+
+    def processFile(self, filePath, index, checkout=False, deferReferences=False, localPath=None, binaryCache=None, textMode=False, options=None):
+        """
+        Executes the internal tasks on the supplied file.
+        The index represents the file's position in the queue.
+        If a local path is supplied then the scene is opened from that copy instead.
+        If a binary cache is supplied then ASCII scenes are opened from their binary conversion whenever one exists.
+        If `textMode` is enabled then ASCII scenes are edited without opening them whenever every task supports it.
+        Any options are exposed to the tasks through `currentOptions` for this file only.
+
+        :type filePath: str
+        :type index: int
+        :type checkout: bool
+        :type deferReferences: bool
+        :type localPath: Union[str, None]
+        :type binaryCache: Union[binarycache.BinaryCache, None]
+        :type textMode: bool
+        :type options: Union[Dict[str, Any], None]
+        :rtype: bool
+        """
+
+        # Check if scene file exists
+        #
+        self.setCurrentFile(filePath, index, options=options)
+
+        if not os.path.exists(filePath):
+
+            log.warning(f'Cannot locate file: {filePath}')
+            return False
+
+        # Check if any tasks apply to scene
+        #
+        if not self.isApplicable(filePath):
+
+            log.info(f'Skipping file since no tasks apply: {filePath}')
+            return False
+
+        # Check if scene can be processed as text
+        #
+        if textMode:
+
+            scene = self.loadAsciiScene(filePath)
+
+            if scene is not None and self.isTextEligible(scene):
+
+                if checkout:
+
+                    with self.span('checkout', 'io'):
+
+                        p4utils.tryCheckout(filePath)
+
+                return self.processAsciiScene(scene)
+
+        # Check if scene can be opened
+        #
+        if self.scene.isValidExtension(filePath):
+
+            # Check if a binary conversion exists
+            #
+            shadowPath = binaryCache.lookup(filePath) if binaryCache is not None else None
+
+            if shadowPath is not None:
+
+                localPath = shadowPath
+
+            with self.measure('open'), self.span('open', 'io', filePath=(localPath or filePath)):
+
+                self.openLocalScene(filePath, localPath=localPath, deferReferences=deferReferences)
+
+            self._referencesDeferred = deferReferences and referenceutils.isDeferrable()
+
+            # Check if a binary conversion should be stored
+            # Deferred scenes are skipped since their references would be saved as unloaded!
+            #
+            if binaryCache is not None and shadowPath is None and not self._referencesDeferred:
+
+                with self.span('save', 'io', binaryCache=True):
+
+                    binaryCache.store(filePath)
+
+        # Check if file should be checked out
+        #
+        if checkout:
+
+            with self.span('checkout', 'io'):
+
+                p4utils.tryCheckout(filePath)
+
+        # Execute tasks on current file
+        #
+        results = filePath
+
+        for task in self.tasks:
+
+            # Check if task has already been executed
+            #
+            if not self.isTaskPending(task):
+
+                log.debug(f'Skipping {task.title} task since it has already been executed.')
+                continue
+
+            # Execute task
+            #
+            self._currentTask = task
+
+            if self._referencesDeferred:
+
+                with self.span('loadReferences', 'io'):
+
+                    referenceutils.loadReferences(*task.requiredReferences())
+
+            with self.instrument(task):
+
+                results = task.doIt(results, taskManager=self)
+
+            self.markTaskExecuted(task)
+
+            if not task.tracksChanges:
+
+                self.markDirty()
+
+        return True
+
+    @staticmethod
+    def fetchFromCache(cache, filePath):
+        """
+        Returns the cached copy of the supplied file.
+        The cached copy remains pinned until the file has been processed.
+        If the file cannot be cached then none is returned!
+
+        :type cache: scenecache.SceneCache
+        :type filePath: str
+        :rtype: Union[str, None]
+        """
+
+        cache.pin(filePath)
+
+        try:
+
+            return cache.fetch(filePath)
+
+        except OSError as exception:
+
+            log.warning(f'Unable to cache file: {filePath} ({exception})')
+            return None
+
+    def recordMetrics(self, metrics, success, queueDepth=0):
+        """
+        Records the outcome, and task durations, of the current file into the supplied metrics file.
+        A success of none indicates the file failed with an error.
+
+        :type metrics: metricsfile.MetricsFile
+        :type success: Union[bool, None]
+        :type queueDepth: int
+        :rtype: None
+        """
+
+        metrics.recordFile('failed' if success is None else ('succeeded' if success else 'skipped'))
+        metrics.setQueueDepth(queueDepth)
+
+        for (name, seconds) in self.currentTimings.items():
+
+            metrics.observeTask(name, seconds)
+
+    @staticmethod
+    def recordDependencies(dependencyGraph, filePath):
+        """
+        Records the references from the supplied file's header into the dependency graph.
+        Any errors are logged rather than interrupting the batch.
+
+        :type dependencyGraph: dependencygraph.DependencyGraph
+        :type filePath: str
+        :rtype: None
+        """
+
+        try:
+
+            dependencyGraph.recordScene(filePath)
+
+        except (OSError, sqlite3.Error) as exception:
+
+            log.warning(f'Unable to record dependencies: {filePath} ({exception})')
+
+    def execute(self, *filePaths, checkout=False, deferReferences=False, prefetcher=None, cache=None, binaryCache=None, textMode=False, dependencyGraph=None, dedupe=False, tracePath=None, profiler=None, sampler=None, commandTracer=None, memoryTracker=None, metrics=None, preCallback=nullCallback, postCallback=nullCallback):
         """
         Executes the internal tasks on the supplied files.
         An additional callback can be supplied if an external class requires progress updates.
         This callback should accept a 'filePath' and 'progress' keyword arguments.
+        If `deferReferences` is enabled then scene files are opened without their references.
+        Each task will then only load the references it requires before executing.
+        If a prefetcher is supplied then upcoming files are copied to local disk while the current file is processing.
+        If a scene cache is supplied then files are read through it, and kept, so repeat batches can skip the network.
+        If a binary cache is supplied then ASCII scenes are converted after their first open and reopened from the conversion afterwards.
+        If `textMode` is enabled then ASCII scenes are edited without opening them whenever every task supports it.
+        If a dependency graph is supplied then the references of each opened file are recorded into it.
+        If `dedupe` is enabled, and every task is content-only, then identical files are only processed once and the other outputs are copied from it.
+        If a trace path is supplied then a Chrome trace of every open, checkout, task and I/O wait is written to it.
+        If a profiler is supplied then the selected task classes, or the whole file loop, are profiled across the batch.
+        If a sampler is supplied then the file loop's stack is sampled in the background and attributed to the current file and task.
+        If a command tracer is supplied then DCC command calls are counted and timed per task, and the top commands are reported per file.
+        If a memory tracker is supplied then the memory deltas of each task and scene open are aggregated per task class.
+        If a metrics file is supplied then file counts, task durations, queue depth, memory and throughput are periodically written to it.
 
         :type filePaths: Union[str, List[str]]
         :type checkout: bool
+        :type deferReferences: bool
+        :type prefetcher: Union[prefetcher.Prefetcher, None]
+        :type cache: Union[scenecache.SceneCache, None]
+        :type binaryCache: Union[binarycache.BinaryCache, None]
+        :type textMode: bool
+        :type dependencyGraph: Union[dependencygraph.DependencyGraph, None]
+        :type dedupe: bool
+        :type tracePath: Union[str, None]
+        :type profiler: Union[taskprofiler.TaskProfiler, None]
+        :type sampler: Union[samplingprofiler.SamplingProfiler, None]
+        :type commandTracer: Union[commandtracer.CommandTracer, None]
+        :type memoryTracker: Union[memorytracker.MemoryTracker, None]
+        :type metrics: Union[metricsfile.MetricsFile, None]
         :type preCallback: Callable
         :type postCallback: Callable
         :rtype: None
@@ -216,49 +989,208 @@ class TaskManager(psonobject.PSONObject):
         progress = 0.0
         startTime = time.time()
 
-        for (i, filePath) in enumerate(filePaths):
+        if prefetcher is not None and cache is not None:
 
-            # Check if scene file exists
-            #
-            self._currentFilePath = os.path.abspath(filePath)
-            self._currentDirectory = os.path.dirname(self._currentFilePath)
-            self._currentFilename = os.path.basename(self._currentFilePath)
-            self._currentName, self._currentExtension = os.path.splitext(self._currentFilename)
-            self._currentIndex = i
+            prefetcher.cache = cache
 
-            if not os.path.exists(filePath):
+        # Check if identical files should be deduplicated
+        #
+        duplicates = {}
 
-                log.warning(f'Cannot locate file: {filePath}')
-                continue
+        if dedupe and self.isContentOnly():
 
-            # Check if scene can be opened
-            #
-            preCallback(filePath=filePath, progress=progress)
+            duplicates = scenededupe.findDuplicates(*filePaths)
 
-            if self.scene.isValidExtension(filePath):
+        elif dedupe:
 
-                log.info(f'Opening scene file: {filePath}')
-                self.scene.open(filePath)
+            log.warning('Skipping deduplication since not every task is content-only!')
 
-            # Check if file should be checked out
-            #
-            if checkout:
+        redundant = {duplicate for indices in duplicates.values() for duplicate in indices}
+        pending = fileCount - len(redundant)
+        derived = []
 
-                p4utils.tryCheckout(filePath)
+        if len(redundant) > 0:
+
+            log.info(f'{len(redundant)} duplicate file(s) will be derived from {len(duplicates)} representative(s)!')
+
+        # Check if a trace should be recorded
+        #
+        if not stringutils.isNullOrEmpty(tracePath):
+
+            self._trace = chrometrace.ChromeTrace(processName='EzBatcher')
+
+        try:
+
+            self.beginBatch()
+
+            if profiler is not None:
+
+                self._profiler = profiler
+                profiler.beginBatch()
+
+            if sampler is not None:
+
+                sampler.start(taskManager=self)
+
+            if commandTracer is not None:
+
+                commandTracer.start(taskManager=self)
+
+            if memoryTracker is not None:
+
+                self._memoryTracker = memoryTracker
+                memoryTracker.start()
+
+            if metrics is not None:
+
+                metrics.start(queueDepth=pending)
+
+            try:
+
+                for (i, filePath) in enumerate(filePaths):
+
+                    # Check if file is a duplicate
+                    #
+                    if i in redundant:
+
+                        continue
+
+                    pending -= 1
+
+                    # Check if upcoming files should be prefetched
+                    #
+                    localPath = None
+
+                    if prefetcher is not None:
+
+                        upcoming = [filePaths[j] for j in range(i, fileCount) if j not in redundant]
+                        prefetcher.schedule(*upcoming[:(prefetcher.lookahead + 1)])
+
+                        with self.span('prefetch', 'io', filePath=filePath):
+
+                            localPath = prefetcher.acquire(filePath)
+
+                    elif cache is not None:
+
+                        with self.span('cache', 'io', filePath=filePath):
+
+                            localPath = self.fetchFromCache(cache, filePath)
+
+                    # Check if references should be recorded
+                    #
+                    if dependencyGraph is not None:
+
+                        self.recordDependencies(dependencyGraph, filePath)
+
+                    # Check if outputs should be derived for duplicates
+                    #
+                    revisions = None
+
+                    if i in duplicates:
+
+                        revisions = list(map(fbxmanifest.getFileRevision, self.getOutputPaths(filePath, i)))
+
+                    # Execute tasks on current file
+                    #
+                    preCallback(filePath=filePath, progress=progress)
+                    success = None
 
-            # Execute tasks on current file
+                    try:
+
+                        with self.span(os.path.basename(filePath), 'file', filePath=filePath, index=i):
+
+                            success = self.processFile(filePath, i, checkout=checkout, deferReferences=deferReferences, localPath=localPath, binaryCache=binaryCache, textMode=textMode)
+
+                    finally:
+
+                        if prefetcher is not None:
+
+                            prefetcher.release(filePath)
+
+                        elif cache is not None:
+
+                            cache.unpin(filePath)
+
+                        if commandTracer is not None:
+
+                            commandTracer.endFile(filePath)
+
+                        if metrics is not None:
+
+                            self.recordMetrics(metrics, success, queueDepth=pending)
+
+                    if not success:
+
+                        continue
+
+                    if revisions is not None:
+
+                        derived.append((i, revisions))
+
+                    # Update progress
+                    #
+                    progress = (float(i + 1) / float(fileCount)) * 100.0
+                    postCallback(filePath=filePath, progress=progress)
+
+            finally:
+
+                # Stop any instrumentation first so it is never left attached
+                #
+                if sampler is not None:
+
+                    sampler.stop()
+
+                if commandTracer is not None:
+
+                    commandTracer.stop()
+
+                if profiler is not None:
+
+                    profiler.endBatch()
+                    self._profiler = None
+
+                if memoryTracker is not None:
+
+                    memoryTracker.stop()
+                    self._memoryTracker = None
+
+                if metrics is not None:
+
+                    metrics.stop()
+
+                # Release batch resources
+                #
+                if prefetcher is not None:
+
+                    prefetcher.clear()
+
+                elif cache is not None:
+
+                    cache.save()
+
+                if binaryCache is not None:
+
+                    binaryCache.save()
+
+                self.endBatch()
+
+            # Derive outputs for duplicates
+            # This happens after the batch ends so any staged uploads are complete!
             #
-            results = filePath
+            for (i, revisions) in derived:
 
-            for task in self.tasks:
+                with self.span('derive', 'io', filePath=filePaths[i]):
 
-                self._currentTask = task
-                results = task.doIt(results, taskManager=self)
+                    self.deriveDuplicates(filePaths, i, duplicates[i], revisions, checkout=checkout)
+
+        finally:
 
-            # Update progress
+            # Check if trace should be saved
             #
-            progress = (float(i + 1) / float(fileCount)) * 100.0
-            postCallback(filePath=filePath, progress=progress)
+            if self._trace is not None:
+
+                self._trace.save(tracePath)
+                self._trace = None
 
         # Notify user of time taken
         #
@@ -266,6 +1198,60 @@ class TaskManager(psonobject.PSONObject):
         timeDelta = endTime - startTime
 
         log.info('%s file(s) batched in %s!' % (fileCount, time.strftime('%H hours %M minutes and %S seconds', time.gmtime(timeDelta))))
+
+    def executeAffected(self, dependencyGraph, *filePaths, root=None, **kwargs):
+        """
+        Executes the internal tasks on only those scene files that depend on the supplied changed files.
+        See `execute` for the supported keyword arguments.
+
+        :type dependencyGraph: dependencygraph.DependencyGraph
+        :type filePaths: Union[str, List[str]]
+        :type root: Union[str, None]
+        :rtype: List[str]
+        """
+
+        queue = dependencyGraph.minimalQueue(*filePaths, root=root)
+        log.info(f'{len(queue)} scene(s) affected by {len(filePaths)} changed file(s)!')
+
+        kwargs.setdefault('dependencyGraph', dependencyGraph)
+        self.execute(*queue, **kwargs)
+
+        return queue
+
+    def executeParallel(self, *filePaths, workerCount=None, interpreter=None, checkout=False, deferReferences=False, binaryCache=None, textMode=False, tracePath=None, metrics=None, preCallback=nullCallback, postCallback=nullCallback):
+        """
+        Executes the internal tasks on the supplied files using multiple worker processes.
+        Files that reference the same rigs are routed to the same worker whenever possible.
+        Only the listed options are supported by workers, see `WorkerPool.execute` for their descriptions.
+        Options such as prefetching, scene caches, deduplication, dependency graphs and profilers only apply to `execute`.
+
+        :type filePaths: Union[str, List[str]]
+        :type workerCount: Union[int, None]
+        :type interpreter: Union[str, None]
+        :type checkout: bool
+        :type deferReferences: bool
+        :type binaryCache: Union[binarycache.BinaryCache, None]
+        :type textMode: bool
+        :type tracePath: Union[str, None]
+        :type metrics: Union[metricsfile.MetricsFile, None]
+        :type preCallback: Callable
+        :type postCallback: Callable
+        :rtype: List[dict]
+        """
+
+        pool = workerpool.WorkerPool(self, workerCount=workerCount, interpreter=interpreter)
+
+        return pool.execute(
+            *filePaths,
+            checkout=checkout,
+            deferReferences=deferReferences,
+            binaryCache=binaryCache,
+            textMode=textMode,
+            tracePath=tracePath,
+            metrics=metrics,
+            preCallback=preCallback,
+            postCallback=postCallback
+        )
     # endregion
 
     # region Callbacks
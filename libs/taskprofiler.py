@@ -0,0 +1,209 @@
+import io
+import os
+import pstats
+import cProfile
+
+from contextlib import contextmanager
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class TaskProfiler(object):
+    """
+    Class used to profile tasks with cProfile across an entire batch.
+    Stats are aggregated per task class and dumped as a `.pstats` file for each class once the batch ends.
+    Alternatively, the whole file loop can be profiled as a single `Batch.pstats` file.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_directory', '_taskNames', '_wholeLoop', '_topCount', '_profiles')
+
+    def __init__(self, directory, taskNames=None, wholeLoop=False, topCount=20):
+        """
+        Private method called after a new instance is created.
+        If no task names are supplied then every task class is profiled.
+
+        :type directory: str
+        :type taskNames: Union[List[str], None]
+        :type wholeLoop: bool
+        :type topCount: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(TaskProfiler, self).__init__()
+
+        # Declare private variables
+        #
+        self._directory = os.path.abspath(os.path.expandvars(directory))
+        self._taskNames = set(taskNames) if taskNames else set()
+        self._wholeLoop = wholeLoop
+        self._topCount = topCount
+        self._profiles = {}
+    # endregion
+
+    # region Properties
+    @property
+    def directory(self):
+        """
+        Getter method that returns the directory stats are dumped to.
+
+        :rtype: str
+        """
+
+        return self._directory
+
+    @property
+    def wholeLoop(self):
+        """
+        Getter method that returns whether the whole file loop is profiled rather than individual tasks.
+
+        :rtype: bool
+        """
+
+        return self._wholeLoop
+
+    @property
+    def profiles(self):
+        """
+        Getter method that returns the profiles collected so far.
+
+        :rtype: Dict[str, cProfile.Profile]
+        """
+
+        return self._profiles
+    # endregion
+
+    # region Methods
+    def isProfiled(self, task):
+        """
+        Evaluates if the supplied task should be profiled.
+        Tasks are never profiled individually while the whole file loop is, since only one profiler can be active at a time.
+
+        :type task: ezbatcher.tasks.abstract.abstracttask.AbstractTask
+        :rtype: bool
+        """
+
+        if self.wholeLoop:
+
+            return False
+
+        return len(self._taskNames) == 0 or type(task).__name__ in self._taskNames
+
+    def getProfile(self, name):
+        """
+        Returns the profile for the supplied name.
+        A new profile is created if one does not exist.
+
+        :type name: str
+        :rtype: cProfile.Profile
+        """
+
+        profile = self._profiles.get(name)
+
+        if profile is None:
+
+            profile = cProfile.Profile()
+            self._profiles[name] = profile
+
+        return profile
+
+    @contextmanager
+    def profile(self, task):
+        """
+        Returns a context manager that profiles the supplied task's execution.
+        If the task is not profiled then this does nothing.
+
+        :type task: ezbatcher.tasks.abstract.abstracttask.AbstractTask
+        :rtype: contextmanager
+        """
+
+        if not self.isProfiled(task):
+
+            yield
+            return
+
+        profile = self.getProfile(type(task).__name__)
+        profile.enable()
+
+        try:
+
+            yield
+
+        finally:
+
+            profile.disable()
+
+    def beginBatch(self):
+        """
+        Notifies this profiler that a new batch is about to begin.
+        If the whole file loop is profiled then profiling starts here.
+
+        :rtype: None
+        """
+
+        self._profiles.clear()
+
+        if self.wholeLoop:
+
+            self.getProfile('Batch').enable()
+
+    def endBatch(self):
+        """
+        Notifies this profiler that the current batch has ended.
+        Profiling is stopped and the aggregated stats are dumped and summarized.
+
+        :rtype: None
+        """
+
+        if self.wholeLoop:
+
+            self.getProfile('Batch').disable()
+
+        self.save()
+
+    def summarize(self, name):
+        """
+        Returns a summary of the most expensive functions for the supplied profile.
+
+        :type name: str
+        :rtype: str
+        """
+
+        stream = io.StringIO()
+
+        stats = pstats.Stats(self._profiles[name], stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self._topCount)
+
+        return stream.getvalue()
+
+    def save(self):
+        """
+        Dumps each profile to a `.pstats` file and logs its top functions.
+
+        :rtype: None
+        """
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        for (name, profile) in self._profiles.items():
+
+            # Check if profile collected anything
+            #
+            profile.create_stats()
+
+            if len(profile.stats) == 0:
+
+                continue
+
+            # Dump stats to file
+            #
+            filePath = os.path.join(self.directory, f'{name}.pstats')
+            profile.dump_stats(filePath)
+
+            log.info(f'{name} profile saved to: {filePath}\n{self.summarize(name)}')
+    # endregion
@@ -0,0 +1,214 @@
+import os
+import stat
+import queue
+import shutil
+import hashlib
+import threading
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+CHUNK_SIZE = 1048576
+
+
+def copyWithChecksum(source, destination):
+    """
+    Copies the supplied source file to the destination and returns the checksum of the copied bytes.
+
+    :type source: str
+    :type destination: str
+    :rtype: str
+    """
+
+    checksum = hashlib.sha1()
+
+    with open(source, 'rb') as inputFile, open(destination, 'wb') as outputFile:
+
+        for chunk in iter(lambda: inputFile.read(CHUNK_SIZE), b''):
+
+            checksum.update(chunk)
+            outputFile.write(chunk)
+
+    shutil.copystat(source, destination)
+
+    return checksum.hexdigest()
+
+
+def getChecksum(filePath):
+    """
+    Returns the checksum for the supplied file.
+
+    :type filePath: str
+    :rtype: str
+    """
+
+    checksum = hashlib.sha1()
+
+    with open(filePath, 'rb') as file:
+
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+
+            checksum.update(chunk)
+
+    return checksum.hexdigest()
+
+
+class UploadQueue(object):
+    """
+    Class used to upload staged files to their destination on a background thread.
+    Each upload is copied next to its destination, verified against the staged checksum and then renamed into place.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_queue', '_thread', '_lock', '_failures')
+
+    def __init__(self):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(UploadQueue, self).__init__()
+
+        # Declare private variables
+        #
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._failures = []
+    # endregion
+
+    # region Properties
+    @property
+    def pending(self):
+        """
+        Getter method that returns the number of uploads that have not landed yet.
+
+        :rtype: int
+        """
+
+        return self._queue.unfinished_tasks
+    # endregion
+
+    # region Methods
+    def submit(self, source, destination):
+        """
+        Queues the supplied staged file for upload.
+        The staged file, along with its directory if empty, is removed once it has been uploaded.
+
+        :type source: str
+        :type destination: str
+        :rtype: None
+        """
+
+        with self._lock:
+
+            if self._thread is None:
+
+                self._thread = threading.Thread(target=self.run, daemon=True)
+                self._thread.start()
+
+        log.info(f'Queueing upload: {source} > {destination}')
+        self._queue.put((source, destination))
+
+    def upload(self, source, destination):
+        """
+        Uploads the supplied staged file to its destination.
+
+        :type source: str
+        :type destination: str
+        :rtype: None
+        """
+
+        # Copy file next to destination
+        #
+        directory = os.path.dirname(destination)
+
+        if not os.path.isdir(directory):
+
+            os.makedirs(directory)
+
+        temporaryPath = f'{destination}.uploading'
+        expected = copyWithChecksum(source, temporaryPath)
+
+        # Verify copied file
+        #
+        actual = getChecksum(temporaryPath)
+
+        if actual != expected:
+
+            os.remove(temporaryPath)
+            raise IOError(f'upload() checksum mismatch for: {destination}')
+
+        # Check if destination is read-only
+        #
+        if os.path.exists(destination) and not os.access(destination, os.W_OK):
+
+            os.chmod(destination, stat.S_IWRITE)
+
+        # Move file into place and cleanup staged file
+        #
+        os.replace(temporaryPath, destination)
+        os.remove(source)
+
+        try:
+
+            os.rmdir(os.path.dirname(source))
+
+        except OSError:
+
+            pass
+
+        log.info(f'Uploaded: {destination}')
+
+    def run(self):
+        """
+        Processes queued uploads for the lifetime of the session.
+
+        :rtype: None
+        """
+
+        while True:
+
+            source, destination = self._queue.get()
+
+            try:
+
+                self.upload(source, destination)
+
+            except (IOError, OSError) as exception:
+
+                log.error(f'Unable to upload: {source} > {destination} ({exception})')
+                self._failures.append((source, destination))
+
+            finally:
+
+                self._queue.task_done()
+
+    def join(self):
+        """
+        Waits for every pending upload to land and returns any failed uploads.
+        Failed uploads retain their staged file so they can be recovered.
+
+        :rtype: List[Tuple[str, str]]
+        """
+
+        pending = self.pending
+
+        if pending > 0:
+
+            log.info(f'Waiting on {pending} pending upload(s)...')
+
+        self._queue.join()
+
+        failures = list(self._failures)
+        self._failures.clear()
+
+        return failures
+    # endregion
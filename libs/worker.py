@@ -0,0 +1,198 @@
+import os
+import sys
+import json
+import time
+import argparse
+import traceback
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+RESULT_PREFIX = '@ezbatcher '
+
+
+def initializeApplication():
+    """
+    Initializes the standalone application, if one is available.
+    This must be called before any DCC dependent modules are imported!
+
+    :rtype: None
+    """
+
+    try:
+
+        from maya import standalone
+        standalone.initialize(name='python')
+
+    except ImportError:
+
+        pass
+
+
+def uninitializeApplication():
+    """
+    Uninitializes the standalone application, if one is available.
+
+    :rtype: None
+    """
+
+    try:
+
+        from maya import standalone
+        standalone.uninitialize()
+
+    except ImportError:
+
+        pass
+
+
+def writeResult(**kwargs):
+    """
+    Writes the supplied result to the parent process.
+    Results are prefixed so they can be distinguished from any other output.
+
+    :rtype: None
+    """
+
+    sys.stdout.write(f'{RESULT_PREFIX}{json.dumps(kwargs)}\n')
+    sys.stdout.flush()
+
+
+def readResult(line):
+    """
+    Returns the result from the supplied output line.
+    If the line is not a result then none is returned!
+
+    :type line: str
+    :rtype: Union[dict, None]
+    """
+
+    if line.startswith(RESULT_PREFIX):
+
+        return json.loads(line[len(RESULT_PREFIX):])
+
+    else:
+
+        return None
+
+
+def main(argv=None):
+    """
+    Processes the files requested by the parent process until the input stream is closed.
+    Each request is a JSON line containing a 'filePath' and 'index' key, and optionally an 'options' key.
+
+    :type argv: Union[List[str], None]
+    :rtype: int
+    """
+
+    # Parse command line arguments
+    #
+    parser = argparse.ArgumentParser(description='Executes a serialized task manager on the requested files.')
+    parser.add_argument('taskManager', help='The serialized task manager to execute.')
+    parser.add_argument('--checkout', action='store_true', help='Checks out each file before executing.')
+    parser.add_argument('--deferReferences', action='store_true', help='Opens each file without references.')
+    parser.add_argument('--binaryCache', default=None, help='The directory to store binary scene conversions in.')
+    parser.add_argument('--textMode', action='store_true', help='Edits eligible ASCII files without initializing the application.')
+    parser.add_argument('--trace', default=None, help='The path to write a Chrome trace of this worker to.')
+
+    args = parser.parse_args(argv)
+
+    # Initialize application before importing the task manager
+    # In text mode the application is only initialized once a file requires it!
+    #
+    isInitialized = not args.textMode
+
+    if isInitialized:
+
+        initializeApplication()
+
+    from dcc.json import jsonutils
+    from . import binarycache, chrometrace, memorytracker
+
+    taskManager = jsonutils.load(args.taskManager)
+    binaryCache = binarycache.BinaryCache(args.binaryCache) if args.binaryCache else None
+
+    if args.trace:
+
+        taskManager.trace = chrometrace.ChromeTrace(processName=f'Worker {os.getpid()}')
+
+    # Process requested files
+    # Batch scoped tasks are executed once per worker
+    #
+    taskManager.beginBatch()
+
+    for line in sys.stdin:
+
+        # Check if request is valid
+        #
+        line = line.strip()
+
+        if len(line) == 0:
+
+            continue
+
+        request = json.loads(line)
+        filePath, index, options = request['filePath'], request['index'], request.get('options', {})
+
+        # Check if application is required
+        #
+        startTime = time.time()
+        status, error = 'succeeded', ''
+
+        if not isInitialized and not taskManager.canProcessAsText(filePath, index):
+
+            with taskManager.span('initialize', 'io'):
+
+                initializeApplication()
+
+            isInitialized = True
+
+        # Execute tasks on file
+        #
+        try:
+
+            with taskManager.span(os.path.basename(filePath), 'file', filePath=filePath, index=index):
+
+                success = taskManager.processFile(filePath, index, checkout=args.checkout, deferReferences=args.deferReferences, binaryCache=binaryCache, textMode=args.textMode, options=options)
+
+            status = 'succeeded' if success else 'skipped'
+
+        except Exception as exception:
+
+            log.error(traceback.format_exc())
+            status, error = 'failed', str(exception)
+
+        # Wait on any staged uploads so the file's status reflects them
+        #
+        failures = taskManager.uploads.join()
+
+        if len(failures) > 0:
+
+            destinations = ', '.join(destination for (source, destination) in failures)
+            status, error = 'failed', f'{len(failures)} upload(s) failed: {destinations}'
+
+        writeResult(filePath=filePath, index=index, status=status, error=error, elapsed=(time.time() - startTime), pid=os.getpid(), rss=memorytracker.getResidentSetSize(), timings=taskManager.currentTimings, results=taskManager.currentResults)
+
+    if binaryCache is not None:
+
+        binaryCache.save()
+
+    taskManager.endBatch()
+
+    if taskManager.trace is not None:
+
+        taskManager.trace.save(args.trace)
+
+    if isInitialized:
+
+        uninitializeApplication()
+
+    return 0
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
@@ -0,0 +1,632 @@
+import os
+import sys
+import json
+import time
+import queue
+import weakref
+import tempfile
+import threading
+import subprocess
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dcc import __application__, DCC
+from dcc.json import jsonutils
+from . import chrometrace, sceneheader, worker
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def nullCallback(*args, **kwargs):
+    """
+    Placeholder for the execution callbacks.
+
+    :rtype: None
+    """
+
+    pass
+
+
+class WorkerPool(object):
+    """
+    Class used to execute a task manager's tasks across multiple worker processes.
+    Files that reference the same rigs are routed to the same worker so each worker's caches stay warm.
+    Once a worker runs out of files it will steal from the back of the busiest worker's queue.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_taskManager', '_workerCount', '_interpreter', '_queues', '_lock', '_trace')
+
+    def __init__(self, taskManager, workerCount=None, interpreter=None):
+        """
+        Private method called after a new instance is created.
+
+        :type taskManager: ezbatcher.libs.taskmanager.TaskManager
+        :type workerCount: Union[int, None]
+        :type interpreter: Union[str, None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(WorkerPool, self).__init__()
+
+        # Declare private variables
+        #
+        self._taskManager = weakref.ref(taskManager)
+        self._workerCount = workerCount if isinstance(workerCount, int) else max(1, (os.cpu_count() or 2) // 2)
+        self._interpreter = interpreter if isinstance(interpreter, str) else self.defaultInterpreter()
+        self._queues = []
+        self._lock = threading.Lock()
+        self._trace = None
+    # endregion
+
+    # region Properties
+    @property
+    def taskManager(self):
+        """
+        Getter method that returns the associated task manager.
+
+        :rtype: ezbatcher.libs.taskmanager.TaskManager
+        """
+
+        return self._taskManager()
+
+    @property
+    def workerCount(self):
+        """
+        Getter method that returns the number of worker processes.
+
+        :rtype: int
+        """
+
+        return self._workerCount
+
+    @workerCount.setter
+    def workerCount(self, workerCount):
+        """
+        Setter method that updates the number of worker processes.
+
+        :type workerCount: int
+        :rtype: None
+        """
+
+        self._workerCount = max(1, int(workerCount))
+
+    @property
+    def interpreter(self):
+        """
+        Getter method that returns the interpreter used to launch worker processes.
+
+        :rtype: str
+        """
+
+        return self._interpreter
+
+    @interpreter.setter
+    def interpreter(self, interpreter):
+        """
+        Setter method that updates the interpreter used to launch worker processes.
+
+        :type interpreter: str
+        :rtype: None
+        """
+
+        self._interpreter = interpreter
+
+    @property
+    def queueDepth(self):
+        """
+        Getter method that returns the number of files still waiting in the worker queues.
+
+        :rtype: int
+        """
+
+        with self._lock:
+
+            return sum(map(len, self._queues))
+    # endregion
+
+    # region Methods
+    @staticmethod
+    def defaultInterpreter():
+        """
+        Returns the default interpreter for the current application.
+
+        :rtype: str
+        """
+
+        if __application__ == DCC.MAYA:
+
+            executable = 'mayapy.exe' if sys.platform == 'win32' else 'mayapy'
+            return os.path.join(os.environ.get('MAYA_LOCATION', ''), 'bin', executable)
+
+        else:
+
+            return sys.executable
+
+    @staticmethod
+    def getAffinity(filePath):
+        """
+        Returns the affinity key for the supplied file.
+        Files that share the same referenced rigs will share the same key.
+
+        :type filePath: str
+        :rtype: Tuple[str]
+        """
+
+        return tuple(sorted(os.path.normcase(path) for path in sceneheader.iterReferencePaths(filePath)))
+
+    def schedule(self, *filePaths):
+        """
+        Distributes the supplied files across the worker queues.
+        Files are grouped by affinity and the largest groups are assigned to the least busy workers first.
+
+        :type filePaths: Union[str, List[str]]
+        :rtype: List[deque]
+        """
+
+        # Read file headers in parallel
+        #
+        with ThreadPoolExecutor(max_workers=16) as executor:
+
+            affinities = list(executor.map(self.getAffinity, filePaths))
+
+        # Group files by affinity
+        #
+        groups = {}
+
+        for (index, (filePath, affinity)) in enumerate(zip(filePaths, affinities)):
+
+            groups.setdefault(affinity, []).append((index, filePath))
+
+        # Assign groups to workers
+        #
+        queues = [deque() for _ in range(self.workerCount)]
+
+        for group in sorted(groups.values(), key=len, reverse=True):
+
+            workerQueue = min(queues, key=len)
+            workerQueue.extend(group)
+
+        log.info(f'Scheduled {len(filePaths)} file(s) into {len(groups)} affinity group(s) across {self.workerCount} worker(s).')
+        return queues
+
+    def nextFile(self, workerIndex):
+        """
+        Returns the next file for the specified worker.
+        If the worker's queue is empty then a file is stolen from the back of the busiest queue.
+
+        :type workerIndex: int
+        :rtype: Union[Tuple[int, str], None]
+        """
+
+        with self._lock:
+
+            # Check if worker has any files left
+            #
+            workerQueue = self._queues[workerIndex]
+
+            if len(workerQueue) > 0:
+
+                return workerQueue.popleft()
+
+            # Steal from the busiest worker
+            #
+            victim = max(self._queues, key=len)
+
+            if len(victim) > 0:
+
+                return victim.pop()
+
+            else:
+
+                return None
+
+    def launchWorker(self, filePath, checkout=False, deferReferences=False, binaryCache=None, textMode=False, tracePath=None):
+        """
+        Launches a worker process for the supplied serialized task manager.
+
+        :type filePath: str
+        :type checkout: bool
+        :type deferReferences: bool
+        :type binaryCache: Union[binarycache.BinaryCache, None]
+        :type textMode: bool
+        :type tracePath: Union[str, None]
+        :rtype: subprocess.Popen
+        """
+
+        # Compose command line arguments
+        #
+        args = [self.interpreter, '-m', worker.__name__, filePath]
+
+        if checkout:
+
+            args.append('--checkout')
+
+        if deferReferences:
+
+            args.append('--deferReferences')
+
+        if binaryCache is not None:
+
+            args.extend(['--binaryCache', binaryCache.directory])
+
+        if textMode:
+
+            args.append('--textMode')
+
+        if tracePath is not None:
+
+            args.extend(['--trace', tracePath])
+
+        # Ensure worker inherits the current search paths
+        #
+        environment = os.environ.copy()
+        environment['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if isinstance(path, str) and len(path) > 0)
+
+        return subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            env=environment
+        )
+
+    def runWorker(self, workerIndex, process, events):
+        """
+        Feeds files to the supplied worker process until there are none left.
+        Any progress is reported to the supplied event queue.
+
+        :type workerIndex: int
+        :type process: subprocess.Popen
+        :type events: queue.Queue
+        :rtype: None
+        """
+
+        try:
+
+            while True:
+
+                # Check if there are any files left
+                #
+                item = self.nextFile(workerIndex)
+
+                if item is None:
+
+                    break
+
+                # Send file request to worker
+                #
+                index, filePath = item
+                startTime = chrometrace.ChromeTrace.now()
+
+                events.put(('started', {'filePath': filePath, 'index': index, 'worker': workerIndex}))
+
+                process.stdin.write(json.dumps({'filePath': filePath, 'index': index}) + '\n')
+                process.stdin.flush()
+
+                # Wait for result
+                #
+                result = None
+
+                for line in iter(process.stdout.readline, ''):
+
+                    result = worker.readResult(line)
+
+                    if result is not None:
+
+                        break
+
+                    sys.stdout.write(line)
+
+                # Check if worker exited unexpectedly
+                #
+                if result is None:
+
+                    events.put(('finished', {'filePath': filePath, 'index': index, 'worker': workerIndex, 'status': 'failed', 'error': 'Worker exited unexpectedly!', 'elapsed': 0.0}))
+                    break
+
+                result['worker'] = workerIndex
+                events.put(('finished', result))
+
+                if self._trace is not None:
+
+                    self._trace.addEvent(ph='X', name=os.path.basename(filePath), cat='dispatch', ts=startTime, dur=(chrometrace.ChromeTrace.now() - startTime), args={'filePath': filePath, 'index': index, 'status': result.get('status')})
+
+        except (OSError, ValueError) as exception:
+
+            log.error(f'Worker #{workerIndex} encountered an error: {exception}')
+
+        finally:
+
+            try:
+
+                process.stdin.close()
+
+            except OSError:
+
+                pass
+
+            process.wait()
+            events.put(('exited', {'worker': workerIndex, 'returncode': process.returncode}))
+
+    def recordMetrics(self, metrics, record):
+        """
+        Records the supplied worker result into the metrics file.
+
+        :type metrics: metricsfile.MetricsFile
+        :type record: dict
+        :rtype: None
+        """
+
+        metrics.recordFile(record['status'])
+        metrics.setQueueDepth(self.queueDepth)
+        metrics.setWorkerMemory(record['worker'], record.get('rss'))
+
+        for (name, seconds) in record.get('timings', {}).items():
+
+            metrics.observeTask(name, seconds)
+
+    def mergeTraces(self, tracePath, *workerTracePaths):
+        """
+        Merges the supplied worker traces into this pool's trace and saves it to the supplied path.
+        The worker traces are removed afterwards.
+
+        :type tracePath: str
+        :type workerTracePaths: Union[str, List[str]]
+        :rtype: None
+        """
+
+        for workerTracePath in workerTracePaths:
+
+            if not os.path.isfile(workerTracePath):
+
+                continue
+
+            self._trace.extend(chrometrace.ChromeTrace.load(workerTracePath))
+            os.remove(workerTracePath)
+
+        self._trace.save(tracePath)
+        self._trace = None
+
+    def execute(self, *filePaths, checkout=False, deferReferences=False, binaryCache=None, textMode=False, tracePath=None, metrics=None, preCallback=nullCallback, postCallback=nullCallback):
+        """
+        Executes the task manager's tasks on the supplied files using multiple worker processes.
+        The callbacks are always invoked from the calling thread.
+        If a trace path is supplied then each worker records its own trace, which are merged into a single Chrome trace with one track per worker.
+        If a metrics file is supplied then file counts, task durations, queue depth, worker memory and throughput are periodically written to it.
+
+        :type filePaths: Union[str, List[str]]
+        :type checkout: bool
+        :type deferReferences: bool
+        :type binaryCache: Union[binarycache.BinaryCache, None]
+        :type textMode: bool
+        :type tracePath: Union[str, None]
+        :type metrics: Union[metricsfile.MetricsFile, None]
+        :type preCallback: Callable
+        :type postCallback: Callable
+        :rtype: List[dict]
+        """
+
+        # Check if there are any files
+        #
+        fileCount = len(filePaths)
+
+        if fileCount == 0:
+
+            return []
+
+        # Serialize task manager for workers
+        #
+        handle, manifestPath = tempfile.mkstemp(prefix='ezbatcher_', suffix='.json')
+        os.close(handle)
+
+        jsonutils.dump(manifestPath, self.taskManager, indent=4)
+
+        # Launch workers
+        #
+        startTime = time.time()
+
+        self._queues = self.schedule(*filePaths)
+        workerCount = min(self.workerCount, fileCount)
+
+        events = queue.Queue()
+        threads = []
+        tracePaths = [f'{tracePath}.worker{workerIndex}' for workerIndex in range(workerCount)] if tracePath else [None] * workerCount
+
+        if tracePath:
+
+            self._trace = chrometrace.ChromeTrace(processName='EzBatcher')
+
+        if metrics is not None:
+
+            metrics.start(queueDepth=fileCount)
+
+        try:
+
+            for workerIndex in range(workerCount):
+
+                process = self.launchWorker(manifestPath, checkout=checkout, deferReferences=deferReferences, binaryCache=binaryCache, textMode=textMode, tracePath=tracePaths[workerIndex])
+
+                thread = threading.Thread(target=self.runWorker, args=(workerIndex, process, events), name=f'Worker #{workerIndex}', daemon=True)
+                thread.start()
+
+                threads.append(thread)
+
+            # Process events until all workers have exited
+            #
+            records = []
+            remaining = len(threads)
+
+            while remaining > 0:
+
+                event, record = events.get()
+
+                if event == 'started':
+
+                    progress = (float(len(records)) / float(fileCount)) * 100.0
+                    preCallback(filePath=record['filePath'], progress=progress)
+
+                elif event == 'finished':
+
+                    records.append(record)
+
+                    progress = (float(len(records)) / float(fileCount)) * 100.0
+                    postCallback(filePath=record['filePath'], progress=progress)
+
+                    if record['status'] == 'failed':
+
+                        log.error(f'Failed to process file: {record["filePath"]} ({record["error"]})')
+
+                    if metrics is not None:
+
+                        self.recordMetrics(metrics, record)
+
+                else:
+
+                    remaining -= 1
+
+        finally:
+
+            for thread in threads:
+
+                thread.join()
+
+            os.remove(manifestPath)
+
+            if self._trace is not None:
+
+                self.mergeTraces(tracePath, *tracePaths)
+
+            if metrics is not None:
+
+                metrics.stop()
+
+        # Check if any files were abandoned
+        #
+        abandoned = fileCount - len(records)
+
+        if abandoned > 0:
+
+            log.warning(f'{abandoned} file(s) were not processed since all workers exited!')
+
+        # Notify user of time taken
+        #
+        timeDelta = time.time() - startTime
+        log.info('%s file(s) batched across %s worker(s) in %s!' % (fileCount, workerCount, time.strftime('%H hours %M minutes and %S seconds', time.gmtime(timeDelta))))
+
+        return sorted(records, key=lambda record: record['index'])
+
+    def executeOnce(self, filePath, index=0, checkout=False, options=None):
+        """
+        Executes the task manager's tasks on the supplied file using a single worker process.
+        Unlike `execute`, this method blocks until the worker has exited and is safe to call from any thread.
+        Any options are sent along with the file request and exposed to the tasks through `currentOptions`.
+
+        :type filePath: str
+        :type index: int
+        :type checkout: bool
+        :type options: Union[Dict[str, Any], None]
+        :rtype: dict
+        """
+
+        # Serialize task manager for worker
+        #
+        handle, manifestPath = tempfile.mkstemp(prefix='ezbatcher_', suffix='.json')
+        os.close(handle)
+
+        jsonutils.dump(manifestPath, self.taskManager, indent=4)
+
+        try:
+
+            # Send file request to worker and wait for it to exit
+            #
+            request = {'filePath': filePath, 'index': index}
+
+            if options:
+
+                request['options'] = options
+
+            process = self.launchWorker(manifestPath, checkout=checkout)
+            stdout, stderr = process.communicate(json.dumps(request) + '\n')
+
+            # Collect result
+            #
+            record = None
+
+            for line in stdout.splitlines(keepends=True):
+
+                result = worker.readResult(line)
+
+                if result is not None:
+
+                    record = result
+
+                else:
+
+                    sys.stdout.write(line)
+
+            if record is None:
+
+                record = {'filePath': filePath, 'index': index, 'status': 'failed', 'error': 'Worker exited unexpectedly!', 'elapsed': 0.0, 'results': {}}
+
+            return record
+
+        finally:
+
+            os.remove(manifestPath)
+
+    def executeChunks(self, filePath, *options, index=0, checkout=False):
+        """
+        Executes the task manager's tasks on the same file once for each of the supplied options in parallel.
+        Each execution happens inside its own worker process.
+
+        :type filePath: str
+        :type options: Union[Dict[str, Any], List[Dict[str, Any]]]
+        :type index: int
+        :type checkout: bool
+        :rtype: List[dict]
+        """
+
+        chunkCount = len(options)
+
+        if chunkCount == 0:
+
+            return []
+
+        with ThreadPoolExecutor(max_workers=chunkCount) as executor:
+
+            futures = [executor.submit(self.executeOnce, filePath, index=index, checkout=checkout, options=chunkOptions) for chunkOptions in options]
+            return [future.result() for future in futures]
+
+    @classmethod
+    def executeVariants(cls, filePath, *taskManagers, index=0, checkout=False, interpreter=None):
+        """
+        Executes each of the supplied task managers on the same file in parallel.
+        Each task manager is executed inside its own worker process.
+
+        :type filePath: str
+        :type taskManagers: Union[ezbatcher.libs.taskmanager.TaskManager, List[ezbatcher.libs.taskmanager.TaskManager]]
+        :type index: int
+        :type checkout: bool
+        :type interpreter: Union[str, None]
+        :rtype: List[dict]
+        """
+
+        variantCount = len(taskManagers)
+
+        if variantCount == 0:
+
+            return []
+
+        pools = [cls(taskManager, workerCount=1, interpreter=interpreter) for taskManager in taskManagers]
+
+        with ThreadPoolExecutor(max_workers=variantCount) as executor:
+
+            futures = [executor.submit(pool.executeOnce, filePath, index=index, checkout=checkout) for pool in pools]
+            return [future.result() for future in futures]
+    # endregion
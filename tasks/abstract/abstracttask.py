@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+from enum import IntEnum
 from six import with_metaclass
 from dcc import fnscene
 from dcc.json import psonobject
@@ -10,6 +11,16 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+class Scope(IntEnum):
+    """
+    Enum class that lists how often a task should be executed.
+    """
+
+    PerFile = 0
+    PerBatch = 1
+    PerSession = 2
+
+
 class AbstractTask(with_metaclass(ABCMeta, psonobject.PSONObject)):
     """
     Abstract base class for performing batch tasks.
@@ -19,6 +30,10 @@ class AbstractTask(with_metaclass(ABCMeta, psonobject.PSONObject)):
     __slots__ = ('_taskManager',)
     __title__ = ''
     __scene__ = fnscene.FnScene()
+    __references__ = ()
+    __scope__ = Scope.PerFile
+    __tracksChanges__ = False
+    __contentOnly__ = False
 
     def __init__(self, *args, **kwargs):
         """
@@ -47,6 +62,38 @@ class AbstractTask(with_metaclass(ABCMeta, psonobject.PSONObject)):
 
         return cls.__title__
 
+    @classproperty
+    def scope(cls):
+        """
+        Getter method that returns how often this task should be executed.
+
+        :rtype: Scope
+        """
+
+        return cls.__scope__
+
+    @classproperty
+    def tracksChanges(cls):
+        """
+        Getter method that returns whether this task reports its own scene modifications.
+        Tasks that do not track their changes are assumed to always modify the scene.
+
+        :rtype: bool
+        """
+
+        return cls.__tracksChanges__
+
+    @classproperty
+    def contentOnly(cls):
+        """
+        Getter method that returns whether this task's results only depend on the scene's contents and the paths from `outputPaths`.
+        Identical scene files are only deduplicated when every task is content-only.
+
+        :rtype: bool
+        """
+
+        return cls.__contentOnly__
+
     @classproperty
     def scene(cls):
         """
@@ -69,6 +116,94 @@ class AbstractTask(with_metaclass(ABCMeta, psonobject.PSONObject)):
     # endregion
 
     # region Methods
+    def requiredReferences(self):
+        """
+        Returns the reference patterns this task requires to be loaded.
+        Patterns are compared against both the reference node names and their namespaces.
+        This is only consulted when the task manager opens scene files with deferred references.
+
+        :rtype: List[str]
+        """
+
+        return list(self.__references__)
+
+    def markDirty(self):
+        """
+        Notifies the task manager that this task has modified the open scene file.
+
+        :rtype: None
+        """
+
+        taskManager = self.taskManager
+
+        if taskManager is not None:
+
+            taskManager.markDirty()
+
+    def beginBatch(self):
+        """
+        Notifies this task that a new batch is about to begin.
+        Overload this method to perform any expensive preparation only once per batch.
+
+        :rtype: None
+        """
+
+        pass
+
+    def endBatch(self):
+        """
+        Notifies this task that the current batch has ended.
+        Overload this method to release anything acquired inside `beginBatch`.
+
+        :rtype: None
+        """
+
+        pass
+
+    def outputPaths(self, filePath):
+        """
+        Returns the paths this task writes to when executed on the supplied file.
+        These are used to derive the outputs of identical scene files from a single representative.
+
+        :type filePath: str
+        :rtype: List[str]
+        """
+
+        return []
+
+    def isApplicable(self, filePath):
+        """
+        Evaluates if this task would do anything to the supplied file before it is opened.
+        Overload this method with cheap checks, such as filename patterns or sidecar files, that do not require the scene to be open.
+        Return true if the task applies, false if it does not, or none if the task alone is no reason to open the file.
+
+        :type filePath: str
+        :rtype: Union[bool, None]
+        """
+
+        return True
+
+    def canDoItAsText(self, scene):
+        """
+        Evaluates if this task can be executed on the supplied ASCII scene without opening it.
+        Overload this method, along with `doItAsText`, to support text-mode execution.
+
+        :type scene: ezbatcher.libs.asciiscene.AsciiScene
+        :rtype: bool
+        """
+
+        return False
+
+    def doItAsText(self, scene, *args, **kwargs):
+        """
+        Executes this task on the supplied ASCII scene.
+
+        :type scene: ezbatcher.libs.asciiscene.AsciiScene
+        :rtype: None
+        """
+
+        raise NotImplementedError(f'doItAsText() {self.title} task does not support text-mode execution!')
+
     @abstractmethod
     def doIt(self, *args, **kwargs):
         """
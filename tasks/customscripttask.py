@@ -1,3 +1,6 @@
+import os
+import hashlib
+
 from enum import IntEnum
 from dcc.python import stringutils
 from dcc.ui import qfileedit
@@ -21,11 +24,16 @@ class Language(IntEnum):
 class CustomScriptTask(abstracttask.AbstractTask):
     """
     Overload of `AbstractTask` that executes a custom script.
+    Python scripts run through the scene interface, in the interactive session's namespace, unless an entry-point or persistent namespace is requested.
+    Those scripts are instead only compiled once per session and their code objects are cached by content hash.
     """
 
     # region Dunderscores
-    __slots__ = ('_filePath', '_script', '_language')
+    __slots__ = ('_filePath', '_script', '_language', '_references', '_entryPoint', '_persistentNamespace', '_scope')
     __title__ = 'Custom Script'
+    __sources__ = {}
+    __compiled__ = {}
+    __namespaces__ = {}
 
     def __init__(self, *args, **kwargs):
         """
@@ -43,6 +51,10 @@ class CustomScriptTask(abstracttask.AbstractTask):
         self._filePath = kwargs.get('filePath', '')
         self._script = kwargs.get('script', '')
         self._language = kwargs.get('language', Language.Python)
+        self._references = kwargs.get('references', [])
+        self._entryPoint = kwargs.get('entryPoint', '')
+        self._persistentNamespace = kwargs.get('persistentNamespace', False)
+        self._scope = abstracttask.Scope(kwargs.get('scope', abstracttask.Scope.PerFile))
     # endregion
 
     # region Properties
@@ -108,6 +120,93 @@ class CustomScriptTask(abstracttask.AbstractTask):
         """
 
         self._language = Language(language)
+
+    @property
+    def references(self):
+        """
+        Getter method that returns the reference patterns the script requires.
+
+        :rtype: List[str]
+        """
+
+        return self._references
+
+    @references.setter
+    def references(self, references):
+        """
+        Setter method that updates the reference patterns the script requires.
+
+        :type references: List[str]
+        :rtype: None
+        """
+
+        self._references.clear()
+        self._references.extend(references)
+
+    @property
+    def entryPoint(self):
+        """
+        Getter method that returns the name of the Python function to invoke for each file.
+
+        :rtype: str
+        """
+
+        return self._entryPoint
+
+    @entryPoint.setter
+    def entryPoint(self, entryPoint):
+        """
+        Setter method that updates the name of the Python function to invoke for each file.
+
+        :type entryPoint: str
+        :rtype: None
+        """
+
+        self._entryPoint = entryPoint
+
+    @property
+    def persistentNamespace(self):
+        """
+        Getter method that returns the `persistentNamespace` flag.
+        When enabled, Python scripts share a single namespace for the entire session.
+
+        :rtype: bool
+        """
+
+        return self._persistentNamespace
+
+    @persistentNamespace.setter
+    def persistentNamespace(self, persistentNamespace):
+        """
+        Setter method that updates the `persistentNamespace` flag.
+
+        :type persistentNamespace: bool
+        :rtype: None
+        """
+
+        self._persistentNamespace = persistentNamespace
+
+    @property
+    def scope(self):
+        """
+        Getter method that returns how often this script should be executed.
+        Setup scripts, such as those loading plugins or preferences, only need to be executed once per session.
+
+        :rtype: abstracttask.Scope
+        """
+
+        return self._scope
+
+    @scope.setter
+    def scope(self, scope):
+        """
+        Setter method that updates how often this script should be executed.
+
+        :type scope: abstracttask.Scope
+        :rtype: None
+        """
+
+        self._scope = abstracttask.Scope(scope)
     # endregion
 
     # region Methods
@@ -129,19 +228,139 @@ class CustomScriptTask(abstracttask.AbstractTask):
 
             return super(CustomScriptTask, cls).createEditor(name, parent=parent)
 
+    def requiredReferences(self):
+        """
+        Returns the reference patterns this task requires to be loaded.
+
+        :rtype: List[str]
+        """
+
+        return list(self.references)
+
+    @classmethod
+    def readSource(cls, filePath):
+        """
+        Returns the source code from the supplied file.
+        The source is only re-read from disk if the file's size or modification time changes.
+
+        :type filePath: str
+        :rtype: str
+        """
+
+        stats = os.stat(filePath)
+        signature = (stats.st_size, stats.st_mtime)
+
+        cachedSignature, source = cls.__sources__.get(filePath, (None, ''))
+
+        if signature != cachedSignature:
+
+            with open(filePath, 'r', encoding='utf-8') as file:
+
+                source = file.read()
+
+            cls.__sources__[filePath] = (signature, source)
+
+        return source
+
+    @classmethod
+    def compileSource(cls, source, filename):
+        """
+        Returns a compiled code object along with the content hash for the supplied source.
+        Code objects are cached by content hash so each script is only compiled once.
+
+        :type source: str
+        :type filename: str
+        :rtype: Tuple[str, types.CodeType]
+        """
+
+        digest = hashlib.sha1(source.encode('utf-8')).hexdigest()
+        code = cls.__compiled__.get(digest, None)
+
+        if code is None:
+
+            code = compile(source, filename, 'exec')
+            cls.__compiled__[digest] = code
+
+        return digest, code
+
+    def executePython(self, source, filename, *args, **kwargs):
+        """
+        Executes the supplied Python source.
+        If a persistent namespace is used then the script body is only executed once per session.
+        If an entry-point is specified then it is invoked with this task's arguments afterwards.
+
+        :type source: str
+        :type filename: str
+        :rtype: Any
+        """
+
+        # Check if script body requires executing
+        #
+        digest, code = self.compileSource(source, filename)
+        namespace = self.__namespaces__.get(digest, None) if self.persistentNamespace else None
+
+        if namespace is None:
+
+            namespace = {'__name__': '__main__', '__file__': filename}
+            exec(code, namespace)
+
+            if self.persistentNamespace:
+
+                self.__namespaces__[digest] = namespace
+
+        elif stringutils.isNullOrEmpty(self.entryPoint):
+
+            exec(code, namespace)
+
+        # Check if entry-point requires invoking
+        #
+        if stringutils.isNullOrEmpty(self.entryPoint):
+
+            return None
+
+        function = namespace.get(self.entryPoint, None)
+
+        if not callable(function):
+
+            raise TypeError(f'executePython() cannot locate "{self.entryPoint}" entry-point in: {filename}')
+
+        return function(*args, **kwargs)
+
+    def isIsolated(self):
+        """
+        Evaluates if Python scripts should be executed inside their own namespace.
+        This is only the case when an entry-point or persistent namespace has been requested.
+
+        :rtype: bool
+        """
+
+        return self.persistentNamespace or not stringutils.isNullOrEmpty(self.entryPoint)
+
     def doIt(self, *args, **kwargs):
         """
         Executes this task.
 
-        :rtype: None
+        :rtype: Any
         """
 
+        results = None
+
         # Check if file path exists
         #
         if not stringutils.isNullOrEmpty(self.filePath):
 
             log.info('Executing file: %s' % self.filePath)
-            self.scene.executeFile(self.filePath)
+
+            isPython = self.filePath.lower().endswith('.py')
+
+            if isPython and self.isIsolated():
+
+                source = self.readSource(self.filePath)
+                results = self.executePython(source, self.filePath, *args, **kwargs)
+
+            else:
+
+                self.scene.executeFile(self.filePath)
 
         # Check if script is valid
         #
@@ -149,6 +368,15 @@ class CustomScriptTask(abstracttask.AbstractTask):
 
             log.info('Executing custom script.')
 
-            asPython = self.language == Language.Python
-            self.scene.execute(self.script, asPython=asPython)
+            isPython = self.language == Language.Python
+
+            if isPython and self.isIsolated():
+
+                results = self.executePython(self.script, '<script>', *args, **kwargs)
+
+            else:
+
+                self.scene.execute(self.script, asPython=isPython)
+
+        return results
     # endregion
@@ -2,8 +2,10 @@ import os
 
 from fnmatch import fnmatch
 from dcc.fbx.libs import fbxio
+from dcc.json import jsonutils
 from dcc.python import stringutils
 from .abstract import abstracttask
+from ..libs import sceneheader
 
 import logging
 logging.basicConfig()
@@ -29,6 +31,8 @@ class EditExportRangesTask(abstracttask.AbstractTask):
 
     )
     __title__ = 'Edit FBX Export Ranges'
+    __tracksChanges__ = True
+    __contentOnly__ = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -245,6 +249,44 @@ class EditExportRangesTask(abstracttask.AbstractTask):
 
             return True
 
+    def isApplicable(self, filePath):
+        """
+        Evaluates if this task would do anything to the supplied file before it is opened.
+        If there are file filters then at least one referenced file must match them.
+        Only Maya ASCII headers can be read reliably so any other files are assumed to apply.
+        Since headers only list top-level references, files that do not match are left undecided unless they contain no references at all.
+
+        :type filePath: str
+        :rtype: Union[bool, None]
+        """
+
+        # Check if there are any filters
+        #
+        numFilters = len(self.fileFilters)
+        extension = os.path.splitext(filePath)[-1].lower()
+
+        if numFilters == 0 or extension != '.ma' or self.removeRedundancies:
+
+            return True
+
+        # Check if any references match
+        # Nested references may still match so only files without references can be declined!
+        #
+        filenames = [os.path.basename(path) for path in sceneheader.iterAsciiReferencePaths(filePath)]
+        numFilenames = len(filenames)
+
+        if numFilenames == 0:
+
+            return False
+
+        elif any([fnmatch(filename, pattern) for filename in filenames for pattern in self.fileFilters]):
+
+            return True
+
+        else:
+
+            return None
+
     def doIt(self, *args, **kwargs):
         """
         Executes this task.
@@ -257,6 +299,8 @@ class EditExportRangesTask(abstracttask.AbstractTask):
         sequencers = self.fbxIO.loadSequencers()
         numSequencers = len(sequencers)
 
+        original = jsonutils.dumps(sequencers)
+
         if self.removeRedundancies and numSequencers == 1:
 
             sequencer = sequencers[0]
@@ -307,7 +351,17 @@ class EditExportRangesTask(abstracttask.AbstractTask):
 
                     sequence.moveToOrigin = True
 
+        # Check if any changes were made
+        #
+        modified = jsonutils.dumps(sequencers)
+
+        if modified == original:
+
+            log.info('No export-range changes required.')
+            return
+
         # Commit changes to sequencers
         #
         self.fbxIO.saveSequencers(sequencers)
+        self.markDirty()
     # endregion
@@ -1,8 +1,11 @@
 import os
 
+from dcc.perforce import p4utils
+from dcc.python import stringutils
 from dcc.ui import qdirectoryedit
 from dcc.fbx.libs import fbxio
 from .abstract import abstracttask
+from ..libs import fbxassetcache, fbxmanifest, workerpool
 
 import logging
 logging.basicConfig()
@@ -20,10 +23,18 @@ class ExportFbxTask(abstracttask.AbstractTask):
         '_fbxIO',
         '_animationOnly',
         '_alternateDirectory',
-        '_checkout'
+        '_checkout',
+        '_skipUpToDate',
+        '_fanOut',
+        '_assetCacheDirectory',
+        '_hardLinkAssets',
+        '_manifests',
+        '_assetCache'
     )
 
     __title__ = 'Export Fbx'
+    __references__ = ('*',)
+    __tracksChanges__ = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -42,6 +53,12 @@ class ExportFbxTask(abstracttask.AbstractTask):
         self._animationOnly = kwargs.get('animationOnly', True)
         self._alternateDirectory = kwargs.get('alternateDirectory', '')
         self._checkout = kwargs.get('checkout', False)
+        self._skipUpToDate = kwargs.get('skipUpToDate', True)
+        self._fanOut = kwargs.get('fanOut', 0)
+        self._assetCacheDirectory = kwargs.get('assetCacheDirectory', '')
+        self._hardLinkAssets = kwargs.get('hardLinkAssets', False)
+        self._manifests = fbxmanifest.FbxManifests()
+        self._assetCache = fbxassetcache.FbxAssetCache(self._assetCacheDirectory)
     # endregion
 
     # region Properties
@@ -117,6 +134,92 @@ class ExportFbxTask(abstracttask.AbstractTask):
         """
 
         self._checkout = checkout
+
+    @property
+    def skipUpToDate(self):
+        """
+        Getter method that returns the "skipUpToDate" flag.
+
+        :rtype: bool
+        """
+
+        return self._skipUpToDate
+
+    @skipUpToDate.setter
+    def skipUpToDate(self, skipUpToDate):
+        """
+        Setter method that updates the "skipUpToDate" flag.
+
+        :type skipUpToDate: bool
+        :rtype: None
+        """
+
+        self._skipUpToDate = skipUpToDate
+
+    @property
+    def fanOut(self):
+        """
+        Getter method that returns the number of worker processes to split export ranges across.
+        Values less than 2 will export every range from the current session.
+
+        :rtype: int
+        """
+
+        return self._fanOut
+
+    @fanOut.setter
+    def fanOut(self, fanOut):
+        """
+        Setter method that updates the number of worker processes to split export ranges across.
+
+        :type fanOut: int
+        :rtype: None
+        """
+
+        self._fanOut = fanOut
+
+    @property
+    def assetCacheDirectory(self):
+        """
+        Getter method that returns the directory used to persist asset exports between batches.
+
+        :rtype: str
+        """
+
+        return self._assetCacheDirectory
+
+    @assetCacheDirectory.setter
+    def assetCacheDirectory(self, assetCacheDirectory):
+        """
+        Setter method that updates the directory used to persist asset exports between batches.
+
+        :type assetCacheDirectory: str
+        :rtype: None
+        """
+
+        self._assetCacheDirectory = assetCacheDirectory
+        self._assetCache = fbxassetcache.FbxAssetCache(assetCacheDirectory)
+
+    @property
+    def hardLinkAssets(self):
+        """
+        Getter method that returns the "hardLinkAssets" flag.
+
+        :rtype: bool
+        """
+
+        return self._hardLinkAssets
+
+    @hardLinkAssets.setter
+    def hardLinkAssets(self, hardLinkAssets):
+        """
+        Setter method that updates the "hardLinkAssets" flag.
+
+        :type hardLinkAssets: bool
+        :rtype: None
+        """
+
+        self._hardLinkAssets = hardLinkAssets
     # endregion
 
     # region Methods
@@ -130,7 +233,7 @@ class ExportFbxTask(abstracttask.AbstractTask):
         :rtype: Union[QtWidgets.QWidget, None]
         """
 
-        if name == 'alternateDirectory':
+        if name in ('alternateDirectory', 'assetCacheDirectory'):
 
             return qdirectoryedit.QDirectoryEdit(parent=parent)
 
@@ -138,6 +241,355 @@ class ExportFbxTask(abstracttask.AbstractTask):
 
             return super(ExportFbxTask, cls).createEditor(name, parent=parent)
 
+    @staticmethod
+    def getExportPath(exportRange, directory=''):
+        """
+        Returns the export path for the supplied export range.
+        If a directory is supplied then it will override the range's directory.
+
+        :type exportRange: dcc.fbx.libs.fbxexportrange.FbxExportRange
+        :type directory: str
+        :rtype: str
+        """
+
+        exportPath = exportRange.exportPath()
+
+        if not stringutils.isNullOrEmpty(directory):
+
+            exportPath = os.path.join(directory, os.path.basename(exportPath))
+
+        return os.path.abspath(exportPath)
+
+    def getFingerprints(self, sequencers, directory=''):
+        """
+        Returns the export paths and fingerprints for the supplied sequencers.
+        If the open scene has been modified then the fingerprints will be none since it no longer matches the file on disk!
+
+        :type sequencers: List[dcc.fbx.libs.fbxsequencer.FbxSequencer]
+        :type directory: str
+        :rtype: List[Tuple[str, Union[str, None]]]
+        """
+
+        sceneRevision = None if self.taskManager.isDirty() else fbxmanifest.getFileRevision(self.taskManager.currentFilePath)
+        fingerprints = []
+
+        for sequencer in sequencers:
+
+            # Check if sequencer is valid
+            #
+            if not sequencer.isValid():
+
+                continue
+
+            # Iterate through export ranges
+            #
+            for exportRange in sequencer.exportRanges:
+
+                exportPath = self.getExportPath(exportRange, directory=directory)
+
+                if sceneRevision is not None:
+
+                    fingerprint = fbxmanifest.getExportRangeFingerprint(sceneRevision, sequencer, exportRange, directory=directory)
+                    fingerprints.append((exportPath, fingerprint))
+
+                else:
+
+                    fingerprints.append((exportPath, None))
+
+        return fingerprints
+
+    @staticmethod
+    def getExportRangeIndices(sequencers):
+        """
+        Returns the sequencer and export range index pairs from the supplied sequencers.
+
+        :type sequencers: List[dcc.fbx.libs.fbxsequencer.FbxSequencer]
+        :rtype: List[List[int]]
+        """
+
+        return [[i, j] for (i, sequencer) in enumerate(sequencers) if sequencer.isValid() for j in range(len(sequencer.exportRanges))]
+
+    def getExportRanges(self):
+        """
+        Returns the sequencer and export range index pairs this task should export.
+        These are only supplied to fan-out workers through the current file's options.
+        An empty list will export every range.
+
+        :rtype: List[List[int]]
+        """
+
+        return self.taskManager.currentOptions.get('exportRanges', [])
+
+    @staticmethod
+    def filterSequencers(sequencers, exportRanges):
+        """
+        Removes any export ranges that are not listed from the supplied sequencers.
+
+        :type sequencers: List[dcc.fbx.libs.fbxsequencer.FbxSequencer]
+        :type exportRanges: List[List[int]]
+        :rtype: None
+        """
+
+        indices = set(map(tuple, exportRanges))
+
+        for (i, sequencer) in enumerate(sequencers):
+
+            selected = [exportRange for (j, exportRange) in enumerate(sequencer.exportRanges) if (i, j) in indices]
+
+            sequencer.exportRanges.clear()
+            sequencer.exportRanges.extend(selected)
+
+    def fanOutSequencers(self, sequencers, fingerprints):
+        """
+        Splits the export ranges from the supplied sequencers across multiple worker processes.
+        Each worker opens the scene file from disk and only exports its own chunk of export ranges.
+        The results from each worker are then merged into the current file's results.
+        The fingerprints of any successful chunks are recorded once all the workers have finished.
+
+        :type sequencers: List[dcc.fbx.libs.fbxsequencer.FbxSequencer]
+        :type fingerprints: List[Tuple[str, Union[str, None]]]
+        :rtype: None
+        """
+
+        # Split export ranges into contiguous chunks
+        # This keeps export ranges that share a rig on the same worker whenever possible
+        #
+        indices = self.getExportRangeIndices(sequencers)
+        chunkCount = min(self.fanOut, len(indices))
+        chunkSize = -(-len(indices) // chunkCount)
+
+        chunks = [indices[i:(i + chunkSize)] for i in range(0, len(indices), chunkSize)]
+        chunkFingerprints = [fingerprints[i:(i + chunkSize)] for i in range(0, len(fingerprints), chunkSize)]
+
+        # Execute a copy of this task for each chunk
+        #
+        log.info(f'Fanning out {len(indices)} export range(s) across {len(chunks)} worker(s).')
+
+        task = type(self)(
+            animationOnly=self.animationOnly,
+            alternateDirectory=self.alternateDirectory,
+            checkout=self.checkout,
+            skipUpToDate=self.skipUpToDate
+        )
+
+        taskManager = type(self.taskManager)(tasks=[task])
+        pool = workerpool.WorkerPool(taskManager, workerCount=len(chunks))
+
+        records = pool.executeChunks(self.taskManager.currentFilePath, *[{'exportRanges': chunk} for chunk in chunks], index=self.taskManager.currentIndex)
+
+        # Merge results from each worker
+        #
+        results = self.taskManager.currentResults
+        exportPaths = results.setdefault('exportPaths', [])
+        errors = []
+
+        for (record, fingerprints) in zip(records, chunkFingerprints):
+
+            exportPaths.extend(record.get('results', {}).get('exportPaths', []))
+
+            if record['status'] == 'failed':
+
+                errors.append(record['error'])
+
+            else:
+
+                self.recordFingerprints(fingerprints)
+
+        if self.skipUpToDate:
+
+            self._manifests.save()
+
+        results['exportChunks'] = [{'status': record['status'], 'error': record['error'], 'elapsed': record['elapsed'], 'pid': record.get('pid', None)} for record in records]
+
+        if len(errors) > 0:
+
+            raise RuntimeError(f'fanOutSequencers() {len(errors)} export chunk(s) failed: {"; ".join(errors)}')
+
+    def exportSequencers(self, directory='', checkout=False):
+        """
+        Exports the sequencers from the open scene file.
+        If this task was supplied export ranges then the sequencers are temporarily filtered to those ranges.
+
+        :type directory: str
+        :type checkout: bool
+        :rtype: None
+        """
+
+        # Check if export ranges should be filtered
+        #
+        sequencers = self.fbxIO.loadSequencers()
+        exportRanges = self.getExportRanges()
+
+        if len(exportRanges) == 0:
+
+            self.exportSequencersFrom(sequencers, directory=directory, checkout=checkout)
+            return
+
+        # Export from the filtered sequencers
+        # The original sequencers are always restored so a later save never writes the filtered ranges!
+        #
+        originals = self.fbxIO.loadSequencers()
+
+        self.filterSequencers(sequencers, exportRanges)
+        self.fbxIO.saveSequencers(sequencers)
+
+        try:
+
+            self.exportSequencersFrom(sequencers, directory=directory, checkout=checkout, isChunk=True)
+
+        finally:
+
+            self.fbxIO.saveSequencers(originals)
+
+    def exportSequencersFrom(self, sequencers, directory='', checkout=False, isChunk=False):
+        """
+        Exports the supplied sequencers, which must match those saved to the open scene file.
+        If every export range is up-to-date then the export is skipped.
+        Otherwise, all the export ranges are exported and their fingerprints are recorded.
+        Chunks are never fanned out any further.
+
+        :type sequencers: List[dcc.fbx.libs.fbxsequencer.FbxSequencer]
+        :type directory: str
+        :type checkout: bool
+        :type isChunk: bool
+        :rtype: None
+        """
+
+        # Check if all export ranges are up-to-date
+        #
+        fingerprints = self.getFingerprints(sequencers, directory=directory)
+
+        if self.skipUpToDate:
+
+            isUpToDate = len(fingerprints) > 0 and all(fingerprint is not None and self._manifests.isUpToDate(exportPath, fingerprint) for (exportPath, fingerprint) in fingerprints)
+
+            if isUpToDate:
+
+                log.info(f'Skipping {len(fingerprints)} up-to-date export range(s).')
+                return
+
+        # Check if export ranges should be fanned out
+        # Modified scenes cannot be fanned out since workers open the scene file from disk!
+        #
+        isFannable = self.fanOut > 1 and not isChunk and len(fingerprints) > 1
+
+        if isFannable and not self.taskManager.isDirty():
+
+            self.fanOutSequencers(sequencers, fingerprints)
+            return
+
+        # Export sequencers
+        #
+        self.fbxIO.exportSequencers(directory=directory, checkout=checkout)
+        self.taskManager.currentResults.setdefault('exportPaths', []).extend(exportPath for (exportPath, fingerprint) in fingerprints)
+
+        # Record fingerprints
+        # Chunks leave this to the task that fanned them out so each manifest is only written once per scene!
+        #
+        if not self.skipUpToDate or isChunk:
+
+            return
+
+        self.recordFingerprints(fingerprints)
+        self._manifests.save()
+
+    def recordFingerprints(self, fingerprints):
+        """
+        Updates the manifests with the supplied export path and fingerprint pairs.
+        The manifests are not saved until `FbxManifests.save` is called.
+
+        :type fingerprints: List[Tuple[str, Union[str, None]]]
+        :rtype: None
+        """
+
+        if not self.skipUpToDate:
+
+            return
+
+        for (exportPath, fingerprint) in fingerprints:
+
+            self._manifests.setFingerprint(exportPath, fingerprint)
+
+    def exportAsset(self, checkout=False):
+        """
+        Exports the asset from the open scene file.
+        Export sets that were already exported, from a file referencing the same assets with the same settings, are reused instead.
+
+        :type checkout: bool
+        :rtype: None
+        """
+
+        # Check if references can be identified
+        # Modified scenes cannot be identified since they no longer match the file on disk!
+        #
+        referenceRevisions = fbxassetcache.getReferenceRevisions(self.taskManager.currentFilePath)
+
+        if len(referenceRevisions) == 0 or self.taskManager.isDirty():
+
+            self.fbxIO.exportAsset(checkout=checkout)
+            return
+
+        # Collect keys for export sets
+        #
+        asset = self.fbxIO.loadAsset()
+        exports = []
+
+        for exportSet in asset.exportSets:
+
+            exportPath = os.path.abspath(exportSet.exportPath())
+            key = fbxmanifest.getFingerprint(references=referenceRevisions, settings=fbxassetcache.getExportSetSettings(exportSet))
+
+            exports.append((exportPath, key, self._assetCache.get(key)))
+
+        # Check if all export sets can be reused
+        #
+        isReusable = len(exports) > 0 and all(cachePath is not None for (exportPath, key, cachePath) in exports)
+
+        if isReusable:
+
+            for (exportPath, key, cachePath) in exports:
+
+                if os.path.normcase(exportPath) == os.path.normcase(cachePath):
+
+                    continue
+
+                log.info(f'Reusing asset export: {cachePath} > {exportPath}')
+
+                if checkout:
+
+                    p4utils.tryCheckout(exportPath)
+
+                fbxassetcache.replaceFile(cachePath, exportPath, hardLink=self.hardLinkAssets)
+
+            return
+
+        # Break any hard links before exporting over them
+        #
+        for (exportPath, key, cachePath) in exports:
+
+            if os.path.isfile(exportPath) and os.stat(exportPath).st_nlink > 1:
+
+                fbxassetcache.breakLink(exportPath)
+
+        # Export asset and register export sets for reuse
+        #
+        self.fbxIO.exportAsset(checkout=checkout)
+
+        for (exportPath, key, cachePath) in exports:
+
+            self._assetCache.put(key, exportPath)
+
+    def beginBatch(self):
+        """
+        Notifies this task that a new batch is about to begin.
+        Export manifests are reloaded and reusable asset exports are cleared at the start of each batch.
+
+        :rtype: None
+        """
+
+        self._manifests = fbxmanifest.FbxManifests()
+        self._assetCache.clear()
+
     def doIt(self, *args, **kwargs):
         """
         Executes this task.
@@ -150,9 +602,9 @@ class ExportFbxTask(abstracttask.AbstractTask):
 
         if self.animationOnly:
 
-            self.fbxIO.exportSequencers(directory=directory, checkout=checkout)
+            self.exportSequencers(directory=directory, checkout=checkout)
 
         else:
 
-            self.fbxIO.exportAsset(checkout=checkout)
+            self.exportAsset(checkout=checkout)
     # endregion
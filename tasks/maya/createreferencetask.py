@@ -20,6 +20,8 @@ class CreateReferenceTask(abstracttask.AbstractTask):
     # region Dunderscores
     __slots__ = ('_filePath', '_namespace')
     __title__ = 'Create Reference'
+    __tracksChanges__ = True
+    __contentOnly__ = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -129,6 +131,7 @@ class CreateReferenceTask(abstracttask.AbstractTask):
         if not om.MNamespace.namespaceExists(self.namespace):
 
             mc.file(self.filePath, reference=True, namespace=self.namespace)
+            self.markDirty()
 
         else:
 
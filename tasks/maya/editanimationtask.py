@@ -16,6 +16,7 @@ class EditAnimationTask(abstracttask.AbstractTask):
     # region Dunderscores
     __slots__ = ('_namespace', '_invertPlugs', '_normalizePlugs')
     __title__ = 'Edit Animation'
+    __contentOnly__ = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -103,6 +104,15 @@ class EditAnimationTask(abstracttask.AbstractTask):
     # endregion
 
     # region Methods
+    def requiredReferences(self):
+        """
+        Returns the reference patterns this task requires to be loaded.
+
+        :rtype: List[str]
+        """
+
+        return [self.namespace]
+
     def iterPlugFromNames(self, *plugNames):
         """
         Returns a generator that yields plugs from the supplied names.
@@ -4,9 +4,10 @@ from maya import cmds as mc
 from maya.api import OpenMaya as om
 from dcc.json import jsonutils
 from dcc.python import pathutils
+from dcc.ui import qdirectoryedit
 from ezposer.libs import poseutils
-from ezposer.ui import qezposer
 from ..abstract import abstracttask
+from ...libs import poserutils
 
 import logging
 logging.basicConfig()
@@ -20,8 +21,17 @@ class ExportAnimationTask(abstracttask.AbstractTask):
     """
 
     # region Dunderscores
-    __slots__ = ('_namespace', '_rigConfiguration', '_renameNodeMap', '_renameAttributeMap', '_normalizeCustomAttributes')
+    __slots__ = (
+        '_namespace',
+        '_rigConfiguration',
+        '_renameNodeMap',
+        '_renameAttributeMap',
+        '_normalizeCustomAttributes',
+        '_sidecarDirectory',
+        '_renameMaps'
+    )
     __title__ = 'Export Animation'
+    __tracksChanges__ = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -41,6 +51,8 @@ class ExportAnimationTask(abstracttask.AbstractTask):
         self._renameNodeMap = kwargs.get('renameNodeMap', '')
         self._renameAttributeMap = kwargs.get('renameAttributeMap', '')
         self._normalizeCustomAttributes = kwargs.get('normalizeCustomAttributes', True)
+        self._sidecarDirectory = kwargs.get('sidecarDirectory', '')
+        self._renameMaps = None
     # endregion
 
     # region Properties
@@ -148,9 +160,69 @@ class ExportAnimationTask(abstracttask.AbstractTask):
         """
 
         self._normalizeCustomAttributes = normalizeCustomAttributes
+
+    @property
+    def sidecarDirectory(self):
+        """
+        Getter method that returns the directory animation files are exported to.
+        An empty string indicates animation files are exported next to each scene.
+
+        :rtype: str
+        """
+
+        return self._sidecarDirectory
+
+    @sidecarDirectory.setter
+    def sidecarDirectory(self, sidecarDirectory):
+        """
+        Setter method that updates the directory animation files are exported to.
+
+        :type sidecarDirectory: str
+        :rtype: None
+        """
+
+        self._sidecarDirectory = sidecarDirectory
     # endregion
 
     # region Methods
+    @classmethod
+    def createEditor(cls, name, parent=None):
+        """
+        Returns a Qt editor for the specified property.
+
+        :type name: str
+        :type parent: Union[QtWidgets.QWidget, None]
+        :rtype: Union[QtWidgets.QWidget, None]
+        """
+
+        if name == 'sidecarDirectory':
+
+            return qdirectoryedit.QDirectoryEdit(parent=parent)
+
+        else:
+
+            return super(ExportAnimationTask, cls).createEditor(name, parent=parent)
+
+    def requiredReferences(self):
+        """
+        Returns the reference patterns this task requires to be loaded.
+
+        :rtype: List[str]
+        """
+
+        return [self.namespace]
+
+    def beginBatch(self):
+        """
+        Notifies this task that a new batch is about to begin.
+        The rig configuration and rename maps are re-evaluated once at the start of each batch.
+
+        :rtype: None
+        """
+
+        poserutils.invalidate()
+        self._renameMaps = None
+
     def loadRenameNodeMap(self):
         """
         Returns a deserialized rename node map.
@@ -181,6 +253,20 @@ class ExportAnimationTask(abstracttask.AbstractTask):
 
             return jsonutils.loads(self.renameAttributeMap, default={})
 
+    def getRenameMaps(self):
+        """
+        Returns the deserialized rename node and attribute maps.
+        The maps are only loaded once per batch.
+
+        :rtype: Tuple[Dict[str, str], Dict[str, str]]
+        """
+
+        if self._renameMaps is None:
+
+            self._renameMaps = (self.loadRenameNodeMap(), self.loadRenameAttributeMap())
+
+        return self._renameMaps
+
     def doIt(self, *args, **kwargs):
         """
         Executes this task.
@@ -188,14 +274,9 @@ class ExportAnimationTask(abstracttask.AbstractTask):
         :rtype: None
         """
 
-        # Update namespace and configuration
-        #
-        qezposer.QEzPoser.setCurrentConfiguration(self.rigConfiguration)
-        qezposer.QEzPoser.setCurrentNamespace(self.namespace)
-
         # Create pose from controls
         #
-        nodes = list(qezposer.QEzPoser.iterControls(visible=False))
+        nodes = poserutils.getControls(self.rigConfiguration, self.namespace)
 
         pose = poseutils.createPose(
             *nodes,
@@ -206,8 +287,7 @@ class ExportAnimationTask(abstracttask.AbstractTask):
 
         # Update pose node names
         #
-        renameNodeMap = self.loadRenameNodeMap()
-        renameAttributeMap = self.loadRenameAttributeMap()
+        renameNodeMap, renameAttributeMap = self.getRenameMaps()
 
         for node in pose.nodes:
 
@@ -215,7 +295,7 @@ class ExportAnimationTask(abstracttask.AbstractTask):
 
             for attribute in node.attributes:
 
-                attribute.name = renameAttributeMap(attribute.name, attribute.name)
+                attribute.name = renameAttributeMap.get(attribute.name, attribute.name)
 
                 if attribute.isCustom and self.normalizeCustomAttributes:
 
@@ -231,6 +311,9 @@ class ExportAnimationTask(abstracttask.AbstractTask):
 
         # Export pose using current scene name
         #
-        filePath = os.path.join(self.taskManager.currentDirectory, f'{self.taskManager.currentName}.anim')
+        filePath = self.taskManager.sidecars.getOutputPath(self.taskManager.currentFilePath, '.anim', roots=[self.sidecarDirectory])
+        os.makedirs(os.path.dirname(filePath), exist_ok=True)
+
         poseutils.exportPose(filePath, pose)
+        self.taskManager.sidecars.invalidate(filePath)
     # endregion
@@ -1,11 +1,10 @@
-import os
-
 from maya import cmds as mc
 from maya.api import OpenMaya as om
 from dcc.python import stringutils
+from dcc.ui import qdirectoryedit
 from ezposer.libs import poseutils
-from ezposer.ui import qezposer
 from ..abstract import abstracttask
+from ...libs import poserutils
 
 import logging
 logging.basicConfig()
@@ -19,8 +18,9 @@ class ImportAnimationTask(abstracttask.AbstractTask):
     """
 
     # region Dunderscores
-    __slots__ = ('_namespace', '_rigConfiguration')
+    __slots__ = ('_namespace', '_rigConfiguration', '_sidecarDirectory')
     __title__ = 'Import Animation'
+    __tracksChanges__ = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -37,6 +37,7 @@ class ImportAnimationTask(abstracttask.AbstractTask):
         #
         self._namespace = kwargs.get('namespace', 'X')
         self._rigConfiguration = kwargs.get('rigConfiguration', "Rig o'tron")
+        self._sidecarDirectory = kwargs.get('sidecarDirectory', '')
     # endregion
 
     # region Properties
@@ -81,9 +82,88 @@ class ImportAnimationTask(abstracttask.AbstractTask):
         """
 
         self._rigConfiguration = rigConfiguration
+
+    @property
+    def sidecarDirectory(self):
+        """
+        Getter method that returns the directory searched for animation files before each scene's own directory.
+
+        :rtype: str
+        """
+
+        return self._sidecarDirectory
+
+    @sidecarDirectory.setter
+    def sidecarDirectory(self, sidecarDirectory):
+        """
+        Setter method that updates the directory searched for animation files before each scene's own directory.
+
+        :type sidecarDirectory: str
+        :rtype: None
+        """
+
+        self._sidecarDirectory = sidecarDirectory
     # endregion
 
     # region Methods
+    @classmethod
+    def createEditor(cls, name, parent=None):
+        """
+        Returns a Qt editor for the specified property.
+
+        :type name: str
+        :type parent: Union[QtWidgets.QWidget, None]
+        :rtype: Union[QtWidgets.QWidget, None]
+        """
+
+        if name == 'sidecarDirectory':
+
+            return qdirectoryedit.QDirectoryEdit(parent=parent)
+
+        else:
+
+            return super(ImportAnimationTask, cls).createEditor(name, parent=parent)
+
+    def requiredReferences(self):
+        """
+        Returns the reference patterns this task requires to be loaded.
+
+        :rtype: List[str]
+        """
+
+        return [self.namespace]
+
+    def beginBatch(self):
+        """
+        Notifies this task that a new batch is about to begin.
+        The rig configuration is re-evaluated once at the start of each batch.
+
+        :rtype: None
+        """
+
+        poserutils.invalidate()
+
+    def getAnimationPath(self, filePath):
+        """
+        Returns the animation file path for the supplied scene file.
+        If no animation file exists then none is returned!
+
+        :type filePath: str
+        :rtype: Union[str, None]
+        """
+
+        return self.taskManager.sidecars.find(filePath, '.anim', roots=[self.sidecarDirectory])
+
+    def isApplicable(self, filePath):
+        """
+        Evaluates if this task would do anything to the supplied file before it is opened.
+
+        :type filePath: str
+        :rtype: Union[bool, None]
+        """
+
+        return self.getAnimationPath(filePath) is not None
+
     def doIt(self, *args, **kwargs):
         """
         Executes this task.
@@ -93,22 +173,18 @@ class ImportAnimationTask(abstracttask.AbstractTask):
 
         # Check if file exists
         #
-        filePath = os.path.join(self.taskManager.currentDirectory, f'{self.taskManager.currentName}.anim')
+        filePath = self.getAnimationPath(self.taskManager.currentFilePath)
 
-        if not os.path.isfile(filePath):
+        if filePath is None:
 
-            log.warning(f'Cannot locate animation file: {filePath}')
+            log.warning(f'Cannot locate animation file for: {self.taskManager.currentFilePath}')
             return
 
-        # Update namespace and configuration
-        #
-        qezposer.QEzPoser.setCurrentConfiguration(self.rigConfiguration)
-        qezposer.QEzPoser.setCurrentNamespace(self.namespace)
-
         # Apply animation to controls
         #
-        nodes = list(qezposer.QEzPoser.iterControls(visible=False))
+        nodes = poserutils.getControls(self.rigConfiguration, self.namespace)
 
         pose = poseutils.importPose(filePath)
         pose.applyAnimationTo(*nodes, namespace=self.namespace)
+        self.markDirty()
     # endregion
@@ -1,3 +1,5 @@
+import re
+
 from maya import cmds as mc
 from ..abstract import abstracttask
 
@@ -15,6 +17,8 @@ class RenameNamespaceTask(abstracttask.AbstractTask):
     # region Dunderscores
     __slots__ = ('_search', '_replace')
     __title__ = 'Rename Namespace'
+    __tracksChanges__ = True
+    __contentOnly__ = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -79,6 +83,35 @@ class RenameNamespaceTask(abstracttask.AbstractTask):
     # endregion
 
     # region Methods
+    def canDoItAsText(self, scene):
+        """
+        Evaluates if this task can be executed on the supplied ASCII scene without opening it.
+        Only namespaces that belong to top-level references can be renamed as text.
+
+        :type scene: ezbatcher.libs.asciiscene.AsciiScene
+        :rtype: bool
+        """
+
+        namespaces = scene.namespaces()
+        return self.search in namespaces and self.replace not in namespaces
+
+    def doItAsText(self, scene, *args, **kwargs):
+        """
+        Executes this task on the supplied ASCII scene.
+        This renames any node paths, namespace flags and reference nodes that use the namespace.
+
+        :type scene: ezbatcher.libs.asciiscene.AsciiScene
+        :rtype: None
+        """
+
+        log.info(f'Renaming namespace: "{self.search}" > "{self.replace}"')
+
+        search = re.escape(self.search)
+        pattern = rf'(?<![\w:]){search}(?=:|RN\b)|(?<=-ns "){search}(?=")'
+
+        scene.addSubstitution(pattern, self.replace, hint=self.search)
+        self.markDirty()
+
     def doIt(self, *args, **kwargs):
         """
         Executes this task.
@@ -108,6 +141,7 @@ class RenameNamespaceTask(abstracttask.AbstractTask):
         #
         log.info(f'Renaming namespace: "{self.search}" > "{self.replace}"')
         mc.namespace(rename=(self.search, self.replace))
+        self.markDirty()
 
         oldName = f'{self.search}RN'
         newName = f'{self.replace}RN'
@@ -19,6 +19,8 @@ class RepairAnimationTask(abstracttask.AbstractTask):
     # region Dunderscores
     __slots__ = ('_renameNodeMap', '_renamePlugMap')
     __title__ = 'Repair Animation'
+    __contentOnly__ = True
+    __references__ = ('*',)
 
     def __init__(self, *args, **kwargs):
         """
@@ -0,0 +1,175 @@
+import os
+
+from maya import cmds as mc
+from ..abstract import abstracttask
+from ...libs import referenceutils, sceneheader
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class RepathReferencesTask(abstracttask.AbstractTask):
+    """
+    Overload of `AbstractTask` that updates the file paths of any scene references.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_search', '_replace')
+    __title__ = 'Repath References'
+    __tracksChanges__ = True
+    __contentOnly__ = True
+
+    def __init__(self, *args, **kwargs):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(RepathReferencesTask, self).__init__(*args, **kwargs)
+
+        # Declare private variables
+        #
+        self._search = kwargs.get('search', '')
+        self._replace = kwargs.get('replace', '')
+    # endregion
+
+    # region Properties
+    @property
+    def search(self):
+        """
+        Getter method that returns the search string.
+
+        :rtype: str
+        """
+
+        return self._search
+
+    @search.setter
+    def search(self, search):
+        """
+        Setter method that updates the search string.
+
+        :type search: str
+        :rtype: None
+        """
+
+        self._search = search
+
+    @property
+    def replace(self):
+        """
+        Getter method that returns the replacement string.
+
+        :rtype: str
+        """
+
+        return self._replace
+
+    @replace.setter
+    def replace(self, replace):
+        """
+        Setter method that updates the replacement string.
+
+        :type replace: str
+        :rtype: None
+        """
+
+        self._replace = replace
+    # endregion
+
+    # region Methods
+    def repath(self, path):
+        """
+        Returns the updated version of the supplied reference path.
+
+        :type path: str
+        :rtype: str
+        """
+
+        if len(self.search) == 0:
+
+            return path
+
+        return path.replace(self.search, self.replace)
+
+    def isApplicable(self, filePath):
+        """
+        Evaluates if this task would do anything to the supplied file before it is opened.
+        Only Maya ASCII headers can be read reliably so any other files are assumed to apply.
+        Nested references are repathed as well so their `-rdi` statements are checked alongside the top-level references.
+
+        :type filePath: str
+        :rtype: Union[bool, None]
+        """
+
+        if os.path.splitext(filePath)[-1].lower() != '.ma':
+
+            return True
+
+        return any(self.repath(path) != path for path in sceneheader.iterAsciiReferencePaths(filePath, nested=True))
+
+    def canDoItAsText(self, scene):
+        """
+        Evaluates if this task can be executed on the supplied ASCII scene without opening it.
+
+        :type scene: ezbatcher.libs.asciiscene.AsciiScene
+        :rtype: bool
+        """
+
+        return True
+
+    def doItAsText(self, scene, *args, **kwargs):
+        """
+        Executes this task on the supplied ASCII scene.
+
+        :type scene: ezbatcher.libs.asciiscene.AsciiScene
+        :rtype: None
+        """
+
+        for (i, args) in list(scene.iterReferenceStatements()):
+
+            path = args[-1]
+            newPath = self.repath(path)
+
+            if newPath != path:
+
+                log.info(f'Repathing reference: "{path}" > "{newPath}"')
+                scene.setReferencePath(i, newPath)
+                self.markDirty()
+
+    def doIt(self, *args, **kwargs):
+        """
+        Executes this task.
+
+        :rtype: None
+        """
+
+        for referenceNode in list(referenceutils.iterReferenceNodes()):
+
+            # Check if reference requires repathing
+            #
+            path = mc.referenceQuery(referenceNode, filename=True, unresolvedName=True, withoutCopyNumber=True)
+            newPath = self.repath(path)
+
+            if newPath == path:
+
+                continue
+
+            # Update reference path while preserving its load state
+            #
+            log.info(f'Repathing reference: "{path}" > "{newPath}"')
+
+            isLoaded = referenceutils.isReferenceLoaded(referenceNode)
+            mc.file(newPath, loadReference=referenceNode)
+
+            if not isLoaded:
+
+                mc.file(unloadReference=referenceNode)
+
+            self.markDirty()
+    # endregion
@@ -5,6 +5,7 @@ from maya.api import OpenMaya as om
 from dcc.python import stringutils
 from dcc.ui import qfileedit
 from ..abstract import abstracttask
+from ...libs import referenceutils
 
 import logging
 logging.basicConfig()
@@ -20,6 +21,8 @@ class ToggleReferenceTask(abstracttask.AbstractTask):
     # region Dunderscores
     __slots__ = ('_name', '_load', '_unload')
     __title__ = 'Toggle Reference'
+    __tracksChanges__ = True
+    __contentOnly__ = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -43,7 +46,7 @@ class ToggleReferenceTask(abstracttask.AbstractTask):
     @property
     def name(self):
         """
-        Getter method that returns the target reference node.
+        Getter method that returns the target reference node or pattern.
 
         :rtype: str
         """
@@ -53,7 +56,7 @@ class ToggleReferenceTask(abstracttask.AbstractTask):
     @name.setter
     def name(self, name):
         """
-        Setter method that updates the target reference node.
+        Setter method that updates the target reference node or pattern.
 
         :type filePath: str
         :rtype: None
@@ -108,26 +111,36 @@ class ToggleReferenceTask(abstracttask.AbstractTask):
     def doIt(self, *args, **kwargs):
         """
         Executes this task.
+        The reference name can also be a pattern in order to toggle multiple references in bulk.
 
         :rtype: None
         """
 
-        # Check if reference node exists
+        # Check if any reference nodes match
         #
-        if not mc.objExists(self.name):
+        referenceNodes = list(referenceutils.iterReferenceNodesByPattern(self.name))
+
+        if stringutils.isNullOrEmpty(referenceNodes):
 
             log.warning(f'Cannot locate "{self.name}" reference node!')
             return
 
         # Evaluate requested load state
+        # Matching references are marked as touched so their state survives a deferred save!
         #
-        filePath = mc.referenceQuery(self.name, filename=True)
+        self.taskManager.markReferencesTouched(*referenceNodes)
+
+        toggled = []
 
         if self.load:
 
-            mc.file(filePath, loadReference=self.name)
+            toggled.extend(referenceutils.loadReferences(self.name))
 
         if self.unload:
 
-            mc.file(filePath, unloadReference=self.name)
+            toggled.extend(referenceutils.unloadReferences(self.name))
+
+        if len(toggled) > 0:
+
+            self.markDirty()
     # endregion
@@ -26,6 +26,7 @@ class TransferAnimationTask(abstracttask.AbstractTask):
         '_targetDirectory'
     )
     __title__ = 'Transfer Animation'
+    __contentOnly__ = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -155,6 +156,15 @@ class TransferAnimationTask(abstracttask.AbstractTask):
     # endregion
 
     # region Methods
+    def requiredReferences(self):
+        """
+        Returns the reference patterns this task requires to be loaded.
+
+        :rtype: List[str]
+        """
+
+        return [self.sourceNamespace]
+
     @classmethod
     def createEditor(cls, name, parent=None):
         """
@@ -177,6 +187,16 @@ class TransferAnimationTask(abstracttask.AbstractTask):
 
             return super(TransferAnimationTask, cls).createEditor(name, parent=parent)
 
+    def outputPaths(self, filePath):
+        """
+        Returns the paths this task writes to when executed on the supplied file.
+
+        :type filePath: str
+        :rtype: List[str]
+        """
+
+        return [os.path.join(self.targetDirectory, os.path.basename(filePath))]
+
     def doIt(self, *args, **kwargs):
         """
         Executes this task.
@@ -10,14 +10,27 @@ log.setLevel(logging.INFO)
 class UnloadTurtlePluginTask(abstracttask.AbstractTask):
     """
     Overload of `AbstractTask` that unloads the turtle plugin from the open scene file.
+    Scenes that require the plugin will load it again when opened, so this task is executed on every file.
     """
 
     # region Dunderscores
     __slots__ = ()
     __title__ = 'Unload Turtle Plugin'
+    __contentOnly__ = True
     # endregion
 
     # region Methods
+    def isApplicable(self, filePath):
+        """
+        Evaluates if this task would do anything to the supplied file before it is opened.
+        Unloading a plugin is no reason to open a file on its own.
+
+        :type filePath: str
+        :rtype: Union[bool, None]
+        """
+
+        return None
+
     def doIt(self, *args, **kwargs):
         """
         Executes this task.
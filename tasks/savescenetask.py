@@ -1,10 +1,12 @@
 import os
 import stat
+import uuid
 
 from dcc import fnscene
 from dcc.python import stringutils
 from dcc.ui import qdirectoryedit
 from .abstract import abstracttask
+from ..libs import sceneutils
 
 import logging
 logging.basicConfig()
@@ -18,8 +20,10 @@ class SaveSceneTask(abstracttask.AbstractTask):
     """
 
     # region Dunderscores
-    __slots__ = ('_filename', '_directory', '_search', '_replace', '_extension')
+    __slots__ = ('_filename', '_directory', '_search', '_replace', '_extension', '_skipUnchanged', '_stagingDirectory')
     __title__ = 'Save Scene'
+    __tracksChanges__ = True
+    __contentOnly__ = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -39,6 +43,8 @@ class SaveSceneTask(abstracttask.AbstractTask):
         self._search = kwargs.get('search', '')
         self._replace = kwargs.get('replace', '')
         self._extension = kwargs.get('extension', self.scene.FileExtensions(0))
+        self._skipUnchanged = kwargs.get('skipUnchanged', True)
+        self._stagingDirectory = kwargs.get('stagingDirectory', '')
     # endregion
 
     # region Properties
@@ -146,6 +152,50 @@ class SaveSceneTask(abstracttask.AbstractTask):
         """
 
         self._extension = self.scene.FileExtensions(extension)
+
+    @property
+    def skipUnchanged(self):
+        """
+        Getter method that returns the `skipUnchanged` flag.
+        When enabled, unmodified files are not saved over themselves.
+
+        :rtype: bool
+        """
+
+        return self._skipUnchanged
+
+    @skipUnchanged.setter
+    def skipUnchanged(self, skipUnchanged):
+        """
+        Setter method that updates the `skipUnchanged` flag.
+
+        :type skipUnchanged: bool
+        :rtype: None
+        """
+
+        self._skipUnchanged = skipUnchanged
+
+    @property
+    def stagingDirectory(self):
+        """
+        Getter method that returns the local directory to stage saves in.
+        When supplied, scenes are saved locally and uploaded to their destination in the background.
+
+        :rtype: str
+        """
+
+        return self._stagingDirectory
+
+    @stagingDirectory.setter
+    def stagingDirectory(self, stagingDirectory):
+        """
+        Setter method that updates the local directory to stage saves in.
+
+        :type stagingDirectory: str
+        :rtype: None
+        """
+
+        self._stagingDirectory = stagingDirectory
     # endregion
 
     # region Methods
@@ -159,7 +209,7 @@ class SaveSceneTask(abstracttask.AbstractTask):
         :rtype: Union[QtWidgets.QWidget, None]
         """
 
-        if name == 'directory':
+        if name in ('directory', 'stagingDirectory'):
 
             return qdirectoryedit.QDirectoryEdit(parent=parent)
 
@@ -167,11 +217,12 @@ class SaveSceneTask(abstracttask.AbstractTask):
 
             return super(SaveSceneTask, cls).createEditor(name, parent=parent)
 
-    def doIt(self, *args, **kwargs):
+    def getSavePath(self, currentPath):
         """
-        Executes this task.
+        Returns the path to save the supplied scene file to.
 
-        :rtype: None
+        :type currentPath: str
+        :rtype: str
         """
 
         # Check if a directory was supplied
@@ -185,7 +236,7 @@ class SaveSceneTask(abstracttask.AbstractTask):
 
         else:
 
-            directory = self.scene.currentDirectory()
+            directory = os.path.dirname(currentPath)
 
         # Check if a filename was supplied
         # Again, if not, then use the current file's name
@@ -199,7 +250,7 @@ class SaveSceneTask(abstracttask.AbstractTask):
 
         else:
 
-            filename = self.scene.currentFilename()
+            filename = os.path.basename(currentPath)
 
         # Check if a search and replace is required
         #
@@ -207,27 +258,136 @@ class SaveSceneTask(abstracttask.AbstractTask):
 
             filename = filename.replace(self.search, self.replace)
 
+        return os.path.join(directory, filename)
+
+    def isSkippable(self, filePath):
+        """
+        Evaluates if saving to the supplied path can be skipped.
+        Only unmodified files being saved over themselves can be skipped!
+
+        :type filePath: str
+        :rtype: bool
+        """
+
+        isSameFile = os.path.normcase(os.path.abspath(filePath)) == os.path.normcase(self.taskManager.currentFilePath)
+
+        return self.skipUnchanged and isSameFile and not self.taskManager.isDirty()
+
+    def outputPaths(self, filePath):
+        """
+        Returns the paths this task writes to when executed on the supplied file.
+
+        :type filePath: str
+        :rtype: List[str]
+        """
+
+        return [self.getSavePath(filePath)]
+
+    def isApplicable(self, filePath):
+        """
+        Evaluates if this task would do anything to the supplied file before it is opened.
+        Unchanged files saved over themselves are skipped, so this task alone is no reason to open them.
+
+        :type filePath: str
+        :rtype: Union[bool, None]
+        """
+
+        savePath = self.getSavePath(filePath)
+        isSameFile = os.path.normcase(os.path.abspath(savePath)) == os.path.normcase(os.path.abspath(filePath))
+
+        return None if (self.skipUnchanged and isSameFile) else True
+
+    def canDoItAsText(self, scene):
+        """
+        Evaluates if this task can be executed on the supplied ASCII scene without opening it.
+        Text saves are only possible when the file is saved as another Maya ASCII file.
+
+        :type scene: ezbatcher.libs.asciiscene.AsciiScene
+        :rtype: bool
+        """
+
+        filePath = self.getSavePath(scene.filePath)
+        return os.path.splitext(filePath)[-1].lower() == '.ma'
+
+    def doItAsText(self, scene, *args, **kwargs):
+        """
+        Executes this task on the supplied ASCII scene.
+        Text saves are written straight to their destination since they never hold a DCC session open.
+
+        :type scene: ezbatcher.libs.asciiscene.AsciiScene
+        :rtype: None
+        """
+
+        filePath = self.getSavePath(scene.filePath)
+
+        if self.isSkippable(filePath):
+
+            log.info(f'Skipping unchanged file: {filePath}')
+            return
+
+        log.info(f'Saving changes to: {filePath}')
+
+        with self.taskManager.span('save', 'io', filePath=filePath):
+
+            scene.save(filePath)
+
+    def doIt(self, *args, **kwargs):
+        """
+        Executes this task.
+
+        :rtype: None
+        """
+
+        # Resolve the real location of the open scene
+        # This accounts for any scenes that were opened or saved from a local copy
+        #
+        currentPath = self.taskManager.resolveAlias(os.path.join(self.scene.currentDirectory(), self.scene.currentFilename()))
+        filePath = self.getSavePath(currentPath)
+
+        # Check if save can be skipped
+        #
+        if self.isSkippable(filePath):
+
+            log.info(f'Skipping unchanged file: {filePath}')
+            return
+
         # Save scene to specified path
         #
-        filePath = os.path.join(directory, filename)
         log.info(f'Saving changes to: {filePath}')
+        self.taskManager.restoreReferences()
 
-        if os.path.exists(filePath):
+        with self.taskManager.span('save', 'io', filePath=filePath):
 
-            # Check if file is read-only
-            #
-            isWritable = os.access(filePath, os.W_OK)
+            if not stringutils.isNullOrEmpty(self.stagingDirectory):
 
-            if not isWritable:
+                # Save to unique staging directory and upload in the background
+                #
+                stagedPath = os.path.join(os.path.abspath(os.path.expandvars(self.stagingDirectory)), uuid.uuid4().hex, os.path.basename(filePath))
 
-                os.chmod(filePath, stat.S_IWRITE)
+                self.scene.ensureDirectory(stagedPath)
+                self.scene.saveAs(stagedPath)
 
-            self.scene.saveAs(filePath)
+                self.taskManager.addAlias(stagedPath, filePath)
+                self.taskManager.uploads.submit(stagedPath, filePath)
 
-        else:
+                sceneutils.renameScene(filePath)
+
+            elif os.path.exists(filePath):
+
+                # Check if file is read-only
+                #
+                isWritable = os.access(filePath, os.W_OK)
+
+                if not isWritable:
+
+                    os.chmod(filePath, stat.S_IWRITE)
+
+                self.scene.saveAs(filePath)
+
+            else:
 
-            # Ensure directories exist and save file
-            #
-            self.scene.ensureDirectory(filePath)
-            self.scene.saveAs(filePath)
+                # Ensure directories exist and save file
+                #
+                self.scene.ensureDirectory(filePath)
+                self.scene.saveAs(filePath)
     # endregion
@@ -0,0 +1,61 @@
+import os
+import sys
+import pytest
+import importlib.util
+
+
+# The repository root is the `ezbatcher` package itself
+# Register it under its package name so the tests run regardless of the checkout's directory name!
+#
+if 'ezbatcher' not in sys.modules:
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    spec = importlib.util.spec_from_file_location('ezbatcher', os.path.join(root, '__init__.py'), submodule_search_locations=[root])
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['ezbatcher'] = module
+
+    spec.loader.exec_module(module)
+
+
+@pytest.fixture
+def writeScene(tmp_path):
+    """
+    Returns a function that writes a minimal Maya ASCII scene under the temporary directory.
+    References are supplied as namespace and path pairs.
+
+    :type tmp_path: pathlib.Path
+    :rtype: Callable
+    """
+
+    def write(relativePath, references=(), fileInfo=None, frameRange=None):
+
+        lines = ['//Maya ASCII 2022 scene\n', f'//Name: {os.path.basename(relativePath)}\n']
+
+        for (namespace, path) in references:
+
+            lines.append(f'file -r -ns "{namespace}" -dr 1 -rfn "{namespace}RN" -typ "mayaAscii" "{path}";\n')
+
+        lines.append('requires maya "2022";\n')
+
+        for (key, value) in (fileInfo or {}).items():
+
+            escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+            lines.append(f'fileInfo "{key}" "{escaped}";\n')
+
+        lines.append('createNode transform -n "root";\n\tsetAttr ".t" -type "double3" 0 1 0 ;\n')
+
+        if frameRange is not None:
+
+            lines.append('createNode script -n "sceneConfigurationScriptNode";\n')
+            lines.append(f'\tsetAttr ".b" -type "string" "playbackOptions -min {frameRange[0]} -max {frameRange[1]} -ast {frameRange[0]} -aet {frameRange[1]} ";\n')
+
+        lines.append('// End of scene\n')
+
+        filePath = tmp_path / relativePath
+        filePath.parent.mkdir(parents=True, exist_ok=True)
+        filePath.write_text(''.join(lines), encoding='utf-8')
+
+        return str(filePath)
+
+    return write
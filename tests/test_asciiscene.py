@@ -0,0 +1,129 @@
+from ezbatcher.libs import asciiscene
+
+
+SCENE = (
+    b'//Maya ASCII 2022 scene\n'
+    b'//Name: shot01.ma\n'
+    b'//Codeset: UTF-8\n'
+    b'file -rdi 1 -ns "hero" -rfn "heroRN" -typ "mayaAscii" "D:/rigs/hero.ma";\n'
+    b'file -r -ns "hero" -dr 1 -rfn "heroRN" -typ "mayaAscii" "D:/rigs/hero.ma";\n'
+    b'requires maya "2022";\n'
+    b'fileInfo "application" "maya";\n'
+    b'fileInfo "notes" "semicolons; \\"quotes\\" and\\nline breaks";\n'
+    b'createNode transform -n "root";\n'
+    b'\trename -uid "0A1B2C3D";\n'
+    b'\tsetAttr ".t" -type "double3" 0 1 0 ;\n'
+    b'createNode script -n "uiConfigurationScriptNode";\n'
+    b'\tsetAttr ".b" -type "string" (\n'
+    b'\t\t"// Multi-line string;\\n"\n'
+    b'\t\t+ "print \\"hello;\\";\\n");\n'
+    b'connectAttr "hero:root.t" "root.t";\n'
+    b'// End of shot01.ma\n'
+)
+
+
+def writeBytes(tmp_path, contents, name='shot01.ma'):
+    """
+    Writes the supplied bytes to a scene file and returns its path.
+
+    :type tmp_path: pathlib.Path
+    :type contents: bytes
+    :type name: str
+    :rtype: str
+    """
+
+    filePath = tmp_path / name
+    filePath.write_bytes(contents)
+
+    return str(filePath)
+
+
+def test_save_round_trips_byte_for_byte(tmp_path):
+
+    filePath = writeBytes(tmp_path, SCENE)
+    savePath = str(tmp_path / 'copy.ma')
+
+    asciiscene.AsciiScene(filePath).save(savePath)
+
+    with open(savePath, 'rb') as file:
+
+        assert file.read() == SCENE
+
+
+def test_save_preserves_crlf_and_undecodable_bytes(tmp_path):
+
+    contents = SCENE.replace(b'\n', b'\r\n').replace(b'//Codeset: UTF-8', b'//Codeset: \xff\xfe')
+    filePath = writeBytes(tmp_path, contents)
+
+    asciiscene.AsciiScene(filePath).save()
+
+    with open(filePath, 'rb') as file:
+
+        assert file.read() == contents
+
+
+def test_save_round_trips_missing_trailing_newline(tmp_path):
+
+    contents = SCENE.rstrip(b'\n')
+    filePath = writeBytes(tmp_path, contents)
+
+    asciiscene.AsciiScene(filePath).save()
+
+    with open(filePath, 'rb') as file:
+
+        assert file.read() == contents
+
+
+def test_header_stops_at_first_create_node(tmp_path):
+
+    scene = asciiscene.AsciiScene(writeBytes(tmp_path, SCENE))
+
+    assert all(asciiscene.getCommand(statement) != 'createNode' for statement in scene.header)
+    assert scene.getFileInfo('notes') == 'semicolons; "quotes" and\nline breaks'
+    assert scene.namespaces() == ['hero']
+
+
+def test_set_reference_path_only_edits_path(tmp_path):
+
+    scene = asciiscene.AsciiScene(writeBytes(tmp_path, SCENE))
+
+    for (i, args) in list(scene.iterReferenceStatements()):
+
+        scene.setReferencePath(i, 'E:/rigs/hero.ma')
+
+    scene.save()
+
+    with open(scene.filePath, 'rb') as file:
+
+        assert file.read() == SCENE.replace(b'D:/rigs/hero.ma', b'E:/rigs/hero.ma')
+
+
+def test_set_file_info_updates_and_inserts(tmp_path):
+
+    scene = asciiscene.AsciiScene(writeBytes(tmp_path, SCENE))
+    scene.setFileInfo('application', 'mayapy')
+    scene.setFileInfo('batch', 'ezbatcher')
+    scene.save()
+
+    expected = SCENE.replace(
+        b'fileInfo "application" "maya";\n',
+        b'fileInfo "application" "mayapy";\n'
+    ).replace(
+        b'line breaks";\n',
+        b'line breaks";\nfileInfo "batch" "ezbatcher";\n'
+    )
+
+    with open(scene.filePath, 'rb') as file:
+
+        assert file.read() == expected
+
+
+def test_substitutions_apply_to_body_statements(tmp_path):
+
+    scene = asciiscene.AsciiScene(writeBytes(tmp_path, SCENE))
+    scene.addSubstitution(r'"hero:', '"villain:', hint='hero:')
+    scene.save()
+
+    with open(scene.filePath, 'rb') as file:
+
+        assert file.read() == SCENE.replace(b'"hero:root.t"', b'"villain:root.t"')
@@ -0,0 +1,69 @@
+import pytest
+
+from ezbatcher.libs import dependencygraph, sceneindex
+
+
+@pytest.fixture
+def graph(tmp_path):
+    """
+    Returns a dependency graph stored inside the temporary directory.
+
+    :type tmp_path: pathlib.Path
+    :rtype: dependencygraph.DependencyGraph
+    """
+
+    index = sceneindex.SceneIndex(str(tmp_path / 'scenes.db'))
+    yield dependencygraph.DependencyGraph(index)
+    index.close()
+
+
+@pytest.fixture
+def project(tmp_path, writeScene):
+    """
+    Writes a project where a shot references a set, which in turn references a rig.
+
+    :type tmp_path: pathlib.Path
+    :rtype: Dict[str, str]
+    """
+
+    return {
+        'rig': writeScene('rigs/hero_rig.ma'),
+        'set': writeScene('sets/forest.ma', references=[('hero', '../rigs/hero_rig.ma')]),
+        'shot': writeScene('animations/shot01.ma', references=[('forest', '../sets/forest.ma')]),
+        'other': writeScene('animations/shot02.ma')
+    }
+
+
+def test_affected_scenes_include_nested_references(tmp_path, graph, project):
+
+    graph.index.crawl(str(tmp_path))
+
+    affected = graph.affectedScenes(project['rig'])
+
+    assert affected == {sceneindex.normalizePath(project['set']), sceneindex.normalizePath(project['shot'])}
+    assert graph.affectedScenes(project['other']) == set()
+
+
+def test_minimal_queue_is_limited_to_root(tmp_path, graph, project):
+
+    graph.index.crawl(str(tmp_path))
+
+    assert graph.minimalQueue(project['rig'], root=str(tmp_path / 'animations')) == [sceneindex.normalizePath(project['shot'])]
+    assert graph.minimalQueue(project['rig'], root=str(tmp_path / 'anim')) == []
+
+
+def test_record_scene_updates_references(tmp_path, graph, project):
+
+    graph.index.crawl(str(tmp_path))
+    graph.recordScene(project['other'], referencePaths=['../rigs/hero_rig.ma'])
+
+    assert sceneindex.normalizePath(project['other']) in graph.affectedScenes(project['rig'])
+    assert list(graph.iterReferences(project['other'])) == [sceneindex.normalizePath(project['rig'])]
+
+
+def test_main_prints_minimal_queue(tmp_path, graph, project, capsys):
+
+    graph.index.crawl(str(tmp_path))
+
+    assert dependencygraph.main([graph.index.databasePath, project['rig'], '--root', str(tmp_path / 'animations')]) == 0
+    assert capsys.readouterr().out == f'{sceneindex.normalizePath(project["shot"])}\n'
@@ -0,0 +1,79 @@
+import os
+import time
+import pytest
+
+pytest.importorskip('dcc.json.jsonutils')
+
+from ezbatcher.libs import fbxmanifest
+
+
+def test_save_merges_changes_from_other_writers(tmp_path):
+
+    first, second = fbxmanifest.FbxManifests(), fbxmanifest.FbxManifests()
+    exportPaths = [str(tmp_path / f'shot{i:02d}.fbx') for i in range(3)]
+
+    # Load both manifests before either writes
+    #
+    first.getManifest(exportPaths[0])
+    second.getManifest(exportPaths[0])
+
+    first.setFingerprint(exportPaths[0], 'a')
+    second.setFingerprint(exportPaths[1], 'b')
+    second.setFingerprint(exportPaths[2], 'c')
+
+    first.save()
+    second.save()
+
+    manifestPath = fbxmanifest.getManifestPath(exportPaths[0])
+    assert fbxmanifest.loadManifest(manifestPath) == {'shot00.fbx': 'a', 'shot01.fbx': 'b', 'shot02.fbx': 'c'}
+    assert not os.path.exists(f'{manifestPath}.lock')
+
+
+def test_save_removes_cleared_fingerprints(tmp_path):
+
+    exportPath = str(tmp_path / 'shot00.fbx')
+    manifestPath = fbxmanifest.getManifestPath(exportPath)
+
+    fbxmanifest.saveManifest(manifestPath, {'shot00.fbx': 'a', 'shot01.fbx': 'b'})
+
+    manifests = fbxmanifest.FbxManifests()
+    manifests.setFingerprint(exportPath, None)
+    manifests.save()
+
+    assert fbxmanifest.loadManifest(manifestPath) == {'shot01.fbx': 'b'}
+
+
+def test_is_up_to_date_requires_export_and_matching_fingerprint(tmp_path):
+
+    exportPath = tmp_path / 'shot00.fbx'
+
+    manifests = fbxmanifest.FbxManifests()
+    manifests.setFingerprint(str(exportPath), 'a')
+
+    assert not manifests.isUpToDate(str(exportPath), 'a')
+
+    exportPath.write_bytes(b'fbx')
+
+    assert manifests.isUpToDate(str(exportPath), 'a')
+    assert not manifests.isUpToDate(str(exportPath), 'b')
+
+
+def test_stale_lock_is_broken(tmp_path):
+
+    exportPath = str(tmp_path / 'shot00.fbx')
+    manifestPath = fbxmanifest.getManifestPath(exportPath)
+    lockPath = f'{manifestPath}.lock'
+
+    with open(lockPath, 'w') as file:
+
+        file.write('0')
+
+    staleTime = time.time() - (fbxmanifest.LOCK_TIMEOUT + 1.0)
+    os.utime(lockPath, (staleTime, staleTime))
+
+    manifests = fbxmanifest.FbxManifests()
+    manifests.setFingerprint(exportPath, 'a')
+    manifests.save()
+
+    assert fbxmanifest.loadManifest(manifestPath) == {'shot00.fbx': 'a'}
+    assert not os.path.exists(lockPath)
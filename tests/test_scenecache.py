@@ -0,0 +1,99 @@
+import os
+
+from ezbatcher.libs import scenecache
+
+
+def writeSource(tmp_path, name, size):
+    """
+    Writes a source file of the supplied size and returns its path.
+
+    :type tmp_path: pathlib.Path
+    :type name: str
+    :type size: int
+    :rtype: str
+    """
+
+    filePath = tmp_path / 'share' / name
+    filePath.parent.mkdir(parents=True, exist_ok=True)
+    filePath.write_bytes(name.encode('utf-8').ljust(size, b'.'))
+
+    return str(filePath)
+
+
+def test_fetch_reuses_valid_copies(tmp_path):
+
+    filePath = writeSource(tmp_path, 'shot01.ma', 16)
+    cache = scenecache.SceneCache(str(tmp_path / 'cache'), cacheSize=1024)
+
+    localPath = cache.fetch(filePath)
+    os.remove(localPath)
+
+    assert not cache.isValid(filePath)
+    assert cache.fetch(filePath) == localPath
+
+    assert cache.isValid(filePath)
+    assert cache.fetch(filePath) == localPath
+
+
+def test_fetch_recopies_changed_sources(tmp_path):
+
+    filePath = writeSource(tmp_path, 'shot01.ma', 16)
+    cache = scenecache.SceneCache(str(tmp_path / 'cache'), cacheSize=1024)
+
+    localPath = cache.fetch(filePath)
+
+    with open(filePath, 'ab') as file:
+
+        file.write(b'changed')
+
+    assert not cache.isValid(filePath)
+    assert cache.fetch(filePath) == localPath
+
+    with open(localPath, 'rb') as file:
+
+        assert file.read().endswith(b'changed')
+
+
+def test_least_recently_used_unpinned_copies_are_evicted(tmp_path):
+
+    first, second, third = [writeSource(tmp_path, f'shot{i:02d}.ma', 40) for i in range(3)]
+    cache = scenecache.SceneCache(str(tmp_path / 'cache'), cacheSize=100)
+
+    cache.fetch(first)
+    cache.fetch(second)
+    cache.fetch(first)
+    cache.fetch(third)
+
+    assert cache.isValid(first)
+    assert not cache.isValid(second)
+    assert cache.isValid(third)
+
+    cache.pin(first)
+    cache.fetch(second)
+
+    assert cache.isValid(first)
+    assert not cache.isValid(third)
+    assert cache.usedBytes() <= cache.cacheSize
+
+
+def test_files_larger_than_cache_are_not_copied(tmp_path):
+
+    filePath = writeSource(tmp_path, 'shot01.ma', 200)
+    cache = scenecache.SceneCache(str(tmp_path / 'cache'), cacheSize=100)
+
+    assert cache.fetch(filePath) == filePath
+    assert cache.usedBytes() == 0
+
+
+def test_index_persists_between_instances(tmp_path):
+
+    filePath = writeSource(tmp_path, 'shot01.ma', 16)
+    cache = scenecache.SceneCache(str(tmp_path / 'cache'), cacheSize=1024)
+
+    localPath = cache.fetch(filePath)
+    cache.save()
+
+    cache = scenecache.SceneCache(str(tmp_path / 'cache'), cacheSize=1024)
+
+    assert cache.isValid(filePath)
+    assert cache.fetch(filePath) == localPath
@@ -0,0 +1,64 @@
+import os
+
+from ezbatcher.libs import scenededupe
+
+
+def writeFiles(tmp_path, *contents):
+    """
+    Writes a file for each of the supplied contents and returns their paths.
+
+    :type tmp_path: pathlib.Path
+    :type contents: Union[bytes, List[bytes]]
+    :rtype: List[str]
+    """
+
+    filePaths = []
+
+    for (i, content) in enumerate(contents):
+
+        filePath = tmp_path / f'shot{i:02d}.ma'
+        filePath.write_bytes(content)
+
+        filePaths.append(str(filePath))
+
+    return filePaths
+
+
+def test_find_duplicates_groups_identical_contents(tmp_path):
+
+    filePaths = writeFiles(tmp_path, b'a' * 8, b'b' * 8, b'a' * 8, b'c' * 4, b'b' * 8, b'a' * 8)
+
+    assert scenededupe.findDuplicates(*filePaths) == {0: [2, 5], 1: [4]}
+
+
+def test_find_duplicates_ignores_same_size_with_different_contents(tmp_path):
+
+    filePaths = writeFiles(tmp_path, b'abcd', b'abce', b'abcf')
+
+    assert scenededupe.findDuplicates(*filePaths) == {}
+
+
+def test_find_duplicates_only_hashes_files_sharing_a_size(tmp_path, monkeypatch):
+
+    filePaths = writeFiles(tmp_path, b'a' * 8, b'b' * 4, b'a' * 8)
+    hashed = []
+
+    getContentHash = scenededupe.getContentHash
+
+    def recordHash(filePath):
+
+        hashed.append(filePath)
+        return getContentHash(filePath)
+
+    monkeypatch.setattr(scenededupe, 'getContentHash', recordHash)
+
+    assert scenededupe.findDuplicates(*filePaths) == {0: [2]}
+    assert sorted(hashed) == sorted([filePaths[0], filePaths[2]])
+
+
+def test_find_duplicates_skips_missing_files(tmp_path):
+
+    filePaths = writeFiles(tmp_path, b'a' * 8, b'a' * 8)
+    os.remove(filePaths[0])
+
+    assert scenededupe.findDuplicates(*filePaths, str(tmp_path / 'missing.ma')) == {}
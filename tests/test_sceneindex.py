@@ -0,0 +1,136 @@
+import os
+import json
+import pytest
+
+from ezbatcher.libs import sceneindex
+
+
+@pytest.fixture
+def index(tmp_path):
+    """
+    Returns a scene index stored inside the temporary directory.
+
+    :type tmp_path: pathlib.Path
+    :rtype: sceneindex.SceneIndex
+    """
+
+    index = sceneindex.SceneIndex(str(tmp_path / 'scenes.db'))
+    yield index
+    index.close()
+
+
+def getSequencers(*rangeCounts):
+    """
+    Returns a serialized `fbxSequencers` value with the supplied number of export ranges per sequencer.
+
+    :type rangeCounts: Union[int, List[int]]
+    :rtype: str
+    """
+
+    return json.dumps([{'exportRanges': [{'name': f'range{i}'} for i in range(rangeCount)]} for rangeCount in rangeCounts])
+
+
+def test_crawl_reads_scene_metadata(tmp_path, index, writeScene):
+
+    filePath = writeScene(
+        'animations/shot01.ma',
+        references=[('hero', '../rigs/hero.ma')],
+        fileInfo={'fbxSequencers': getSequencers(2, 3)},
+        frameRange=(1, 120)
+    )
+
+    assert index.crawl(str(tmp_path / 'animations')) == 1
+
+    path = sceneindex.normalizePath(filePath)
+    row = index.connection.execute('SELECT startTime, endTime, exportRangeCount FROM scenes WHERE path = ?', (path,)).fetchone()
+    references = index.connection.execute('SELECT path, namespace, deferred FROM sceneReferences WHERE scene = ?', (path,)).fetchall()
+
+    assert row == (1.0, 120.0, 5)
+    assert references == [(sceneindex.normalizePath(str(tmp_path / 'rigs' / 'hero.ma')), 'hero', 1)]
+
+
+def test_crawl_only_reads_changed_scenes(tmp_path, index, writeScene):
+
+    writeScene('animations/shot01.ma')
+    filePath = writeScene('animations/shot02.ma')
+
+    assert index.crawl(str(tmp_path / 'animations')) == 2
+    assert index.crawl(str(tmp_path / 'animations')) == 0
+
+    os.utime(filePath, (0.0, 0.0))
+
+    assert index.crawl(str(tmp_path / 'animations')) == 1
+
+
+def test_crawl_removes_deleted_scenes_by_exact_prefix(tmp_path, index, writeScene):
+
+    deletedPath = writeScene('shot_01/shot01.ma')
+    siblingPath = writeScene('shotA01/shotA01.ma')
+
+    index.crawl(str(tmp_path / 'shot_01'))
+    index.crawl(str(tmp_path / 'shotA01'))
+
+    os.remove(deletedPath)
+    index.crawl(str(tmp_path / 'shot_01'))
+
+    assert index.query() == [sceneindex.normalizePath(siblingPath)]
+
+
+def test_crawl_keeps_scenes_under_directories_that_failed_to_scan(tmp_path, index, writeScene, monkeypatch):
+
+    keptPath = writeScene('animations/seq01/shot01.ma')
+    otherPath = writeScene('animations/seq02/shot02.ma')
+
+    index.crawl(str(tmp_path / 'animations'))
+
+    # Simulate a network error while scanning the first sequence
+    #
+    failedDirectory = os.path.dirname(keptPath)
+    scandir = os.scandir
+
+    def failingScandir(path):
+
+        if os.path.normcase(path) == os.path.normcase(failedDirectory):
+
+            raise PermissionError(13, 'Permission denied', path)
+
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', failingScandir)
+    os.remove(otherPath)
+
+    index.crawl(str(tmp_path / 'animations'))
+
+    assert index.query() == [sceneindex.normalizePath(keptPath)]
+
+
+def test_query_filters(tmp_path, index, writeScene):
+
+    heroPath = writeScene(
+        'animations/shot01.ma',
+        references=[('hero', 'D:/rigs/hero_rig.ma')],
+        fileInfo={'fbxSequencers': getSequencers(12), 'approved': '1'}
+    )
+
+    villainPath = writeScene(
+        'animations/shot02.ma',
+        references=[('villain', 'D:/rigs/villain_rig.ma')],
+        fileInfo={'fbxSequencers': getSequencers(2)}
+    )
+
+    index.crawl(str(tmp_path / 'animations'))
+
+    assert index.query(reference='*hero_rig*') == [sceneindex.normalizePath(heroPath)]
+    assert index.query(namespace='vill*') == [sceneindex.normalizePath(villainPath)]
+    assert index.query(fileInfoKey='approved') == [sceneindex.normalizePath(heroPath)]
+    assert index.query(minExportRanges=10) == [sceneindex.normalizePath(heroPath)]
+    assert index.query(root=str(tmp_path / 'anim')) == []
+    assert len(index.query(root=str(tmp_path / 'animations'))) == 2
+
+
+def test_read_frame_range_is_bounded(tmp_path, writeScene):
+
+    filePath = writeScene('shot01.ma', frameRange=(10, 250))
+
+    assert sceneindex.readFrameRange(filePath) == (10.0, 250.0)
+    assert sceneindex.readFrameRange(filePath, scanSize=16) == (None, None)
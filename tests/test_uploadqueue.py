@@ -0,0 +1,89 @@
+import os
+
+from ezbatcher.libs import uploadqueue
+
+
+def stage(directory, name, contents=b'scene'):
+    """
+    Writes a staged file inside its own directory and returns its path.
+
+    :type directory: pathlib.Path
+    :type name: str
+    :type contents: bytes
+    :rtype: str
+    """
+
+    stagingDirectory = directory / 'staging' / name
+    stagingDirectory.mkdir(parents=True)
+
+    source = stagingDirectory / f'{name}.ma'
+    source.write_bytes(contents)
+
+    return str(source)
+
+
+def test_upload_moves_file_into_place(tmp_path):
+
+    source = stage(tmp_path, 'shot01', contents=b'contents')
+    destination = str(tmp_path / 'share' / 'shot01.ma')
+
+    uploads = uploadqueue.UploadQueue()
+    uploads.submit(source, destination)
+
+    assert uploads.join() == []
+
+    with open(destination, 'rb') as file:
+
+        assert file.read() == b'contents'
+
+    assert not os.path.exists(source)
+    assert not os.path.exists(os.path.dirname(source))
+
+
+def test_checksum_mismatch_is_reported_and_keeps_staged_file(tmp_path, monkeypatch):
+
+    source = stage(tmp_path, 'shot01')
+    destination = str(tmp_path / 'share' / 'shot01.ma')
+
+    monkeypatch.setattr(uploadqueue, 'getChecksum', lambda filePath: 'corrupt')
+
+    uploads = uploadqueue.UploadQueue()
+    uploads.submit(source, destination)
+
+    assert uploads.join() == [(source, destination)]
+    assert os.path.exists(source)
+    assert not os.path.exists(destination)
+    assert not os.path.exists(f'{destination}.uploading')
+
+
+def test_failures_are_only_reported_once(tmp_path, monkeypatch):
+
+    source = stage(tmp_path, 'shot01')
+    destination = str(tmp_path / 'share' / 'shot01.ma')
+
+    monkeypatch.setattr(uploadqueue, 'getChecksum', lambda filePath: 'corrupt')
+
+    uploads = uploadqueue.UploadQueue()
+    uploads.submit(source, destination)
+
+    assert len(uploads.join()) == 1
+    assert uploads.join() == []
+
+
+def test_failed_upload_does_not_block_later_uploads(tmp_path, monkeypatch):
+
+    failedSource = stage(tmp_path, 'shot01')
+    failedDestination = str(tmp_path / 'share' / 'shot01.ma')
+
+    source = stage(tmp_path, 'shot02')
+    destination = str(tmp_path / 'share' / 'shot02.ma')
+
+    checksum = uploadqueue.getChecksum
+    monkeypatch.setattr(uploadqueue, 'getChecksum', lambda filePath: 'corrupt' if 'shot01' in filePath else checksum(filePath))
+
+    uploads = uploadqueue.UploadQueue()
+    uploads.submit(failedSource, failedDestination)
+    uploads.submit(source, destination)
+
+    assert uploads.join() == [(failedSource, failedDestination)]
+    assert os.path.exists(destination)
@@ -338,6 +338,13 @@ class QEzBatcher(qsingletonwindow.QSingletonWindow):
         self.checkoutCheckBox.setFocusPolicy(QtCore.Qt.NoFocus)
         self.checkoutCheckBox.clicked.connect(self.on_checkoutCheckBox_clicked)
 
+        self.deferReferencesCheckBox = QtWidgets.QCheckBox('Defer References')
+        self.deferReferencesCheckBox.setObjectName('deferReferencesCheckBox')
+        self.deferReferencesCheckBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
+        self.deferReferencesCheckBox.setFixedHeight(24)
+        self.deferReferencesCheckBox.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.deferReferencesCheckBox.setToolTip('Opens scene files without references and only loads the references each task requires.')
+
         self.batchPushButton = QtWidgets.QPushButton('Batch')
         self.batchPushButton.setObjectName('batchPushButton')
         self.batchPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
@@ -352,6 +359,7 @@ class QEzBatcher(qsingletonwindow.QSingletonWindow):
         self.buttonsLayout.addWidget(self.removeTaskPushButton)
         self.buttonsLayout.addItem(self.horizontalSpacer)
         self.buttonsLayout.addWidget(self.checkoutCheckBox)
+        self.buttonsLayout.addWidget(self.deferReferencesCheckBox)
         self.buttonsLayout.addWidget(self.batchPushButton)
 
         self.taskLayout.addWidget(self.taskTreeView)
@@ -1007,6 +1015,7 @@ class QEzBatcher(qsingletonwindow.QSingletonWindow):
         self.taskManager.execute(
             *filePaths,
             checkout=self.checkoutCheckBox.isChecked(),
+            deferReferences=self.deferReferencesCheckBox.isChecked(),
             preCallback=self.updateProgressBar,
             postCallback=self.updateProgressBar
         )